@@ -0,0 +1,57 @@
+"""
+Measure the memory that is retained by phenopackets that are loaded with :class:`JsonDeserializer`.
+
+The script loads the same phenopacket JSON file several times, keeps all loaded phenopackets alive, and reports
+the memory allocated in the meantime (measured with `tracemalloc`) divided by the number of phenopackets.
+
+To compare two revisions, run the script on each of them, e.g.::
+
+    git checkout <revision>
+    python scripts/benchmark_phenopacket_memory.py
+
+By default, the retinoblastoma example phenopacket of the test suite is loaded 500 times.
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+
+from pyphetools.pp.parse.json import JsonDeserializer
+from pyphetools.pp.v202 import Phenopacket
+
+DEFAULT_PHENOPACKET = os.path.join(os.path.dirname(__file__), os.pardir, 'test', 'data', 'pp', 'retinoblastoma.json')
+
+
+def measure_bytes_per_phenopacket(fpath: str, n_copies: int) -> float:
+    """
+    :param fpath: path to a phenopacket JSON file
+    :param n_copies: number of times the phenopacket is loaded
+    :returns: retained memory per phenopacket, in bytes
+    """
+    with open(fpath) as fh:
+        payload = fh.read()
+    deserializer = JsonDeserializer()
+    # load once before measuring, so that module-level caches and interned strings are not counted
+    deserializer.deserialize(payload, Phenopacket)
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    phenopackets = [deserializer.deserialize(payload, Phenopacket) for _ in range(n_copies)]
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(phenopackets) == n_copies
+    return (end - start) / n_copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the memory retained by loaded phenopackets')
+    parser.add_argument('--phenopacket', default=DEFAULT_PHENOPACKET, help='path to a phenopacket JSON file')
+    parser.add_argument('--n', type=int, default=500, help='number of times the phenopacket is loaded')
+    args = parser.parse_args()
+    bytes_per_pp = measure_bytes_per_phenopacket(fpath=args.phenopacket, n_copies=args.n)
+    print(f'{os.path.basename(args.phenopacket)} x {args.n}: {bytes_per_pp:.0f} bytes per phenopacket')
+
+
+if __name__ == '__main__':
+    main()
@@ -12,9 +12,11 @@ from .discombulator import Discombobulator
 from .disease import Disease
 from .disease_id_column_mapper import DiseaseIdColumnMapper
 from .hgvs_variant import HgvsVariant
+from .hpo_aho_corasick_cr import HpoAhoCorasickConceptRecognizer
 from .hpo_cr import HpoConceptRecognizer
 from .hpo_exact_cr import HpoExactConceptRecognizer
 from .hpo_fasthpocr_cr import HpoFastHPOCRConceptRecognizer
+from .hpo_label_cache import HpoLabelMapCache
 from .hpo_base_cr import HpoBaseConceptRecognizer
 from .hpo_parser import HpoParser
 from .hp_term import HpTerm, HpTermBuilder
@@ -23,6 +25,7 @@ from .individual import Individual
 from .measurements import Measurements
 from .metadata import MetaData
 from .mode_of_inheritance import Moi
+from .ontology_index import OntologyIndex
 from .ontology_terms import OntologyTerms
 from .option_column_mapper import OptionColumnMapper
 from .intergenic_variant import IntergenicVariant
@@ -34,6 +37,7 @@ from .structural_variant import StructuralVariant
 from .thresholded_column_mapper import ThresholdedColumnMapper
 from .thresholder import Thresholder
 from .variant import Variant
+from .variant_cache import VariantCache
 from .variant_column_mapper import VariantColumnMapper
 from .variant_manager import VariantManager
 from .variant_validator import VariantValidator
@@ -55,15 +59,18 @@ __all__ = [
     "Disease",
     "DiseaseIdColumnMapper",
     "HgvsVariant",
+    "HpoAhoCorasickConceptRecognizer",
     "HpoConceptRecognizer",
     "HpoBaseConceptRecognizer",
     "HpoExactConceptRecognizer",
     "HpoFastHPOCRConceptRecognizer",
+    "HpoLabelMapCache",
     "HpoParser",
     "HpTerm",
     "HpTermBuilder",
     "Individual",
     "MetaData",
+    "OntologyIndex",
     "OptionColumnMapper",
     "PyPheToolsAge", "AgeSorter", "HPO_ONSET_TERMS",
     "SexColumnMapper",
@@ -75,6 +82,7 @@ __all__ = [
     "ThresholdedColumnMapper",
     "Thresholder",
     "Variant",
+    "VariantCache",
     "VariantColumnMapper",
     "VariantManager",
     "VariantValidator",
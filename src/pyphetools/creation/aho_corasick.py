@@ -0,0 +1,109 @@
+import typing
+from collections import deque
+
+
+def _is_word_char(c: str) -> bool:
+    # Same definition of a "word" character as used by the `\b` anchor of Python's `re` module for `str` patterns
+    return c.isalnum() or c == '_'
+
+
+def is_word_boundary(text: str, pos: int) -> bool:
+    """
+    :param text: the text being searched
+    :param pos: a position between two characters of `text` (0 is the start, `len(text)` is the end)
+    :returns: True iff the regex anchor `\\b` would match at `pos`
+    """
+    left = pos > 0 and _is_word_char(text[pos - 1])
+    right = pos < len(text) and _is_word_char(text[pos])
+    return left != right
+
+
+class AhoCorasickAutomaton:
+    """
+    Multi-pattern string matcher that finds all occurrences of a set of keywords in a single linear pass over the text.
+
+    The automaton is built once from a mapping of keywords to arbitrary payloads (e.g., lower-case HPO labels to HPO ids).
+    Matches are reported as tuples `(start, end, payload)` where `end` is the (inclusive) position of the last
+    character of the match, i.e. the same convention as used by :class:`ConceptMatch`.
+
+    :param patterns: map from keywords to payloads. Empty keywords are ignored.
+    :type patterns: Mapping[str, Any]
+    """
+
+    def __init__(self, patterns: typing.Mapping[str, typing.Any]):
+        # state 0 is the root. For each state we keep the outgoing edges, the failure link,
+        # the output (keyword length and payload) if a keyword ends in the state, and the
+        # dictionary suffix link, i.e. the nearest state reachable via failure links that has an output
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+        self._dict_link = [0]
+        for keyword, payload in patterns.items():
+            if len(keyword) == 0:
+                continue
+            self._add_keyword(keyword, payload)
+        self._build_links()
+
+    def _add_keyword(self, keyword: str, payload) -> None:
+        state = 0
+        for c in keyword:
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._dict_link.append(0)
+                self._goto[state][c] = nxt
+            state = nxt
+        self._output[state] = (len(keyword), payload)
+
+    def _build_links(self) -> None:
+        queue = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for c, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f != 0 and c not in self._goto[f]:
+                    f = self._fail[f]
+                fail_state = self._goto[f].get(c, 0)
+                self._fail[nxt] = fail_state
+                if self._output[fail_state] is not None:
+                    self._dict_link[nxt] = fail_state
+                else:
+                    self._dict_link[nxt] = self._dict_link[fail_state]
+
+    def __len__(self) -> int:
+        return sum(1 for out in self._output if out is not None)
+
+    def find_all(self, text: str) -> typing.Iterator[typing.Tuple[int, int, typing.Any]]:
+        """
+        :param text: the text to be searched
+        :returns: an iterator over all (possibly overlapping) matches as `(start, end, payload)` tuples
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+        state = 0
+        for i, c in enumerate(text):
+            while state != 0 and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            s = state if output[state] is not None else dict_link[state]
+            while s != 0:
+                length, payload = output[s]
+                yield i - length + 1, i, payload
+                s = dict_link[s]
+
+    def find_word_matches(self, text: str) -> typing.Iterator[typing.Tuple[int, int, typing.Any]]:
+        """
+        :param text: the text to be searched
+        :returns: an iterator over the matches that start and end at a word boundary (in the sense of regex `\\b`)
+        """
+        for start, end, payload in self.find_all(text):
+            if is_word_boundary(text, start) and is_word_boundary(text, end + 1):
+                yield start, end, payload
@@ -142,70 +142,75 @@ class CohortEncoder(AbstractEncoder):
         self._disease_dictionary = disease_d
         self._disease = None
 
-    def _get_age(row: pd.Series, mapper: AgeColumnMapper):
-        import math
+    @staticmethod
+    def _get_ages(df: pd.DataFrame, mapper: AgeColumnMapper) -> typing.List:
         column_name = mapper.get_column_name()
         if column_name == Constants.NOT_PROVIDED:
-            return None
-        age_cell_contents = row[column_name]
-        if isinstance(age_cell_contents, float) and math.isnan(age_cell_contents):
-            return None
-        try:
-            age = mapper.map_cell(age_cell_contents)
-        except Exception as ee:
-            print(f"Warning: Could not parse age {ee}. Setting age to \"not provided\"")
-            age = None
-        return age
+            return [None] * len(df)
+        ages = []
+        for age_cell_contents in df[column_name]:
+            if isinstance(age_cell_contents, float) and isnan(age_cell_contents):
+                ages.append(None)
+                continue
+            try:
+                age = mapper.map_cell(age_cell_contents)
+            except Exception as ee:
+                print(f"Warning: Could not parse age {ee}. Setting age to \"not provided\"")
+                age = None
+            ages.append(age)
+        return ages
 
     def get_individuals(self) -> typing.List[Individual]:
         """Get a list of all Individual objects in the cohort
 
+        The table is encoded column by column: each mapper maps its entire column at once (mappers with a
+        dictionary of cell values map each distinct value only once), and the results are then combined into
+        one Individual per row.
+
         :returns: a list of all Individual objects in the cohort
         :rtype: List[Individual]
         """
         # make sure indexes pair with number of rows, if needed
         if not self._df.index.name in self._df.columns:
             df = self._df.reset_index()
+        else:
+            df = self._df
         individuals = []
+        n_rows = len(df)
         sex_column_name = self._sex_mapper.get_column_name()
-        if self._variant_mapper is None:
-            variant_colname = None
-            genotype_colname = None
+        individual_ids = df[self._id_column_name].tolist()
+        ages_of_onset = CohortEncoder._get_ages(df, self._age_of_onset_mapper)
+        ages_last_encounter = CohortEncoder._get_ages(df, self._age_at_last_encounter_mapper)
+        if sex_column_name == Constants.NOT_PROVIDED:
+            sexes = [self._sex_mapper.map_cell(Constants.NOT_PROVIDED)] * n_rows
+        else:
+            sexes = self._sex_mapper.map_column(df[sex_column_name])
+        hpo_term_columns = []
+        for column_mapper in self._column_mapper_list:
+            column_name = column_mapper.get_column_name()
+            if column_name not in df.columns:
+                raise ValueError(f"Did not find column name '{column_name}' in dataframe -- check spelling!")
+            hpo_term_columns.append(column_mapper.map_column(df[column_name]))
+        if self._variant_mapper is None or self._variant_mapper.get_variant_column_name() is None:
+            interpretation_lists = [[] for _ in range(n_rows)]
         else:
             variant_colname = self._variant_mapper.get_variant_column_name()
             genotype_colname = self._variant_mapper.get_genotype_colname()
-        for index, row in df.iterrows():
-            individual_id = row[self._id_column_name]
-            age_of_onset = CohortEncoder._get_age(row, self._age_of_onset_mapper)
-            age_last_encounter = CohortEncoder._get_age(row, self._age_at_last_encounter_mapper)
-            if sex_column_name == Constants.NOT_PROVIDED:
-                sex = self._sex_mapper.map_cell(Constants.NOT_PROVIDED)
+            if genotype_colname is not None:
+                genotype_column = df[genotype_colname]
             else:
-                sex_cell_contents = row[sex_column_name]
-                sex = self._sex_mapper.map_cell(sex_cell_contents)
+                genotype_column = [None] * n_rows
+            interpretation_lists = [self._variant_mapper.map_cell(variant_cell_contents, genotype_cell_contents)
+                                    for variant_cell_contents, genotype_cell_contents
+                                    in zip(df[variant_colname], genotype_column)]
+        for i, individual_id in enumerate(individual_ids):
+            age_of_onset = ages_of_onset[i]
+            age_last_encounter = ages_last_encounter[i]
+            sex = sexes[i]
             hpo_terms = []
-            for column_mapper in self._column_mapper_list:
-                column_name = column_mapper.get_column_name()
-                if column_name not in df.columns:
-                    raise ValueError(f"Did not find column name '{column_name}' in dataframe -- check spelling!")
-                cell_contents = row[column_name]
-                # Empty cells are often represented as float non-a-number by Pandas
-                if isinstance(cell_contents, float) and isnan(cell_contents):
-                    continue
-                terms = column_mapper.map_cell(cell_contents)
-                hpo_terms.extend(terms)
-            if variant_colname is not None:
-                variant_cell_contents = row[variant_colname]
-                if genotype_colname is not None:
-                    genotype_cell_contents = row[genotype_colname]
-                else:
-                    genotype_cell_contents = None
-                if self._variant_mapper is not None:
-                    interpretation_list = self._variant_mapper.map_cell(variant_cell_contents, genotype_cell_contents)
-                else:
-                    interpretation_list = []
-            else:
-                interpretation_list = []
+            for hpo_term_column in hpo_term_columns:
+                hpo_terms.extend(hpo_term_column[i])
+            interpretation_list = interpretation_lists[i]
             if self._disease_dictionary is not None and self._disease is None:
                 if individual_id not in self._disease_dictionary:
                     raise ValueError(f"Could not find disease link for {individual_id}")
@@ -1,20 +1,42 @@
 import abc
-from typing import List
+import copy
+import math
+from collections import OrderedDict, namedtuple
+from typing import List, Optional
 import pandas as pd
 import re
 
+DEFAULT_CELL_CACHE_SIZE = 1024
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
 class ColumnMapper(metaclass=abc.ABCMeta):
     """
     Abstract superclass for all Column Mapper classes, each of which applies a specific strategy to extracting HPO terms
     from columns of tables (e.g., supplemental files) representing cohorts of individuals with a given disease.
+
+    Subclasses whose map_cell result only depends on the cell contents set `_cache_cell_results` to True. For these
+    mappers, each distinct cell value is mapped only once and the result is kept in a bounded LRU cache (see
+    :meth:`map_cell_cached`).
     """
-    def __init__(self, column_name:str) -> None:
+    _cache_cell_results = False
+
+    def __init__(self, column_name:str, cache_size:Optional[int]=DEFAULT_CELL_CACHE_SIZE) -> None:
         """Constructor
 
         :param column_name: name of the column in the pandas DataFrame
         :type column_name: str
+        :param cache_size: maximum number of distinct cell values whose mapping is cached (None: no limit)
+        :type cache_size: Optional[int]
         """
         self._column_name = column_name
+        if cache_size is not None and cache_size < 0:
+            raise ValueError(f"cache_size argument must be non-negative but was {cache_size}")
+        self._cache_size = cache_size
+        self._cell_cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @abc.abstractmethod
     def map_cell(self, cell_contents) -> List:
@@ -23,6 +45,102 @@ class ColumnMapper(metaclass=abc.ABCMeta):
         """
         pass
 
+    def map_column(self, column: pd.Series) -> List[List]:
+        """
+        Map all cells of a column
+
+        Empty cells, which are often represented as float non-a-number by Pandas, are mapped to an empty list.
+
+        :param column: the column (self._column_name) of the pandas DataFrame
+        :type column: pd.Series
+        :returns: a list with the result of map_cell for each cell of the column
+        :rtype: List[List]
+        """
+        if not self._cache_cell_results:
+            return [[] if ColumnMapper._is_empty(cell) else self.map_cell(cell) for cell in column]
+        # Each distinct value of the column is looked up once. Each cell gets copies of the HpTerm objects,
+        # because HpTerm objects are mutable and must not be shared by several individuals.
+        mapped_d = {}
+        results = []
+        for cell in column:
+            if ColumnMapper._is_empty(cell):
+                results.append([])
+                continue
+            key = ColumnMapper._cache_key(cell)
+            try:
+                mapped = mapped_d.get(key)
+            except TypeError:
+                # unhashable cell contents
+                results.append(self.map_cell(cell))
+                continue
+            if mapped is None:
+                mapped = self._get_cached_result(cell)
+                mapped_d[key] = mapped
+            results.append([copy.copy(term) for term in mapped])
+        return results
+
+    def map_cell_cached(self, cell_contents) -> List:
+        """
+        Map a cell, reusing the result of a previous call with the same cell contents
+
+        The cache is only used by mappers whose result only depends on the cell contents, other mappers simply call
+        map_cell. The returned list contains copies of the cached objects, so that callers may modify them.
+
+        :param cell_contents: contents of a cell of the original file
+        :returns: the result of map_cell for the cell contents
+        :rtype: List
+        """
+        if not self._cache_cell_results:
+            return self.map_cell(cell_contents)
+        return [copy.copy(term) for term in self._get_cached_result(cell_contents)]
+
+    @staticmethod
+    def _cache_key(cell_contents):
+        # Values such as 1, 1.0 and True compare equal but may be mapped differently, so the type is part of the key
+        return type(cell_contents), cell_contents
+
+    def _get_cached_result(self, cell_contents) -> List:
+        # Do not hand out the returned list or its elements, they are owned by the cache
+        key = ColumnMapper._cache_key(cell_contents)
+        try:
+            result = self._cell_cache.get(key)
+        except TypeError:
+            # unhashable cell contents
+            return self.map_cell(cell_contents)
+        if result is not None:
+            self._cache_hits += 1
+            self._cell_cache.move_to_end(key)
+            return result
+        self._cache_misses += 1
+        result = list(self.map_cell(cell_contents))
+        if self._cache_size is None or self._cache_size > 0:
+            self._cell_cache[key] = result
+            if self._cache_size is not None and len(self._cell_cache) > self._cache_size:
+                self._cell_cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        :returns: statistics of the cache of mapped cell values (hits, misses, maxsize, currsize)
+        :rtype: CacheInfo
+        """
+        return CacheInfo(hits=self._cache_hits,
+                         misses=self._cache_misses,
+                         maxsize=self._cache_size,
+                         currsize=len(self._cell_cache))
+
+    def cache_clear(self) -> None:
+        """
+        Clear the cache of mapped cell values and its statistics, e.g., after changing the mapping dictionaries
+        """
+        self._cell_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @staticmethod
+    def _is_empty(cell_contents) -> bool:
+        return isinstance(cell_contents, float) and math.isnan(cell_contents)
+
     @abc.abstractmethod
     def preview_column(self, df:pd.DataFrame):
         """
@@ -51,6 +51,18 @@ class ConstantColumnMapper(ColumnMapper):
         """
         return self._hpo_terms
 
+    def map_column(self, column: pd.Series) -> List[List[HpTerm]]:
+        """All individuals in the table have the list of HPO terms, so the cells are only checked for being empty
+
+        As with the other mappers, empty cells (float non-a-number) are mapped to an empty list.
+
+        :param column: the column of the pandas DataFrame
+        :type column: pd.Series
+        :returns: the list of HPO terms for each cell
+        :rtype: List[List[HpTerm]]
+        """
+        return [[] if ColumnMapper._is_empty(cell) else self._hpo_terms for cell in column]
+
     def preview_column(self, df:pd.DataFrame) -> pd.DataFrame:
         if not isinstance(df, pd.DataFrame):
             raise ValueError("df argument must be pandas DataFrame, but was {type(column)}")
@@ -81,11 +81,11 @@ class Discombobulator:
         else:
             raise ValueError(f"trueNa argument must be string or set, but was {type(trueNa)}")
         ## First get list of all HPO terms used
-        for idx, row in self._df.iterrows():
+        ## coerce to string in case empty
+        cell_contents = [str(contents) for contents in self._df[column]]
+        hpo_term_lists = self._hpo_cr.parse_cells(cell_contents)
+        for idx, hpo_term_list in zip(self._df.index, hpo_term_lists):
             idx = str(idx)
-            contents = row[column]
-            contents = str(contents) ## coerce to string in case empty
-            hpo_term_list = self._hpo_cr.parse_cell(contents)
             for hterm in hpo_term_list:
                 hpo_id = hterm.id
                 label = hterm.label
@@ -1,3 +1,4 @@
+import sys
 import typing
 import pandas as pd
 import phenopackets as PPKt
@@ -35,8 +36,10 @@ class HpTerm:
             raise ValueError(f"invalid id argument: '{hpo_id}'")
         if label is None or len(label) == 0:
             raise ValueError(f"invalid label argument: '{label}'")
-        self._id = hpo_id
-        self._label = label
+        # HpTerm is mutable (e.g. `set_onset`), so we cannot share the instances,
+        # but we share the id and label strings, of which there are only as many as HPO terms.
+        self._id = sys.intern(str(hpo_id))
+        self._label = sys.intern(str(label))
         self._observed = observed
         self._measured = measured
         #if not onset is None or str(type(onset)) != "<class 'pyphetools.pp.v202._base.TimeElement'>":
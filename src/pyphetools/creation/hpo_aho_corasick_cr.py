@@ -0,0 +1,49 @@
+import typing
+
+import hpotk
+
+from .aho_corasick import AhoCorasickAutomaton
+from .hp_term import HpTerm
+from .hpo_base_cr import HpoBaseConceptRecognizer, ConceptMatch
+from .hpo_exact_cr import get_label_to_id_map, get_id_to_label_map
+
+
+class HpoAhoCorasickConceptRecognizer(HpoBaseConceptRecognizer):
+    """
+    Exact-match concept recognizer that finds HPO labels and synonyms in a single linear pass over each chunk.
+
+    The recognizer uses the same label and synonym dictionaries as :class:`HpoExactConceptRecognizer`, but
+    compiles them once into an Aho-Corasick automaton instead of searching for each of the (tens of thousands of)
+    labels in turn. As with the exact recognizer, only matches that begin and end at a word boundary are reported,
+    so that e.g. *Pica* is not found in *typical*.
+    """
+
+    @staticmethod
+    def from_hpo(hpo: hpotk.Ontology):
+        label_to_id = get_label_to_id_map(hpo)
+        id_to_primary_label = get_id_to_label_map(hpo)
+
+        return HpoAhoCorasickConceptRecognizer(
+            label_to_id=label_to_id,
+            id_to_primary_label=id_to_primary_label,
+        )
+
+    def __init__(self, **kwargs):
+        super(HpoAhoCorasickConceptRecognizer, self).__init__(**kwargs)
+        # The keys of label_to_id are lower case already, but we do not want to rely on that
+        self._automaton = AhoCorasickAutomaton({lc_label.lower(): hpo_id for lc_label, hpo_id in self._label_to_id.items()})
+
+    def _find_hpo_term_in_lc_chunk(self, lc_chunk) -> typing.List[HpTerm]:
+        # As with the exact recognizer, a term that is mentioned several times in the chunk is only reported once.
+        # We keep the first match of each term (and the longest of the matches that start at the same position).
+        span_d = {}
+        for startpos, endpos, hpo_tid in self._automaton.find_word_matches(lc_chunk):
+            span = span_d.get(hpo_tid)
+            if span is None or startpos < span[0] or (startpos == span[0] and endpos > span[1]):
+                span_d[hpo_tid] = (startpos, endpos)
+        hits = []
+        for hpo_tid, (startpos, endpos) in span_d.items():
+            hp_term = super(HpoAhoCorasickConceptRecognizer, self).get_term_from_id(
+                hpo_id=hpo_tid)  # Get properly capitalized label
+            hits.append(ConceptMatch(term=hp_term, start=startpos, end=endpos))
+        return hits
@@ -1,8 +1,11 @@
 import re
 import typing
 import abc
-from collections import defaultdict
+import copy
+import threading
+from collections import OrderedDict, defaultdict
 
+from .aho_corasick import AhoCorasickAutomaton
 from .column_mapper import ColumnMapper
 from .hp_term import HpTerm
 from .hpo_cr import HpoConceptRecognizer
@@ -47,8 +50,83 @@ class ConceptMatch:
             return False
 
 
+class CustomDictionaryMatcher:
+    """
+    Finds the keys of a custom dictionary (strings of the original table mapped to HPO labels) within chunks of text.
+
+    The lower-cased keys are compiled once into an Aho-Corasick automaton, so that a chunk is searched for all keys
+    in a single pass. As with str.find, each key matches at its first occurrence in the chunk, also within words.
+    The HpTerm objects of a key are created when the key is first found and copied for each match.
+
+    :param custom_d: key - text in original table, value - corresponding HPO label or list of HPO labels
+    :type custom_d: Dict[str, Union[str,List[str]]]
+    :param get_term_from_label: function that returns the HpTerm of an HPO label
+    """
+
+    def __init__(self, custom_d, get_term_from_label: typing.Callable[[str], HpTerm]) -> None:
+        # snapshot of the dictionary, used to check whether the matcher is still valid for a (mutable) dictionary
+        self._custom_items = {k: (list(v) if isinstance(v, list) else v) for k, v in custom_d.items()}
+        self._get_term_from_label = get_term_from_label
+        self._labels = []
+        self._terms = []
+        # indices of the dictionary entries, in the order of the dictionary, grouped by lower-cased key
+        key_to_indices = defaultdict(list)
+        self._empty_key_indices = []
+        for original_text, hpo_label in self._custom_items.items():
+            if isinstance(hpo_label, str):
+                labels = [hpo_label]
+            elif isinstance(hpo_label, list):
+                labels = hpo_label
+            else:
+                continue
+            idx = len(self._labels)
+            self._labels.append(labels)
+            self._terms.append(None)
+            lc_original = original_text.lower()
+            if len(lc_original) == 0:
+                # str.find matches the empty string at the start of each chunk
+                self._empty_key_indices.append(idx)
+            else:
+                key_to_indices[lc_original].append(idx)
+        self._automaton = AhoCorasickAutomaton(key_to_indices)
+
+    def is_valid_for(self, custom_d) -> bool:
+        """
+        :returns: True iff custom_d has the same contents as the dictionary the matcher was compiled from
+        """
+        return custom_d == self._custom_items
+
+    def _get_terms(self, idx: int) -> typing.List[HpTerm]:
+        terms = self._terms[idx]
+        if terms is None:
+            terms = [self._get_term_from_label(label) for label in self._labels[idx]]
+            self._terms[idx] = terms
+        return terms
+
+    def find_matches(self, lc_chunk: str) -> typing.List[ConceptMatch]:
+        """
+        :param lc_chunk: a chunk of text that has been stripped of whitespace and lower-cased already
+        :returns: the first match of each key in the chunk, in the order of the dictionary
+        :rtype: List[ConceptMatch]
+        """
+        first_match_d = {idx: (0, -1) for idx in self._empty_key_indices}
+        for startpos, endpos, indices in self._automaton.find_all(lc_chunk):
+            for idx in indices:
+                if idx not in first_match_d:
+                    first_match_d[idx] = (startpos, endpos)
+        hits = []
+        for idx in sorted(first_match_d):
+            startpos, endpos = first_match_d[idx]
+            for hp_term in self._get_terms(idx):
+                hits.append(ConceptMatch(term=copy.copy(hp_term), start=startpos, end=endpos))
+        return hits
+
+
 class HpoBaseConceptRecognizer(HpoConceptRecognizer):
 
+    # maximum number of compiled custom dictionaries that are kept per concept recognizer
+    MAX_CUSTOM_MATCHERS = 64
+
     def __init__(self, label_to_id, id_to_primary_label):
         if not isinstance(label_to_id, dict):
             raise ValueError("label_to_id_d argument must be dictionary")
@@ -56,6 +134,9 @@ class HpoBaseConceptRecognizer(HpoConceptRecognizer):
             raise ValueError("labels_to_primary_label_d argument must be dictionary")
         self._id_to_primary_label = id_to_primary_label
         self._label_to_id = label_to_id
+        self._empty_custom_matcher = CustomDictionaryMatcher(custom_d={}, get_term_from_label=self.get_term_from_label)
+        self._custom_matchers = OrderedDict()
+        self._custom_matchers_lock = threading.Lock()
 
     def parse_cell(self, cell_contents, custom_d=None) -> typing.List[HpTerm]:
         """parse the contents of one table cell
@@ -64,18 +145,34 @@ class HpoBaseConceptRecognizer(HpoConceptRecognizer):
             cell_contents (str): description of patient phenotypes. Assumption is that if there are new lines, any given phenotype is on its own line
             custom_d (dict, optional): User-provided dictionary with mappings to HPO terms. Defaults to None.
         """
+        cell_text = HpoBaseConceptRecognizer._get_cell_text(cell_contents)
+        if custom_d is None:
+            # initialize to empty dictionary if this argument is not passed
+            # to avoid needed to check for None in other functions
+            custom_d = defaultdict()
+        return self._parse_contents(cell_text=cell_text, custom_d=custom_d)
+
+    @staticmethod
+    def _get_cell_text(cell_contents) -> str:
         if not isinstance(cell_contents, str):
             print(
                 f"Error: cell_contents argument ({cell_contents}) must be string but was {type(cell_contents)} -- coerced to string")
             cell_contents = str(cell_contents)
-
         # lines = self._split_into_lines(cell_contents)
-        cell_text = cell_contents.replace("\n", " ")
+        return cell_contents.replace("\n", " ")
+
+    def _get_batch_parser(self, custom_d):
+        # Cells of a table often share chunks (e.g., "seizures" in "seizures, ataxia" and "seizures; ptosis"),
+        # so the matches of each distinct chunk are computed once per batch
         if custom_d is None:
-            # initialize to empty dictionary if this argument is not passed
-            # to avoid needed to check for None in other functions
             custom_d = defaultdict()
-        return self._parse_contents(cell_text=cell_text, custom_d=custom_d)
+        chunk_cache = {}
+
+        def parse(cell_contents):
+            cell_text = HpoBaseConceptRecognizer._get_cell_text(cell_contents)
+            return self._parse_contents(cell_text=cell_text, custom_d=custom_d, chunk_cache=chunk_cache)
+
+        return parse
 
     def _get_exact_match_in_custom_d(self, cell_text, custom_d) -> typing.List[HpTerm]:
         """This method is called by _parse_contents if cell_text was present in custom_d
@@ -106,44 +203,57 @@ class HpoBaseConceptRecognizer(HpoConceptRecognizer):
                 results.append(hp_term)
         return results
 
-    def _find_text_within_custom_items(self, lc_chunk, custom_d) -> typing.List[HpTerm]:
-        hits = []
-        # Note that chunk has been stripped of whitespace and lower-cased already
-        for original_text, hpo_label in custom_d.items():
-            lc_original = original_text.lower()
-            startpos = lc_chunk.find(lc_original)
-            if startpos < 0:
-                continue
-            endpos = startpos + len(lc_original) - 1
-            if isinstance(hpo_label, str):
-                hp_term = self.get_term_from_label(hpo_label)
-                hits.append(ConceptMatch(term=hp_term, start=startpos, end=endpos))
-            elif isinstance(hpo_label, list):
-                for h in hpo_label:
-                    hp_term = self.get_term_from_label(h)
-                    hits.append(ConceptMatch(term=hp_term, start=startpos, end=endpos))
-        return hits
+    def _get_custom_matcher(self, custom_d) -> CustomDictionaryMatcher:
+        """
+        :returns: the compiled matcher of custom_d. The matchers are cached by the identity of the dictionary and
+            recompiled if the contents of the dictionary changed.
+        """
+        if len(custom_d) == 0:
+            # parse_cell creates a new empty dictionary for each cell if no custom_d is passed
+            return self._empty_custom_matcher
+        key = id(custom_d)
+        with self._custom_matchers_lock:
+            entry = self._custom_matchers.get(key)
+            if entry is not None and entry[0] is custom_d and entry[1].is_valid_for(custom_d):
+                self._custom_matchers.move_to_end(key)
+                return entry[1]
+        matcher = CustomDictionaryMatcher(custom_d=custom_d, get_term_from_label=self.get_term_from_label)
+        with self._custom_matchers_lock:
+            # keep a reference to the dictionary so that its id cannot be reused by another object
+            self._custom_matchers[key] = (custom_d, matcher)
+            self._custom_matchers.move_to_end(key)
+            if len(self._custom_matchers) > self.MAX_CUSTOM_MATCHERS:
+                self._custom_matchers.popitem(last=False)
+        return matcher
 
     @abc.abstractmethod
     def _find_hpo_term_in_lc_chunk(self, lc_chunk) -> typing.List[HpTerm]:
         pass
 
-    def _parse_contents(self, cell_text, custom_d) -> typing.List[HpTerm]:
+    def _parse_contents(self, cell_text, custom_d, chunk_cache=None) -> typing.List[HpTerm]:
         """Parse the contents of a cell for HPO terms
         Args:
             cell_text (str): The text of a table cell
             custom_d (dict): key - text in original table value-corresponding HPO label
+            chunk_cache (dict, optional): matches of previously parsed chunks (with the same custom_d), will be updated
         """
         if cell_text in custom_d:
             return self._get_exact_match_in_custom_d(cell_text=cell_text, custom_d=custom_d)
         chunks = self._split_line_into_chunks(cell_text)
+        custom_matcher = self._get_custom_matcher(custom_d)
         results = []
         for chunk in chunks:
+            if chunk_cache is not None and chunk in chunk_cache:
+                results.extend(chunk_cache[chunk])
+                continue
             lc_chunk = chunk.lower()
-            hits_1 = self._find_text_within_custom_items(lc_chunk=lc_chunk, custom_d=custom_d)
+            hits_1 = custom_matcher.find_matches(lc_chunk)
             hits_2 = self._find_hpo_term_in_lc_chunk(lc_chunk=lc_chunk)
             hits_1.extend(hits_2)
-            results.extend(self._get_non_overlapping_matches(hits=hits_1))
+            chunk_results = self._get_non_overlapping_matches(hits=hits_1)
+            if chunk_cache is not None:
+                chunk_cache[chunk] = chunk_results
+            results.extend(chunk_results)
         return results
 
     def parse_cell_for_exact_matches(self, cell_text, custom_d) -> typing.List[HpTerm]:
@@ -158,10 +268,11 @@ class HpoBaseConceptRecognizer(HpoConceptRecognizer):
         if cell_text in custom_d:
             return self._get_exact_match_in_custom_d(cell_text=cell_text, custom_d=custom_d)
         chunks = self._split_line_into_chunks(cell_text)
+        custom_matcher = self._get_custom_matcher(custom_d)
         results = []
         for chunk in chunks:
             lc_chunk = chunk.lower()
-            hits = self._find_text_within_custom_items(lc_chunk=lc_chunk, custom_d=custom_d)
+            hits = custom_matcher.find_matches(lc_chunk)
             results.extend(self._get_non_overlapping_matches(hits=hits))
         return
 
@@ -169,27 +280,32 @@ class HpoBaseConceptRecognizer(HpoConceptRecognizer):
         """The prupose of this method is to choose a list of non-overlapping matches
 
         Sometimes, we get multiple matches that partially overlap. We will greedily take the longest matches and discard overlaps.
+        Matches of the same length are considered in the order of the hits. Rather than comparing each hit with all
+        previously chosen hits, we mark the positions of the text that are covered by the chosen hits, so that the
+        selection takes O(n log n) time for n hits (plus the length of the text).
 
         :param hits: list of ConceptMatch objects that encode HpTerm matches and their positions
         :type hits: List[ConceptMatch]
-        :returns: a list of non-overlapping HtTerm objects (matches)
+        :returns: a list of non-overlapping HtTerm objects (matches), in the order of their position in the text
         :rtype: List[HpTerm]
         """
-        sorted_hits = sorted(hits, key=ConceptMatch.length, reverse=True)
-        # Choose longest hits first and skip hits that overlap with previously chosen hits
-        chosen_hits = set()
-        for hit in sorted_hits:
-            keeper = True
-            for ch in chosen_hits:
-                if ch.overlaps(hit):
-                    keeper = False
-                    break
-            if keeper:
-                chosen_hits.add(hit)
-        results = []
-        for ch in chosen_hits:
-            results.append(ch.term)
-        return results
+        if len(hits) == 0:
+            return []
+        # sorted is stable, so hits of the same length keep their original order
+        order = sorted(range(len(hits)), key=lambda i: hits[i].length(), reverse=True)
+        covered = bytearray(max(0, 1 + max(max(hit.start, hit.end) for hit in hits)))
+        chosen = []
+        for i in order:
+            hit = hits[i]
+            start, end = hit.start, hit.end
+            # same criterion as ConceptMatch.overlaps: the start or the end of the hit lies within a chosen hit
+            if (start >= 0 and covered[start]) or (end >= 0 and covered[end]):
+                continue
+            if end >= start:
+                covered[start:end + 1] = b"\x01" * (end - start + 1)
+            chosen.append(i)
+        chosen.sort(key=lambda i: (hits[i].start, hits[i].end, i))
+        return [hits[i].term for i in chosen]
 
     def _split_line_into_chunks(self, line):
         """Split a line into chunks and remove white space from beginning and end of each chunk
@@ -1,5 +1,7 @@
 import abc
-from typing import List
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
 
 from .hp_term import HpTerm
 
@@ -21,6 +23,38 @@ class HpoConceptRecognizer(metaclass=abc.ABCMeta):
         """
         pass
 
+    def parse_cells(self, cells: Iterable, custom_d=None, max_workers: int = None) -> List[List[HpTerm]]:
+        """
+        parse HPO Terms from the contents of several cells of the original table
+
+        Each distinct cell value is parsed only once. Each cell gets copies of the HpTerm objects, because HpTerm
+        objects are mutable and must not be shared by several individuals.
+
+        :param cells: cells of the original table
+        :type cells: Iterable[str]
+        :param custom_d: a dictionary with keys for strings in the original table and their mappings to HPO labels
+        :type custom_d: Dict[str,str], optional
+        :param max_workers: number of threads used to parse the distinct cell values (default: no threads)
+        :type max_workers: int, optional
+        :returns: a list with the HPO terms of each cell, in the order of the input
+        :rtype: List[List[HpTerm]]
+        """
+        cells = list(cells)
+        distinct_cells = list(dict.fromkeys(cells))
+        parse = self._get_batch_parser(custom_d=custom_d)
+        if max_workers is None or max_workers < 2 or len(distinct_cells) < 2:
+            parsed = [parse(cell_contents) for cell_contents in distinct_cells]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(parse, distinct_cells))
+        parsed_d = dict(zip(distinct_cells, parsed))
+        return [[copy.copy(term) for term in parsed_d[cell_contents]] for cell_contents in cells]
+
+    def _get_batch_parser(self, custom_d) -> Callable[[str], List[HpTerm]]:
+        """
+        :returns: a function that parses one cell of a batch. Subclasses can override this method to share work between the cells of a batch.
+        """
+        return lambda cell_contents: self.parse_cell(cell_contents, custom_d=custom_d)
 
     @abc.abstractmethod
     def parse_cell_for_exact_matches(self, cell_contents, custom_d) -> List[HpTerm]:
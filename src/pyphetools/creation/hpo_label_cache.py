@@ -0,0 +1,140 @@
+import hashlib
+import mmap
+import os
+import re
+import struct
+import typing
+
+import hpotk
+
+from .hpo_exact_cr import get_label_to_id_map, get_id_to_label_map
+
+# Bump the version suffix of the magic bytes whenever the layout of the cache file or the content of the maps changes
+# (e.g., if we change the rules for which synonyms are included in the label to id map).
+_MAGIC = b"PPTLBL02"
+# length of the version, number of labels, number of ids, fingerprint of the ontology
+_HEADER = struct.Struct("<III20s")
+_SEPARATOR = "\0"
+
+
+def get_ontology_fingerprint(hpo: hpotk.MinimalOntology) -> bytes:
+    """
+    Compute a digest of the term count and of the ids and labels of the terms of the ontology.
+
+    The version alone does not identify the content of an `hp.json` file, for instance if the file was edited or if
+    it was built from an unreleased branch. Computing the digest takes a fraction of the time needed to build the maps.
+
+    :param hpo: reference to the HPO
+    :returns: 20 byte SHA-1 digest
+    """
+    digest = hashlib.sha1()
+    digest.update(str(len(hpo)).encode("utf-8"))
+    for term in hpo.terms:
+        digest.update(_SEPARATOR.encode("utf-8"))
+        digest.update(term.identifier.value.encode("utf-8"))
+        digest.update(_SEPARATOR.encode("utf-8"))
+        digest.update(term.name.encode("utf-8"))
+    return digest.digest()
+
+
+class HpoLabelMapCache:
+    """
+    Persistent cache of the label-to-id and id-to-label maps that are used by the HPO concept recognizers.
+
+    Building the maps requires a traversal of the entire ontology, which takes several seconds. This class stores
+    the maps in a compact binary file keyed by the HPO release (`ontology.version`), so that subsequent runs
+    (e.g., a batch of notebooks that use the same HPO release) can load the maps from the cache, which takes
+    milliseconds. The header of the file also stores a fingerprint of the ontology (see
+    :func:`get_ontology_fingerprint`). If a different `hp.json` file is loaded, the version or the fingerprint does
+    not match and the maps are rebuilt.
+
+    The cache file consists of a short header followed by one block of NUL-separated UTF-8 strings, and it is
+    read through a memory map.
+
+    :param cache_dir: path to the directory with the cache files. The directory is created if it does not exist.
+    """
+
+    def __init__(self, cache_dir: str):
+        if cache_dir is None:
+            raise ValueError("cache_dir argument must not be None")
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def get_cache_path(self, version: str) -> str:
+        """
+        :param version: HPO release, e.g. `2024-03-06`
+        :returns: path of the cache file for the release
+        """
+        safe_version = re.sub(r'[^A-Za-z0-9_.\-]', '_', version)
+        return os.path.join(self._cache_dir, f"hpo_label_maps_{safe_version}.bin")
+
+    def get_maps(self, hpo: hpotk.Ontology) -> typing.Tuple[typing.Dict[str, str], typing.Dict[str, str]]:
+        """
+        Get the label-to-id and the id-to-label maps for the ontology, either from the cache or by building them.
+
+        If the ontology has no version, the maps are built but not cached.
+
+        :param hpo: reference to the HPO
+        :returns: a tuple with the map from lower-case labels and synonyms to HPO ids and the map from HPO ids to labels
+        """
+        version = hpo.version
+        if version is None:
+            return get_label_to_id_map(hpo), get_id_to_label_map(hpo)
+        cache_path = self.get_cache_path(version)
+        fingerprint = get_ontology_fingerprint(hpo)
+        maps = self._read(cache_path=cache_path, version=version, fingerprint=fingerprint)
+        if maps is None:
+            maps = get_label_to_id_map(hpo), get_id_to_label_map(hpo)
+            self._write(cache_path=cache_path, version=version, fingerprint=fingerprint, label_to_id=maps[0],
+                        id_to_label=maps[1])
+        return maps
+
+    @staticmethod
+    def _read(cache_path: str, version: str, fingerprint: bytes) -> typing.Optional[typing.Tuple[typing.Dict[str, str], typing.Dict[str, str]]]:
+        """
+        :returns: the cached maps or None if the file does not exist or if it is stale or malformed
+        """
+        if not os.path.isfile(cache_path) or os.path.getsize(cache_path) < len(_MAGIC) + _HEADER.size:
+            return None
+        with open(cache_path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:len(_MAGIC)] != _MAGIC:
+                    return None
+                version_len, n_labels, n_ids, cached_fingerprint = _HEADER.unpack_from(mm, len(_MAGIC))
+                if cached_fingerprint != fingerprint:
+                    return None
+                offset = len(_MAGIC) + _HEADER.size
+                cached_version = mm[offset:offset + version_len].decode("utf-8")
+                if cached_version != version:
+                    return None
+                offset += version_len
+                fields = mm[offset:].decode("utf-8").split(_SEPARATOR) if offset < len(mm) else []
+        if len(fields) != 2 * (n_labels + n_ids):
+            return None
+        end_labels = 2 * n_labels
+        label_to_id = dict(zip(fields[0:end_labels:2], fields[1:end_labels:2]))
+        id_to_label = dict(zip(fields[end_labels::2], fields[end_labels + 1::2]))
+        return label_to_id, id_to_label
+
+    def _write(self, cache_path: str, version: str, fingerprint: bytes, label_to_id: typing.Mapping[str, str],
+               id_to_label: typing.Mapping[str, str]) -> None:
+        os.makedirs(self._cache_dir, exist_ok=True)
+        fields = []
+        for k, v in label_to_id.items():
+            fields.append(k)
+            fields.append(v)
+        for k, v in id_to_label.items():
+            fields.append(k)
+            fields.append(v)
+        version_bytes = version.encode("utf-8")
+        # Write to a temporary file and rename, so that concurrent readers never see a partially written file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(_MAGIC)
+            fh.write(_HEADER.pack(len(version_bytes), len(label_to_id), len(id_to_label), fingerprint))
+            fh.write(version_bytes)
+            fh.write(_SEPARATOR.join(fields).encode("utf-8"))
+        os.replace(tmp_path, cache_path)
@@ -3,9 +3,11 @@ import typing
 
 import hpotk
 
+from .hpo_aho_corasick_cr import HpoAhoCorasickConceptRecognizer
 from .hpo_cr import HpoConceptRecognizer
-from .hpo_exact_cr import HpoExactConceptRecognizer
+from .hpo_exact_cr import HpoExactConceptRecognizer, get_label_to_id_map, get_id_to_label_map
 from .hpo_fasthpocr_cr import HpoFastHPOCRConceptRecognizer
+from .hpo_label_cache import HpoLabelMapCache
 
 
 class HpoParser:
@@ -18,9 +20,14 @@ class HpoParser:
     Both options are optional, and the last HPO release will be used by default. The `release` has a priority
     over `hpo_json_file`.
 
+    The label and id maps used by the concept recognizers are built once per `HpoParser`. If `cache_dir` is set,
+    the maps are additionally stored on disk (keyed by the HPO version), and subsequent runs with the same HPO release
+    load them from the cache.
+
     :param hpo_json_file: a `str` with a URL pointing to a remote `hp.json` (only ``http`` and ``https`` protocols
     are supported (no ``file``, ``ftp``)) or a path to a local `hp.json` file.
     :param release: an optional `str` with the HPO release tag or `None` if the latest HPO release should be used.
+    :param cache_dir: an optional `str` with the path to a directory for caching the label and id maps.
     """
     # TODO: consider deprecating this class. It is not too useful after adding `OntologyStore` API to `hpo-toolkit>=0.5.0`.
 
@@ -28,6 +35,7 @@ class HpoParser:
             self,
             hpo_json_file: typing.Optional[str] = None,
             release: typing.Optional[str] = None,
+            cache_dir: typing.Optional[str] = None,
     ):
         if release is not None:
             store = hpotk.configure_ontology_store()
@@ -39,6 +47,9 @@ class HpoParser:
         else:
             store = hpotk.configure_ontology_store()
             self._ontology = store.load_hpo()
+        self._label_map_cache = HpoLabelMapCache(cache_dir=cache_dir) if cache_dir is not None else None
+        self._label_to_id_d = None
+        self._id_to_label_d = None
 
     def get_ontology(self) -> hpotk.Ontology:
         """
@@ -46,6 +57,13 @@ class HpoParser:
         """
         return self._ontology
 
+    def _load_maps(self) -> None:
+        if self._label_map_cache is not None:
+            self._label_to_id_d, self._id_to_label_d = self._label_map_cache.get_maps(self._ontology)
+        else:
+            self._label_to_id_d = get_label_to_id_map(self._ontology)
+            self._id_to_label_d = get_id_to_label_map(self._ontology)
+
     def get_label_to_id_map(self) -> typing.Mapping[str, str]:
         """
         Create a map from a lower case version of HPO labels to the corresponding HPO id
@@ -53,41 +71,36 @@ class HpoParser:
 
         :returns: a map from lower-case HPO term labels to HPO ids
         """
-        label_to_id_d = {}
-        for term in self._ontology.terms:
-            hpo_id = term.identifier
-            if not self._ontology.graph.is_ancestor_of(hpotk.constants.hpo.base.PHENOTYPIC_ABNORMALITY, hpo_id):
-                continue
-            label_to_id_d[term.name.lower()] = hpo_id.value
-            # Add the labels of the synonyms
-            if term.synonyms is not None and len(term.synonyms) > 0:
-                for synonym in term.synonyms:
-                    lc_syn = synonym.name.lower()
-                    # only take synonyms with length at least 5 to avoid spurious matches
-                    if len(lc_syn) > 4:
-                        label_to_id_d[lc_syn] = hpo_id.value
-
-        return label_to_id_d
+        if self._label_to_id_d is None:
+            self._load_maps()
+        return self._label_to_id_d
 
     def get_id_to_label_map(self) -> typing.Mapping[str, str]:
         """
         :returns: a map from HPO term ids to HPO labels
         :rtype: Dict[str,str]
         """
-        id_to_label_d = {}
-
-        for term in self._ontology.terms:
-            id_to_label_d[term.identifier.value] = term.name
-
-        return id_to_label_d
+        if self._id_to_label_d is None:
+            self._load_maps()
+        return self._id_to_label_d
 
-    def get_hpo_concept_recognizer(self, hp_cr_index:str=None) -> HpoConceptRecognizer:
+    def get_hpo_concept_recognizer(self, hp_cr_index:str=None, aho_corasick:bool=False) -> HpoConceptRecognizer:
+        """
+        :param hp_cr_index: path to a FastHPOCR index. If provided, a FastHPOCR-based recognizer is returned
+        :param aho_corasick: if True, return a recognizer that matches all HPO labels and synonyms in a single pass over the text
+        :returns: an HPO concept recognizer
+        """
         if hp_cr_index:
             return HpoFastHPOCRConceptRecognizer(
                 label_to_id=self.get_label_to_id_map(),
                 id_to_primary_label=self.get_id_to_label_map(),
                 hp_cr_index=hp_cr_index
             )
+        if aho_corasick:
+            return HpoAhoCorasickConceptRecognizer(
+                label_to_id=self.get_label_to_id_map(),
+                id_to_primary_label=self.get_id_to_label_map(),
+            )
         return HpoExactConceptRecognizer(
             label_to_id=self.get_label_to_id_map(),
             id_to_primary_label=self.get_id_to_label_map(),
@@ -12,6 +12,7 @@ from .hp_term import HpTerm
 from .hgvs_variant import Variant
 from .metadata import MetaData, Resource
 from .pyphetools_age import PyPheToolsAge, AgeSorter
+from ..pp.parse import PhenopacketArchiveWriter
 from ..pp.v202 import TimeElement as TimeElement202
 from ..pp.v202 import VitalStatus as VitalStatus202
 from ..pp.v202 import OntologyClass as OntologyClass202
@@ -378,6 +379,32 @@ class Individual:
                 written += 1
         print(f"We output {written} GA4GH phenopackets to the directory {outdir}")
 
+    @staticmethod
+    def output_individuals_as_phenopacket_archive(individual_list, metadata: MetaData, fpath: str, compress: bool = True):
+        """write a list of Individual objects into a single binary archive of GA4GH phenopackets
+
+        The archive can be read with :class:`pyphetools.pp.parse.PhenopacketArchiveReader`, which provides
+        access to the phenopackets by id without decoding the entire file.
+
+        :param individual_list: List of individuals to be written to file as phenopackets
+        :type individual_list: List[Individual]
+        :param metadata: pyphetools MetaData object
+        :type metadata: MetaData
+        :param fpath: Path to the output archive file
+        :type fpath: str
+        :param compress: If True (default), compress each phenopacket
+        :type compress: bool
+        """
+        if not isinstance(metadata, MetaData):
+            raise ValueError(
+                f"metadata argument must be pyphetools MetaData object (not GA4GH metadata message), but was {type(metadata)}")
+        written = 0
+        with PhenopacketArchiveWriter(fpath, compress=compress) as writer:
+            for individual in individual_list:
+                writer.write(individual.to_ga4gh_phenopacket(metadata=metadata))
+                written += 1
+        print(f"We output {written} GA4GH phenopackets to the archive {fpath}")
+
     @staticmethod
     def from_ga4gh_metadata(mdata: PPKt.MetaData) -> MetaData:
         created_by = mdata.created_by
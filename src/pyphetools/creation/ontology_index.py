@@ -0,0 +1,236 @@
+import typing
+from collections import OrderedDict
+
+import hpotk
+import numpy as np
+
+
+class OntologyIndex:
+    """
+    Precomputed ancestor/descendant closure of an ontology graph.
+
+    Each term of the ontology graph gets an integer index, and the ancestors (transitive closure of the *is_a* relation)
+    of each term are stored in compressed sparse row (CSR) form, i.e., the ancestors of the term with index `i` are
+    `indices[indptr[i]:indptr[i+1]]`. Ancestor sets are additionally kept as frozensets, so that queries such as
+    `is_ancestor_of` are answered in constant time rather than by traversing the graph.
+
+    The index is meant to be built once per HPO release and shared by all classes that need ancestor queries
+    (e.g., :class:`OntologyQC`, :class:`FocusCountTable`, :class:`HpoCategorySet`). Use :meth:`for_ontology` to get
+    the shared instance.
+
+    The semantics of the queries match those of `hpotk.graph.OntologyGraph`: a term is not its own ancestor or
+    descendant unless `include_source=True` is passed.
+
+    :param ontology: reference to the HPO (or another hpo-toolkit ontology)
+    :type ontology: hpotk.MinimalOntology
+    """
+    # maximum number of shared indices (ontology releases) that are kept
+    MAX_SHARED = 8
+    _shared = OrderedDict()
+
+    def __init__(self, ontology: hpotk.MinimalOntology):
+        self._version = ontology.version
+        graph = ontology.graph
+        self._idx_to_id = [node.value for node in graph]
+        self._id_to_idx = {term_id: idx for idx, term_id in enumerate(self._idx_to_id)}
+        n_terms = len(self._idx_to_id)
+        parents = [[self._id_to_idx[p.value] for p in graph.get_parents(node)] for node in graph]
+        ancestors = [None] * n_terms
+        for start in range(n_terms):
+            if ancestors[start] is not None:
+                continue
+            # iterative depth-first traversal that computes the ancestors of the parents before those of the child
+            stack = [start]
+            while stack:
+                idx = stack[-1]
+                pending = [p for p in parents[idx] if ancestors[p] is None]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                if ancestors[idx] is not None:
+                    continue
+                anc = set(parents[idx])
+                for p in parents[idx]:
+                    anc.update(ancestors[p])
+                ancestors[idx] = frozenset(anc)
+        self._ancestors = ancestors
+        descendants = [[] for _ in range(n_terms)]
+        for idx, anc in enumerate(ancestors):
+            for a in anc:
+                descendants[a].append(idx)
+        self._descendants = [frozenset(desc) for desc in descendants]
+        self._anc_indptr, self._anc_indices = OntologyIndex._to_csr(self._ancestors)
+        self._desc_indptr, self._desc_indices = OntologyIndex._to_csr(self._descendants)
+
+    @staticmethod
+    def _to_csr(sets: typing.List[typing.FrozenSet[int]]) -> typing.Tuple[np.ndarray, np.ndarray]:
+        indptr = np.zeros(len(sets) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(s) for s in sets])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        for i, s in enumerate(sets):
+            indices[indptr[i]:indptr[i + 1]] = sorted(s)
+        return indptr, indices
+
+    @staticmethod
+    def for_ontology(ontology: hpotk.MinimalOntology) -> "OntologyIndex":
+        """
+        Get the index for the ontology. The index is built the first time it is requested for a given ontology
+        release (version and number of terms) and shared afterwards. The indices of the `MAX_SHARED` most recently
+        requested releases are kept.
+
+        :param ontology: reference to the HPO
+        :type ontology: hpotk.MinimalOntology
+        :returns: the shared index for the ontology release
+        :rtype: OntologyIndex
+        """
+        # Ontologies without a version cannot be identified across instances, so we use the object identity. The cache
+        # entry keeps a reference to the ontology, so that its id cannot be reused by another object. The term count is
+        # part of the version key, so that an edited hp.json file that kept the version of its release gets its own index
+        if ontology.version is not None:
+            key = ("version", ontology.version, len(ontology))
+            owner = None
+        else:
+            key = ("id", id(ontology))
+            owner = ontology
+        entry = OntologyIndex._shared.get(key)
+        if entry is not None and entry[0] is owner:
+            OntologyIndex._shared.move_to_end(key)
+            return entry[1]
+        index = OntologyIndex(ontology)
+        OntologyIndex._shared[key] = (owner, index)
+        OntologyIndex._shared.move_to_end(key)
+        if len(OntologyIndex._shared) > OntologyIndex.MAX_SHARED:
+            OntologyIndex._shared.popitem(last=False)
+        return index
+
+    @property
+    def version(self) -> typing.Optional[str]:
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._idx_to_id)
+
+    def __contains__(self, term_id) -> bool:
+        return OntologyIndex._to_curie(term_id) in self._id_to_idx
+
+    @staticmethod
+    def _to_curie(term_id) -> str:
+        if isinstance(term_id, str):
+            return term_id
+        elif isinstance(term_id, hpotk.TermId):
+            return term_id.value
+        else:
+            raise ValueError(f"term_id argument must be string (CURIE) or TermId object but was {type(term_id)}")
+
+    def get_idx(self, term_id) -> typing.Optional[int]:
+        """
+        :param term_id: a CURIE such as HP:0001166 or a TermId
+        :returns: the integer index of the term or None if the term is not in the ontology graph
+        """
+        return self._id_to_idx.get(OntologyIndex._to_curie(term_id))
+
+    def get_term_id(self, idx: int) -> str:
+        """
+        :param idx: integer index of a term
+        :returns: the CURIE of the term, e.g., HP:0001166
+        """
+        return self._idx_to_id[idx]
+
+    def _require_idx(self, term_id) -> int:
+        idx = self.get_idx(term_id)
+        if idx is None:
+            raise ValueError(f"No graph node found for {term_id}")
+        return idx
+
+    def get_ancestor_idx(self, idx: int) -> typing.FrozenSet[int]:
+        """
+        :param idx: integer index of a term
+        :returns: the indices of all ancestors of the term (the term itself is not included)
+        """
+        return self._ancestors[idx]
+
+    def get_descendant_idx(self, idx: int) -> typing.FrozenSet[int]:
+        """
+        :param idx: integer index of a term
+        :returns: the indices of all descendants of the term (the term itself is not included)
+        """
+        return self._descendants[idx]
+
+    def get_ancestors(self, term_id, include_source: bool = False) -> typing.Set[str]:
+        """
+        :param term_id: a CURIE such as HP:0001166 or a TermId
+        :param include_source: if True, include the term itself
+        :returns: the CURIEs of all ancestors of the term
+        :raises ValueError: if the term is not in the ontology graph
+        """
+        idx = self._require_idx(term_id)
+        ancestors = {self._idx_to_id[a] for a in self._ancestors[idx]}
+        if include_source:
+            ancestors.add(self._idx_to_id[idx])
+        return ancestors
+
+    def get_descendants(self, term_id, include_source: bool = False) -> typing.Set[str]:
+        """
+        :param term_id: a CURIE such as HP:0001166 or a TermId
+        :param include_source: if True, include the term itself
+        :returns: the CURIEs of all descendants of the term
+        :raises ValueError: if the term is not in the ontology graph
+        """
+        idx = self._require_idx(term_id)
+        descendants = {self._idx_to_id[d] for d in self._descendants[idx]}
+        if include_source:
+            descendants.add(self._idx_to_id[idx])
+        return descendants
+
+    def is_ancestor_of(self, sub, obj) -> bool:
+        """
+        :param sub: a CURIE or TermId
+        :param obj: a CURIE or TermId
+        :returns: True if `sub` is an ancestor of `obj`
+        :raises ValueError: if `obj` is not in the ontology graph
+        """
+        obj_idx = self._require_idx(obj)
+        sub_idx = self.get_idx(sub)
+        if sub_idx is None:
+            return False
+        return sub_idx in self._ancestors[obj_idx]
+
+    def is_descendant_of(self, sub, obj) -> bool:
+        """
+        :param sub: a CURIE or TermId
+        :param obj: a CURIE or TermId
+        :returns: True if `sub` is a descendant of `obj`
+        :raises ValueError: if `sub` is not in the ontology graph
+        """
+        return self.is_ancestor_of(obj, sub)
+
+    def get_ancestor_csr(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        :returns: the `(indptr, indices)` arrays with the ancestors of all terms in CSR form
+        """
+        return self._anc_indptr, self._anc_indices
+
+    def get_descendant_csr(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        :returns: the `(indptr, indices)` arrays with the descendants of all terms in CSR form
+        """
+        return self._desc_indptr, self._desc_indices
+
+    def get_ancestor_union_idx(self, idx_list: typing.Iterable[int], include_source: bool = False) -> np.ndarray:
+        """
+        Vectorized lookup of the ancestors of several terms at once.
+
+        :param idx_list: integer indices of terms
+        :param include_source: if True, include the terms themselves
+        :returns: sorted array with the indices of the union of the ancestors of the terms
+        """
+        idx_array = np.asarray(list(idx_list), dtype=np.int64)
+        if len(idx_array) == 0:
+            return np.empty(0, dtype=np.int32)
+        starts = self._anc_indptr[idx_array]
+        ends = self._anc_indptr[idx_array + 1]
+        parts = [self._anc_indices[s:e] for s, e in zip(starts, ends)]
+        if include_source:
+            parts.append(idx_array.astype(np.int32))
+        return np.unique(np.concatenate(parts))
@@ -1,7 +1,7 @@
 from .hp_term import HpTerm
-from .column_mapper import ColumnMapper
+from .column_mapper import ColumnMapper, DEFAULT_CELL_CACHE_SIZE
 from .hpo_cr import HpoConceptRecognizer
-from typing import List, Set
+from typing import List, Optional, Set
 import pandas as pd
 import re
 from collections import defaultdict
@@ -23,12 +23,16 @@ class OptionColumnMapper(ColumnMapper):
 
     :param omitSet: set of strings to be excluded from concept recognition
     :type omitSet: Set[str]
+    :param cache_size: maximum number of distinct cell values whose mapping is cached (None: no limit)
+    :type cache_size: Optional[int]
     """
+    _cache_cell_results = True
 
-    def __init__(self, column_name:str, concept_recognizer, option_d, excluded_d=None, omitSet:Set[str]=None):
+    def __init__(self, column_name:str, concept_recognizer, option_d, excluded_d=None, omitSet:Set[str]=None,
+                 cache_size:Optional[int]=DEFAULT_CELL_CACHE_SIZE):
         """Constructor
         """
-        super().__init__(column_name=column_name)
+        super().__init__(column_name=column_name, cache_size=cache_size)
         # Either have self._option_d be an empty dictionary or it must be a valid dictionary
         if option_d is None or not isinstance(option_d, dict):
             raise ValueError(f"option_d argument must be dictionary but was {type(option_d)}")
@@ -88,7 +92,7 @@ class OptionColumnMapper(ColumnMapper):
         mapping_counter = defaultdict(int)
         for _, value in column.items():
             cell_contents = str(value)
-            term_list = self.map_cell(cell_contents)
+            term_list = self.map_cell_cached(cell_contents)
             for hpterm in term_list:
                 mapped = f"{hpterm.hpo_term_and_id} ({hpterm.display_value})"
                 mapping_counter[mapped] += 1
@@ -140,14 +144,15 @@ class OptionColumnMapper(ColumnMapper):
             if original_column_name in omit_columns:
                 continue
             temp_dict = {}
+            entries = []
             for i in range(len(df)):
                 if len(str(df.iloc[i, y])) > 1:
-                    for entry in str(df.iloc[i, y]).split(delimiter):
-                        hpo_term = hpo_cr.parse_cell(entry.strip())
-                        if len(hpo_term) > 0:
-                            temp_dict[entry.strip()] = hpo_term[0].label
-                        else:
-                            temp_dict[entry.strip()] = 'PLACEHOLDER'
+                    entries.extend(entry.strip() for entry in str(df.iloc[i, y]).split(delimiter))
+            for entry, hpo_term in zip(entries, hpo_cr.parse_cells(entries)):
+                if len(hpo_term) > 0:
+                    temp_dict[entry] = hpo_term[0].label
+                else:
+                    temp_dict[entry] = 'PLACEHOLDER'
 
             # skip columns that are unlikely to be interesting for the OptionColumnMapper
             if "patient" in col_name:
@@ -1,3 +1,6 @@
+from typing import List, Optional
+
+import numpy as np
 import pandas as pd
 from collections import defaultdict
 from .constants import Constants
@@ -42,6 +45,37 @@ class SexColumnMapper:
         if self._not_provided:
             return Constants.UNKNOWN_SEX_SYMBOL
         contents = cell_contents.strip()
+        sex = self._get_sex_symbol(contents)
+        if sex is None:
+            self._erroneous_input_counter[contents] += 1
+            return Constants.UNKNOWN_SEX_SYMBOL
+        return sex
+
+    def map_column(self, column: pd.Series) -> List[str]:
+        """Map all cells of a column, examining each distinct cell value only once
+
+        :param column: the sex column of the pandas DataFrame
+        :type column: pd.Series
+        :returns: the sex symbol for each cell
+        :rtype: List[str]
+        """
+        if self._not_provided:
+            return [Constants.UNKNOWN_SEX_SYMBOL] * len(column)
+        codes, uniques = pd.factorize(column.str.strip(), use_na_sentinel=False)
+        counts = np.bincount(codes, minlength=len(uniques))
+        symbols = []
+        for contents, count in zip(uniques, counts):
+            sex = self._get_sex_symbol(contents)
+            if sex is None:
+                self._erroneous_input_counter[contents] += int(count)
+                sex = Constants.UNKNOWN_SEX_SYMBOL
+            symbols.append(sex)
+        return [symbols[code] for code in codes]
+
+    def _get_sex_symbol(self, contents: str) -> Optional[str]:
+        """
+        :returns: the sex symbol for the (stripped) cell contents or None if the contents are not recognized
+        """
         if contents == self._female_symbol:
             return Constants.FEMALE_SYMBOL
         elif contents == self._male_symbol:
@@ -51,8 +85,7 @@ class SexColumnMapper:
         elif contents == self._unknown_symbol:
             return Constants.UNKNOWN_SEX_SYMBOL
         else:
-            self._erroneous_input_counter[contents] += 1
-            return Constants.UNKNOWN_SEX_SYMBOL
+            return None
 
     def preview_column(self, df:pd.DataFrame):
         if not isinstance(df, pd.DataFrame):
@@ -1,7 +1,7 @@
 from .hp_term import HpTerm
-from .column_mapper import ColumnMapper
+from .column_mapper import ColumnMapper, DEFAULT_CELL_CACHE_SIZE
 from .pyphetools_age import IsoAge
-from typing import List
+from typing import List, Optional
 import pandas as pd
 import re
 from collections import defaultdict
@@ -19,11 +19,13 @@ def get_separate_hpos_from_df(df, hpo_cr):
     :rtype: List[List[HpTerm]]
     """
     additional_hpos = []
-
+    n_columns = df.shape[1]
+    # parse the cells row by row in a single batch
+    cells = [df.iloc[i, y] for i in range(len(df)) for y in range(n_columns)]
+    hpo_terms = hpo_cr.parse_cells(cells)
     for i in range(len(df)):
         temp_hpos = []
-        for y in range(df.shape[1]):
-            hpo_term = hpo_cr.parse_cell(df.iloc[i, y])
+        for hpo_term in hpo_terms[i * n_columns:(i + 1) * n_columns]:
             if len(hpo_term) > 0:
                 temp_hpos.extend(hpo_term)
         additional_hpos.append(list(set(temp_hpos)))
@@ -44,12 +46,17 @@ class SimpleColumnMapper(ColumnMapper):
     :type excluded: str
     :param non_measured: symbol used if the feature was not measured or is N/A. Defaults to None, optional
     :type non_measured: str
+    :param cache_size: maximum number of distinct cell values whose mapping is cached (None: no limit)
+    :type cache_size: Optional[int]
     """
-    def __init__(self, column_name, hpo_id, hpo_label, observed=None, excluded=None, non_measured=None):
+    _cache_cell_results = True
+
+    def __init__(self, column_name, hpo_id, hpo_label, observed=None, excluded=None, non_measured=None,
+                 cache_size:Optional[int]=DEFAULT_CELL_CACHE_SIZE):
         """
         Constructor
         """
-        super().__init__(column_name=column_name)
+        super().__init__(column_name=column_name, cache_size=cache_size)
         self._hpo_id = hpo_id
         self._hpo_label = hpo_label
         if observed is None or excluded is None:
@@ -81,7 +88,7 @@ class SimpleColumnMapper(ColumnMapper):
         mapping_counter = defaultdict(int)
         for _, value in column.items():
             cell_contents = str(value)
-            value = self.map_cell(cell_contents)
+            value = self.map_cell_cached(cell_contents)
             hpterm = value[0]
             mapped = f"original value: \"{cell_contents}\" -> HP: {hpterm.hpo_term_and_id} ({hpterm.display_value})"
             mapping_counter[mapped] += 1
@@ -1,15 +1,25 @@
 from .hp_term import HpTerm
-from .column_mapper import ColumnMapper
+from .column_mapper import ColumnMapper, DEFAULT_CELL_CACHE_SIZE
 from .thresholder import Thresholder
-from typing import List
+from typing import List, Optional
 import pandas as pd
 from collections import defaultdict
 
 
 class ThresholdedColumnMapper(ColumnMapper):
+    """ColumnMapper for columns with numerical values that are mapped to HPO terms with a Thresholder
 
-    def __init__(self, column_name, thresholder:Thresholder):
-        super().__init__(column_name=column_name)
+    :param column_name: name of the column in the pandas DataFrame
+    :type column_name: str
+    :param thresholder: Thresholder that maps a value to an HPO term
+    :type thresholder: Thresholder
+    :param cache_size: maximum number of distinct cell values whose mapping is cached (None: no limit)
+    :type cache_size: Optional[int]
+    """
+    _cache_cell_results = True
+
+    def __init__(self, column_name, thresholder:Thresholder, cache_size:Optional[int]=DEFAULT_CELL_CACHE_SIZE):
+        super().__init__(column_name=column_name, cache_size=cache_size)
         self._thresholder = thresholder
 
     def map_cell(self, cell_contents) -> List[HpTerm]:
@@ -26,7 +36,7 @@ class ThresholdedColumnMapper(ColumnMapper):
         column = df[self._column_name]
         mapping_counter = defaultdict(int)
         for _, value in column.items():
-            results = self.map_cell(str(value))
+            results = self.map_cell_cached(str(value))
             if len(results) > 0:
                 hpterm = results[0]
                 mapped = f"{hpterm.hpo_term_and_id}: {hpterm.display_value}"
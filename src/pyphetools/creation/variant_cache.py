@@ -0,0 +1,144 @@
+import contextlib
+import os
+import pickle
+import sqlite3
+import typing
+
+from .hgvs_variant import HgvsVariant
+
+DEFAULT_CACHE_FILENAME = "variant_validator_cache.sqlite"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS variant ("
+    " assembly TEXT NOT NULL,"
+    " transcript TEXT NOT NULL,"
+    " hgvs TEXT NOT NULL,"
+    " payload BLOB NOT NULL,"
+    " PRIMARY KEY (assembly, transcript, hgvs))",
+    "CREATE TABLE IF NOT EXISTS imported_pickle ("
+    " path TEXT PRIMARY KEY,"
+    " mtime REAL NOT NULL)",
+)
+# SQLite limits the number of host parameters of a statement, so we query large batches in chunks
+_CHUNK_SIZE = 500
+
+
+class VariantCache:
+    """
+    Persistent cache of the Variant Validator results, shared by all genes (and notebooks) that use the same file.
+
+    The variants are stored in an SQLite database keyed by (assembly, transcript, HGVS), so looking up the variants
+    of a cohort is an indexed query rather than unpickling the variants of an entire gene, and new variants are
+    inserted incrementally. The database uses write-ahead logging, so several processes can read and write the cache
+    at the same time.
+
+    Previous versions of pyphetools stored one pickle file per gene (`variant_validator_cache_{gene}.pickle`),
+    these files can be added to the cache with :meth:`import_pickle`.
+
+    :param path: path of the database file. The file is created if it does not exist.
+    :type path: str
+    :param timeout: how long to wait for a lock held by another process, in seconds
+    :type timeout: float
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILENAME, timeout: float = 30):
+        if path is None:
+            raise ValueError("path argument must not be None")
+        self._path = path
+        self._timeout = timeout
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextlib.contextmanager
+    def _connect(self) -> typing.Iterator[sqlite3.Connection]:
+        # A connection per operation, so that the cache can be used from several threads and processes
+        conn = sqlite3.connect(self._path, timeout=self._timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, assembly: str, transcript: str, hgvs: str) -> typing.Optional[HgvsVariant]:
+        """
+        :returns: the cached variant or None if the variant is not in the cache
+        """
+        return self.get_many(assembly=assembly, transcript=transcript, hgvs_list=[hgvs]).get(hgvs)
+
+    def get_many(self,
+                 assembly: str,
+                 transcript: str,
+                 hgvs_list: typing.Iterable[str]) -> typing.Dict[str, HgvsVariant]:
+        """
+        :param assembly: the genome assembly, e.g., hg38
+        :param transcript: the transcript of the HGVS strings, e.g., NM_000342.3
+        :param hgvs_list: HGVS strings, e.g., c.36613706dup
+        :returns: dictionary with the cached variants, keyed by HGVS. Variants that are not cached are missing.
+        """
+        hgvs_list = list(dict.fromkeys(hgvs_list))
+        variant_d = {}
+        with self._connect() as conn:
+            for start in range(0, len(hgvs_list), _CHUNK_SIZE):
+                chunk = hgvs_list[start:start + _CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT hgvs, payload FROM variant "
+                    f"WHERE assembly = ? AND transcript = ? AND hgvs IN ({placeholders})",
+                    (assembly, transcript, *chunk))
+                for hgvs, payload in rows:
+                    variant_d[hgvs] = pickle.loads(payload)
+        return variant_d
+
+    def put_many(self, assembly: str, transcript: str, variant_d: typing.Mapping[str, HgvsVariant]) -> None:
+        """
+        Add variants to the cache, replacing previously cached variants with the same key.
+
+        :param assembly: the genome assembly, e.g., hg38
+        :param transcript: the transcript of the HGVS strings, e.g., NM_000342.3
+        :param variant_d: dictionary with HGVS strings as keys and the corresponding variants as values
+        """
+        rows = [(assembly, transcript, hgvs, pickle.dumps(var)) for hgvs, var in variant_d.items()]
+        if len(rows) == 0:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO variant (assembly, transcript, hgvs, payload) VALUES (?, ?, ?, ?)", rows)
+
+    def import_pickle(self, pickle_path: str, assembly: str, transcript: str) -> int:
+        """
+        Add the variants of a pickle file of a previous version of pyphetools to the cache.
+
+        The file is only read again if it changed since it was imported.
+
+        :param pickle_path: path of a file such as `variant_validator_cache_SLC4A1.pickle`
+        :param assembly: the genome assembly of the variants in the file, e.g., hg38
+        :param transcript: the transcript of the HGVS strings in the file, e.g., NM_000342.3
+        :returns: the number of imported variants
+        """
+        if not os.path.isfile(pickle_path):
+            return 0
+        abs_path = os.path.abspath(pickle_path)
+        mtime = os.path.getmtime(abs_path)
+        with self._connect() as conn:
+            row = conn.execute("SELECT mtime FROM imported_pickle WHERE path = ?", (abs_path,)).fetchone()
+        if row is not None and row[0] == mtime:
+            return 0
+        with open(abs_path, "rb") as f:
+            variant_d = pickle.load(f)
+        variant_d = {hgvs: var for hgvs, var in variant_d.items() if isinstance(var, HgvsVariant)}
+        self.put_many(assembly=assembly, transcript=transcript, variant_d=variant_d)
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO imported_pickle (path, mtime) VALUES (?, ?)", (abs_path, mtime))
+        return len(variant_d)
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM variant").fetchone()[0]
@@ -1,46 +1,21 @@
-import os
-import pickle
 import pandas as pd
 from typing import List
 from collections import defaultdict
 from .individual import Individual
-from .variant_validator import VariantValidator
+from .variant_cache import VariantCache, DEFAULT_CACHE_FILENAME
+from .variant_validator import VariantValidator, DEFAULT_BASE_URL
 from .structural_variant import StructuralVariant
 
 
 def get_pickle_filename(name):
     """
-    provide standard filenaming convention. We pickle results from VariantValidator to avoid
-    calling API multiple times in different runs. For instance, the pickled file of variants for
-    the SCL4A1 cohort will be called "variant_validator_cache_SLC4A1.pickle"
+    provide standard filenaming convention. Previous versions of pyphetools pickled the results from VariantValidator
+    in one file per gene, which are now imported into the VariantCache. For instance, the pickled file of variants for
+    the SCL4A1 cohort is called "variant_validator_cache_SLC4A1.pickle"
     """
     return f"variant_validator_cache_{name}.pickle"
 
 
-def load_variant_pickle(name):
-    """
-    Load the pickle file. If the file cannot be found, return None. If it is found, return the
-    pickled object (which in our case will be a dictionary of Variant objects).
-    """
-    fname = get_pickle_filename(name)
-    if not os.path.isfile(fname):
-        return None
-    # De-serialize the object from the file
-    with open(fname, "rb") as f:
-        loaded_object = pickle.load(f)
-        return loaded_object
-
-
-def write_variant_pickle(name, my_object):
-    """
-    Write a dictionary to pickled file
-    :param my_object: In this application, this argument will be a dictionary of Variant objects).
-    """
-    fname = get_pickle_filename(name)
-    with open(fname, "wb") as f:
-        pickle.dump(my_object, f)
-
-
 class VariantManager:
     """This class is designed to extract Variant objects from a pandas DataFrame that represents the input data.
     It will work out of the box for dataframes created by the CaseTemplateEncoder, and can be adapted to work
@@ -79,6 +54,12 @@ class VariantManager:
     :type gene_symbol: str
     :param gene_id: HGNC identifier of affected gene (only required if chromosomal variants need to be coded)
     :type gene_id: str
+    :param overwrite: if True, do not use the cached Variant Validator results
+    :type overwrite: bool
+    :param cache_path: path of the Variant Validator cache shared by all genes (see :class:`VariantCache`)
+    :type cache_path: str
+    :param variant_validator_url: URL of the Variant Validator REST API, e.g., a local server for offline runs
+    :type variant_validator_url: str
     """
 
     def __init__(self,
@@ -89,7 +70,9 @@ class VariantManager:
                  allele_1_column_name: str,
                  allele_2_column_name: str = None,
                  gene_id: str = None,
-                 overwrite: bool = False
+                 overwrite: bool = False,
+                 variant_validator_url: str = DEFAULT_BASE_URL,
+                 cache_path: str = DEFAULT_CACHE_FILENAME,
                  ):
         if not isinstance(df, pd.DataFrame):
             raise ValueError(f"The \"df\" argument must be a pandas DataFrame but was {type(df)}")
@@ -107,6 +90,8 @@ class VariantManager:
         self._allele_2_column_name = allele_2_column_name
         self._gene_symbol = gene_symbol
         self._gene_id = gene_id
+        self._variant_validator_url = variant_validator_url
+        self._cache_path = cache_path
         self._var_d = {}
         self._unmapped_alleles = set()
         self._individual_to_alleles_d = defaultdict(list)
@@ -143,17 +128,17 @@ class VariantManager:
         - self._unmapped_alleles: set of all alleles that do not start eith "c." (non HGVS), that will need intervention by the user to map
         - self._individual_to_alleles_d: key individual ID, value-one or two element list of allele strings
         """
-        if overwrite:
-            v_d = {}
-        else:
-            v_d = load_variant_pickle(self._gene_symbol)
-        if v_d is None:
-            self._var_d = {}
-        else:
-            self._var_d = v_d
         genome_assembly = "hg38"  # Nothing else is good enough, sorry hg19
+        cache = VariantCache(path=self._cache_path)
+        # Results of previous versions of pyphetools were cached in one pickle file per gene
+        cache.import_pickle(pickle_path=get_pickle_filename(self._gene_symbol),
+                            assembly=genome_assembly,
+                            transcript=self._transcript)
+        self._var_d = {}
         variant_set = set()  # we expect HGVS nomenclature. Everything else will be parsed as chromosomal
-        vvalidator = VariantValidator(genome_build=genome_assembly, transcript=self._transcript)
+        vvalidator = VariantValidator(genome_build=genome_assembly,
+                                      transcript=self._transcript,
+                                      base_url=self._variant_validator_url)
         # The DataFrame has two header rows.
         # For CaseTemplateEncoder, the second header row is the first row of the DataFrame, so we drop it here.
         # For CaseTemplateEncoder, the second row will contain "str" in the second row of the PMID column
@@ -186,19 +171,23 @@ class VariantManager:
                     variant_set.add(allele2)
                 else:
                     self._unmapped_alleles.add(allele2)
+        variant_set.difference_update({"na", "n/a"})
+        if not overwrite:
+            self._var_d.update(cache.get_many(assembly=genome_assembly,
+                                              transcript=self._transcript,
+                                              hgvs_list=variant_set))
+        to_encode = []
         for v in variant_set:
             if v in self._var_d:
                 continue
-            if v == "na" or v == "n/a":
-                continue
             print(f"[INFO] encoding variant \"{v}\"")
-            try:
-                var = vvalidator.encode_hgvs(v)
-                self._var_d[v] = var
-            except Exception as e:
-                print(f"[ERROR] Could not retrieve Variant Validator information for {v}: {str(e)}")
-                self._unmapped_alleles.add(v)  # This allows us to use the chromosomal mappers.
-        write_variant_pickle(name=self._gene_symbol, my_object=self._var_d)
+            to_encode.append(v)
+        encoded_d, error_d = vvalidator.encode_hgvs_batch(to_encode)
+        self._var_d.update(encoded_d)
+        cache.put_many(assembly=genome_assembly, transcript=self._transcript, variant_d=encoded_d)
+        for v, e in error_d.items():
+            print(f"[ERROR] Could not retrieve Variant Validator information for {v}: {str(e)}")
+            self._unmapped_alleles.add(v)  # This allows us to use the chromosomal mappers.
 
     def code_as_chromosomal_deletion(self, allele_set) -> None:
         """
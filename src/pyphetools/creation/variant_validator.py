@@ -1,9 +1,19 @@
+import concurrent.futures
+import typing
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from .hgvs_variant import HgvsVariant
 
 
-URL_SCHEME = "https://rest.variantvalidator.org/VariantValidator/variantvalidator/%s/%s%%3A%s/%s?content-type=application%%2Fjson"
+DEFAULT_BASE_URL = "https://rest.variantvalidator.org"
+API_PATH = "/VariantValidator/variantvalidator/%s/%s%%3A%s/%s?content-type=application%%2Fjson"
+URL_SCHEME = DEFAULT_BASE_URL + API_PATH
 ACCEPTABLE_GENOMES = {"GRCh37", "GRCh38", "hg19", "hg38"}
+# Status codes that Variant Validator returns when it is overloaded or rate-limits us
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 
 
@@ -18,16 +28,48 @@ class VariantValidator:
     :type genome_build: str
     :param transcript: An mRNA transcript that is the reference for the HGVS string, opt
     :type transcript: str
+    :param base_url: URL of the Variant Validator REST API, e.g., a local server with recorded responses for tests
+    :type base_url: str
+    :param timeout: timeout of a request, in seconds
+    :type timeout: float
+    :param max_retries: number of retries of a failed request, with exponential backoff
+    :type max_retries: int
+    :param backoff_factor: the delay before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds
+    :type backoff_factor: float
+    :param max_workers: maximum number of concurrent requests of :meth:`encode_hgvs_batch`
+    :type max_workers: int
     """
 
-    def __init__(self, genome_build, transcript=None):
+    def __init__(self,
+                 genome_build,
+                 transcript=None,
+                 base_url: str = DEFAULT_BASE_URL,
+                 timeout: float = 30,
+                 max_retries: int = 3,
+                 backoff_factor: float = 1.0,
+                 max_workers: int = 4):
         """
         Constructor
         """
         if genome_build not in ACCEPTABLE_GENOMES:
             raise ValueError(f"genome_build \"{genome_build}\" not recognized")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 but was {max_workers}")
         self._genome_assembly = genome_build
         self._transcript = transcript
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._max_workers = max_workers
+        # One session for all requests, so that connections to the server are reused
+        retry = Retry(total=max_retries,
+                      backoff_factor=backoff_factor,
+                      status_forcelist=RETRY_STATUS_CODES,
+                      allowed_methods=["GET"],
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def encode_hgvs(self, hgvs, custom_transcript=None):
         """
@@ -46,14 +88,49 @@ class VariantValidator:
             transcript = self._transcript
         else:
             raise ValueError("Cannot run variant validator without transcript")
-        api_url = URL_SCHEME % (self._genome_assembly, transcript, hgvs, transcript)
+        api_url = self._base_url + API_PATH % (self._genome_assembly, transcript, hgvs, transcript)
         #f"https://rest.variantvalidator.org/VariantValidator/variantvalidator/{self._genome_assembly}/{transcript}%3A{hgvs}/{transcript}"
         #
         print(api_url)
-        response = requests.get(api_url)
+        response = self._session.get(api_url, timeout=self._timeout)
+        response.raise_for_status()
+        return self._parse_response(response.json())
+
+    def encode_hgvs_batch(self,
+                          hgvs_list: typing.Iterable[str],
+                          custom_transcript=None,
+                          ) -> typing.Tuple[typing.Dict[str, HgvsVariant], typing.Dict[str, Exception]]:
+        """
+        Encode several HGVS strings, running up to `max_workers` requests concurrently.
+
+        A failure to encode one HGVS string does not stop the others, the errors are returned instead.
+
+        :param hgvs_list: HGVS representations of variants, e.g., c.36613706dup. Duplicates are encoded once.
+        :type hgvs_list: typing.Iterable[str]
+        :param custom_transcript: a transcript (e.g., NM_001848.2), if different from the default transcript, optional
+        :type custom_transcript: str
+        :returns: a tuple with a dictionary of the encoded variants and a dictionary of the errors, keyed by HGVS
+        :rtype: typing.Tuple[typing.Dict[str, HgvsVariant], typing.Dict[str, Exception]]
+        """
+        unique_hgvs = list(dict.fromkeys(hgvs_list))
+        variants = {}
+        errors = {}
+        if len(unique_hgvs) == 0:
+            return variants, errors
+        n_workers = min(self._max_workers, len(unique_hgvs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(self.encode_hgvs, hgvs, custom_transcript) for hgvs in unique_hgvs]
+            # Collect in the order of the input, so the results do not depend on the order in which requests finish
+            for hgvs, future in zip(unique_hgvs, futures):
+                try:
+                    variants[hgvs] = future.result()
+                except Exception as e:
+                    errors[hgvs] = e
+        return variants, errors
+
+    def _parse_response(self, vv_dict: typing.Dict) -> HgvsVariant:
         # We expect to get a dictionary with three keys. The first is the name of the variant, e.g., ACC:HGVS, then we
         # get flag and metadata
-        vv_dict = response.json()
         if 'flag' in vv_dict:
             if vv_dict['flag'] != 'gene_variant':
                 flag = vv_dict['flag']
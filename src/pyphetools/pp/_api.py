@@ -11,6 +11,7 @@ from .parse import Serializable, Deserializable, FromProtobuf, ToProtobuf
 
 class MessageMixin(Serializable, Deserializable, FromProtobuf, ToProtobuf,
                    metaclass=abc.ABCMeta):
+    __slots__ = ()
 
     # MANDATORY
     @abc.abstractmethod
@@ -63,6 +63,8 @@ class Timestamp(ToProtobuf, FromProtobuf):
     '1970-01-01T00:00:30Z'
     """
 
+    __slots__ = ('_seconds', '_nanos')
+
     def __init__(
             self,
             seconds: int,
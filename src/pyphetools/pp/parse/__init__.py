@@ -3,6 +3,7 @@ A package to support the (de)serialization of phenopacket schema elements to/fro
 such as JSON, YAML, and protobuf.
 """
 from . import json
+from ._archive import PhenopacketArchiveWriter, PhenopacketArchiveReader
 from ._io import Serializer, Serializable, Deserializer, Deserializable
 from ._io import extract_message_scalar, extract_message_sequence, extract_oneof_scalar
 from ._pb import FromProtobuf, ToProtobuf
@@ -11,4 +12,5 @@ from ._pb import extract_pb_message_scalar, extract_pb_message_seq, extract_pb_o
 __all__ = [
     'Serializer', 'Serializable', 'Deserializer', 'Deserializable',
     'FromProtobuf', 'ToProtobuf',
+    'PhenopacketArchiveWriter', 'PhenopacketArchiveReader',
 ]
@@ -0,0 +1,261 @@
+import io
+import os
+import struct
+import typing
+import zlib
+
+import phenopackets as pp202
+
+from google.protobuf.message import Message
+
+from ._pb import ToProtobuf, FromProtobuf
+
+_HEADER_MAGIC = b'PPKTARC1'
+_TRAILER_MAGIC = b'PPKTIDX1'
+# index offset, number of records, magic
+_TRAILER = struct.Struct('<QQ8s')
+_FLAG_ZLIB = 0x01
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(bits | 0x80)
+        else:
+            out.append(bits)
+            return bytes(out)
+
+
+def _decode_varint(buf: typing.Union[bytes, memoryview], pos: int) -> typing.Tuple[int, int]:
+    """
+    :returns: a tuple with the decoded value and the position of the first byte after the varint
+    """
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _read_varint(fh: typing.BinaryIO) -> int:
+    result = 0
+    shift = 0
+    while True:
+        b = fh.read(1)
+        if len(b) == 0:
+            raise ValueError('Unexpected end of archive while reading a record length')
+        result |= (b[0] & 0x7F) << shift
+        if not b[0] & 0x80:
+            return result
+        shift += 7
+
+
+class PhenopacketArchiveWriter:
+    """
+    Write a collection of phenopackets into a single binary archive file.
+
+    The archive consists of a short header, the phenopackets as length-delimited Protobuf messages
+    (optionally compressed one by one with zlib), and an index with the offset of each phenopacket,
+    which allows :class:`PhenopacketArchiveReader` to get a phenopacket by its ID without decoding the other records.
+
+    **Example**
+
+    >>> import os, tempfile
+    >>> from pyphetools.pp.v202 import Phenopacket, Individual, MetaData
+    >>> from pyphetools.pp import Timestamp
+    >>> from pyphetools.pp.parse import PhenopacketArchiveWriter, PhenopacketArchiveReader
+    >>> pp = Phenopacket(
+    ...   id='example.id',
+    ...   subject=Individual(id='proband A'),
+    ...   meta_data=MetaData(created=Timestamp.from_str('2021-05-14T10:35:00Z'), created_by='anonymous biocurator'),
+    ... )
+    >>> fpath = os.path.join(tempfile.mkdtemp(), 'cohort.ppkts')
+    >>> with PhenopacketArchiveWriter(fpath, compress=True) as writer:
+    ...   writer.write(pp)
+    >>> with PhenopacketArchiveReader(fpath, clz=Phenopacket) as reader:
+    ...   reader.get('example.id').subject.id
+    'proband A'
+
+    :param fpath: path of the archive file
+    :param compress: if True, compress each phenopacket with zlib
+    """
+
+    def __init__(
+            self,
+            fpath: str,
+            compress: bool = False,
+    ):
+        self._fh = open(fpath, 'wb')
+        self._compress = compress
+        self._index = {}
+        self._fh.write(_HEADER_MAGIC)
+        self._fh.write(bytes([_FLAG_ZLIB if compress else 0]))
+
+    def write(self, phenopacket: typing.Union[pp202.Phenopacket, ToProtobuf]):
+        """
+        Append a phenopacket to the archive.
+
+        :param phenopacket: a Protobuf `Phenopacket` message or an object that can be converted into one
+          (e.g. :class:`pyphetools.pp.v202.Phenopacket`).
+        :raises ValueError: if a phenopacket with the same ID was already written
+        """
+        if isinstance(phenopacket, ToProtobuf):
+            msg = phenopacket.to_message()
+        elif isinstance(phenopacket, Message):
+            msg = phenopacket
+        else:
+            raise ValueError(f'Cannot write {type(phenopacket)} into a phenopacket archive')
+        if msg.id in self._index:
+            raise ValueError(f'A phenopacket with ID {msg.id} was already written to the archive')
+        payload = msg.SerializeToString()
+        if self._compress:
+            payload = zlib.compress(payload)
+        self._index[msg.id] = self._fh.tell()
+        self._fh.write(_encode_varint(len(payload)))
+        self._fh.write(payload)
+
+    def close(self):
+        """
+        Write the index and close the archive file.
+        """
+        if self._fh.closed:
+            return
+        index_offset = self._fh.tell()
+        buf = io.BytesIO()
+        for pp_id, offset in self._index.items():
+            encoded_id = pp_id.encode('utf-8')
+            buf.write(_encode_varint(len(encoded_id)))
+            buf.write(encoded_id)
+            buf.write(_encode_varint(offset))
+        self._fh.write(buf.getvalue())
+        self._fh.write(_TRAILER.pack(index_offset, len(self._index), _TRAILER_MAGIC))
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Do not write the index, so that the reader rejects the incomplete archive
+            self._fh.close()
+
+
+class PhenopacketArchiveReader:
+    """
+    Read phenopackets from an archive created by :class:`PhenopacketArchiveWriter`.
+
+    Only the index is read when the archive is opened. A phenopacket is decoded when it is requested,
+    either by ID (:meth:`get`) or by iterating over the archive.
+
+    :param fpath: path of the archive file
+    :param clz: an optional class (e.g. :class:`pyphetools.pp.v202.Phenopacket`) to decode the phenopackets into.
+      Protobuf `Phenopacket` messages are returned if `clz` is `None`.
+    """
+
+    def __init__(
+            self,
+            fpath: str,
+            clz: typing.Optional[typing.Type[FromProtobuf]] = None,
+    ):
+        self._fh = open(fpath, 'rb')
+        self._clz = clz
+        magic = self._fh.read(len(_HEADER_MAGIC))
+        if magic != _HEADER_MAGIC:
+            self._fh.close()
+            raise ValueError(f'{fpath} is not a phenopacket archive')
+        if os.fstat(self._fh.fileno()).st_size < len(_HEADER_MAGIC) + 1 + _TRAILER.size:
+            self._fh.close()
+            raise ValueError(f'{fpath} is truncated or was not closed properly')
+        self._compressed = bool(self._fh.read(1)[0] & _FLAG_ZLIB)
+        self._data_offset = self._fh.tell()
+
+        self._fh.seek(-_TRAILER.size, os.SEEK_END)
+        self._index_offset, n_records, trailer_magic = _TRAILER.unpack(self._fh.read(_TRAILER.size))
+        if trailer_magic != _TRAILER_MAGIC:
+            self._fh.close()
+            raise ValueError(f'{fpath} is truncated or was not closed properly')
+        self._index = {}
+        try:
+            self._fh.seek(self._index_offset)
+            index_bytes = self._fh.read()[:-_TRAILER.size]
+            pos = 0
+            for _ in range(n_records):
+                id_len, pos = _decode_varint(index_bytes, pos)
+                if pos + id_len > len(index_bytes):
+                    raise IndexError('phenopacket ID extends past the end of the index')
+                pp_id = index_bytes[pos:pos + id_len].decode('utf-8')
+                pos += id_len
+                offset, pos = _decode_varint(index_bytes, pos)
+                self._index[pp_id] = offset
+        except (IndexError, UnicodeDecodeError, ValueError, OSError):
+            self._fh.close()
+            raise ValueError(f'{fpath} has a corrupt index')
+
+    def ids(self) -> typing.Sequence[str]:
+        """
+        :returns: the IDs of the phenopackets in the order in which they were written
+        """
+        return list(self._index.keys())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, pp_id: str) -> bool:
+        return pp_id in self._index
+
+    def _read_payload(self) -> bytes:
+        length = _read_varint(self._fh)
+        payload = self._fh.read(length)
+        if self._compressed:
+            payload = zlib.decompress(payload)
+        return payload
+
+    def _decode(self, payload: bytes):
+        if self._clz is None:
+            return pp202.Phenopacket.FromString(payload)
+        return self._clz.from_bytes(payload)
+
+    def get_bytes(self, pp_id: str) -> bytes:
+        """
+        :param pp_id: phenopacket ID
+        :returns: the serialized (uncompressed) Protobuf bytes of the phenopacket
+        :raises KeyError: if there is no phenopacket with the ID
+        """
+        self._fh.seek(self._index[pp_id])
+        return self._read_payload()
+
+    def get(self, pp_id: str):
+        """
+        :param pp_id: phenopacket ID
+        :returns: the decoded phenopacket
+        :raises KeyError: if there is no phenopacket with the ID
+        """
+        return self._decode(self.get_bytes(pp_id))
+
+    def __iter__(self) -> typing.Iterator:
+        self._fh.seek(self._data_offset)
+        pos = self._data_offset
+        while pos < self._index_offset:
+            payload = self._read_payload()
+            pos = self._fh.tell()
+            yield self._decode(payload)
+            # `get` may have moved the file handle while the caller processed the phenopacket
+            self._fh.seek(pos)
+
+    def close(self):
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
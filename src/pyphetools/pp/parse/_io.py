@@ -1,8 +1,11 @@
 import abc
 import enum
 import io
+import operator
 import typing
 
+from ._util import HierarchicalKeyMapper
+
 
 class Serializable(metaclass=abc.ABCMeta):
     """
@@ -16,6 +19,8 @@ class Serializable(metaclass=abc.ABCMeta):
     The mixin requirements include a single method: :func:`field_names` and the other functionality then comes for free.
     """
 
+    __slots__ = ()
+
     _PRIMITIVES = {
         bool, int, float, str,
     }
@@ -33,70 +38,151 @@ class Serializable(metaclass=abc.ABCMeta):
         """
         Write itself into a dictionary composed of primitive or Python compound types.
         """
-        for name in self.field_names():
-            field = getattr(self, name)
-            Serializable._put_field_to_mapping(name, field, out)
+        _SNAKE_CASE_WRITER.write_into(self, out)
 
-    @staticmethod
-    def _put_field_to_mapping(
-            name: str,
-            field: typing.Optional[typing.Any],
+
+# Value kinds of `DictWriter`. We start from `1` to be able to use `or` on a cache lookup.
+_PRIMITIVE, _MESSAGE, _SEQUENCE, _MAPPING, _ENUM, _TIMESTAMP = range(1, 7)
+
+
+class DictWriter:
+    # Not part of the public API!
+    """
+    `DictWriter` writes :class:`Serializable` objects into a hierarchy of `dict`s, `list`s, and primitive types.
+
+    The field names of each class, the corresponding keys, and a getter of all fields are compiled once per class.
+    The kind of each value (primitive, message, sequence, ...) is resolved once per value type,
+    so that the `isinstance` checks against the abstract base classes are not repeated for every value.
+
+    :param key_func: a function to compute the key of a field (e.g. to convert the field name into camel case)
+      or `None` if the field names should be used as keys.
+    :param blacklist: an iterable of `str` with names of map fields whose keys should not be subject
+      of the `key_func`.
+    """
+
+    def __init__(
+            self,
+            key_func: typing.Optional[typing.Callable[[str], str]] = None,
+            blacklist: typing.Iterable[str] = (),
+    ):
+        self._key_func = key_func
+        self._blist = frozenset(blacklist)
+        self._key_mapper = HierarchicalKeyMapper(self._blist)
+        self._kinds = {}
+        self._class_fields = {}
+
+    def write(self, val: Serializable) -> typing.Dict[str, typing.Any]:
+        """
+        Write `val` into a new `dict`.
+        """
+        out = {}
+        self.write_into(val, out)
+        return out
+
+    def write_into(
+            self,
+            val: Serializable,
             out: typing.MutableMapping[str, typing.Any],
     ):
-        if field is None:
-            pass
-        elif type(field) in Serializable._PRIMITIVES:
-            out[name] = field
+        """
+        Write `val` into the `out` mapping.
+        """
+        fields = self._class_fields.get(type(val), False)
+        if fields is False:
+            fields = self._compile_fields(type(val))
+
+        if fields is None:
+            # The class has a custom `to_dict`.
+            if self._key_func is None:
+                val.to_dict(out)
+            else:
+                snake = {}
+                val.to_dict(snake)
+                out.update(self._key_mapper.remap_mapping(self._key_func, snake))
+            return
+
+        kinds = self._kinds
+        names, getter = fields
+        for (name, key), field in zip(names, getter(val)):
+            if field is not None:
+                kind = kinds.get(type(field)) or self._kind(field)
+                out[key] = field if kind == _PRIMITIVE else self._encode(kind, name, field)
+
+    def _compile_fields(self, clz: typing.Type[Serializable]):
+        if clz.to_dict is not Serializable.to_dict:
+            fields = None
+        else:
+            field_names = tuple(clz.field_names())
+            names = tuple(
+                (name, name if self._key_func is None else self._key_func(name))
+                for name in field_names
+            )
+            if len(field_names) == 1:
+                # `attrgetter` returns a scalar, not a tuple, for a single attribute.
+                name = field_names[0]
+                getter = lambda val: (getattr(val, name),)
+            else:
+                getter = operator.attrgetter(*field_names)
+            fields = names, getter
+        self._class_fields[clz] = fields
+        return fields
+
+    def _kind(self, field: typing.Any) -> int:
+        if type(field) in Serializable._PRIMITIVES:
+            kind = _PRIMITIVE
+        elif isinstance(field, Serializable):
+            kind = _MESSAGE
         elif isinstance(field, typing.Sequence):
-            seq = []
-            for subfield in field:
-                Serializable._put_field_to_sequence(subfield, seq)
-            out[name] = seq
+            kind = _SEQUENCE
         elif isinstance(field, typing.Mapping):
-            val = {}
-            for k, v in field.items():
-                Serializable._put_field_to_mapping(k, v, val)
-            out[name] = val
-        elif isinstance(field, Serializable):
-            val = {}
-            field.to_dict(val)
-            out[name] = val
+            kind = _MAPPING
         elif isinstance(field, enum.Enum):
-            out[name] = field.name
+            kind = _ENUM
         elif hasattr(field, 'seconds') and hasattr(field, 'nanos') and hasattr(field, 'as_str') and callable(field.as_str):
             # This quacks *exactly* as a Timestamp!
-            out[name] = field.as_str()
+            kind = _TIMESTAMP
         else:
             raise ValueError(f'Unexpected field {field}')
+        self._kinds[type(field)] = kind
+        return kind
 
-    @staticmethod
-    def _put_field_to_sequence(
-            field: typing.Optional[typing.Any],
-            out: typing.MutableSequence[typing.Any],
-    ):
-        if field is None:
-            pass
-        elif type(field) in Serializable._PRIMITIVES:
-            out.append(field)
-        elif isinstance(field, Serializable):
-            val = {}
-            for field_name in field.field_names():
-                sub = getattr(field, field_name)
-                Serializable._put_field_to_mapping(field_name, sub, val)
-            out.append(val)
-        elif isinstance(field, typing.Mapping):
-            val = {}
-            for k, v in field.items():
-                Serializable._put_field_to_mapping(k, v, val)
-            out.append(val)
-        elif isinstance(field, enum.Enum):
-            out.append(field.name)
-        elif hasattr(field, 'seconds') and hasattr(field, 'nanos') and hasattr(field, 'as_str') and callable(field.as_str):
-            # This quack *exactly* as a Timestamp!
-            out.append(field.as_str())
+    def _encode(
+            self,
+            kind: int,
+            name: str,
+            field: typing.Any,
+    ) -> typing.Any:
+        if kind == _PRIMITIVE:
+            return field
+        elif kind == _MESSAGE:
+            out = {}
+            self.write_into(field, out)
+            return out
+        elif kind == _SEQUENCE:
+            kinds = self._kinds
+            seq = []
+            for item in field:
+                if item is not None:
+                    item_kind = kinds.get(type(item)) or self._kind(item)
+                    if item_kind == _SEQUENCE:
+                        # We should not have to process a sequence within a sequence.
+                        raise ValueError(f'Unexpected field {item}')
+                    seq.append(self._encode(item_kind, name, item))
+            return seq
+        elif kind == _MAPPING:
+            kinds = self._kinds
+            keep_keys = self._key_func is None or name in self._blist
+            return {
+                k if keep_keys else self._key_func(k): self._encode(kinds.get(type(v)) or self._kind(v), k, v)
+                for k, v in field.items() if v is not None
+            }
+        elif kind == _ENUM:
+            return field.name
         else:
-            # We should not have to process a sequence within a sequence.
-            raise ValueError(f'Unexpected field {field}')
+            return field.as_str()
+
+
+_SNAKE_CASE_WRITER = DictWriter()
 
 
 class Serializer(metaclass=abc.ABCMeta):
@@ -132,6 +218,8 @@ class Deserializable(metaclass=abc.ABCMeta):
     See :class:`Serializable` for more info.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def from_dict(cls, values: typing.Mapping[str, typing.Any]):
@@ -1,8 +1,11 @@
 import abc
 import typing
 
+from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.message import Message
 
+from ._io import Serializable
+
 
 class ToProtobuf(metaclass=abc.ABCMeta):
     """
@@ -26,6 +29,8 @@ class ToProtobuf(metaclass=abc.ABCMeta):
     b'\\n\\nexample.id\\x12\\x05other\\x12\\x0bidentifiers'
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_message(self) -> Message:
         """
@@ -69,6 +74,8 @@ class FromProtobuf(metaclass=abc.ABCMeta):
 
     """
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def message_type(cls) -> typing.Type[Message]:
@@ -94,12 +101,37 @@ class FromProtobuf(metaclass=abc.ABCMeta):
         Create an instance from some bytes read from `pb`.
         The bytes are expected to correspond to the state of the message.
         """
-        msg_type = cls.message_type()
-        msg = msg_type()
-        msg.MergeFromString(fp.read())
+        return cls.from_bytes(fp.read())
+
+    @classmethod
+    def from_bytes(
+            cls,
+            payload: bytes,
+    ):
+        """
+        Create an instance from the binary protobuf representation of the message.
+        """
+        msg = cls.message_type().FromString(payload)
 
         return cls.from_message(msg)
 
+    @classmethod
+    def from_messages(
+            cls,
+            msgs: typing.Iterable[typing.Union[Message, bytes]],
+    ) -> typing.List:
+        """
+        Decode a collection of messages, either as protobuf messages or as their binary representation,
+        into a list of new instances of this class.
+        """
+        msg_type = cls.message_type()
+        out = []
+        for msg in msgs:
+            if isinstance(msg, (bytes, bytearray, memoryview)):
+                msg = msg_type.FromString(msg)
+            out.append(cls.from_message(msg))
+        return out
+
     @classmethod
     def complain_about_incompatible_msg_type(
             cls,
@@ -147,3 +179,119 @@ def extract_pb_message_seq(
         msg: Message,
 ) -> typing.Iterable[FP]:
     return (cls.from_message(i) for i in getattr(msg, key))
+
+
+# Field kinds of `MessageWriter`.
+_SCALAR, _MESSAGE, _ENUM, _REPEATED_SCALAR, _REPEATED_MESSAGE, _REPEATED_ENUM, _MAP = range(1, 8)
+
+
+class MessageWriter:
+    # Not part of the public API!
+    """
+    `MessageWriter` writes :class:`ToProtobuf` objects into protobuf messages.
+
+    Creating a message with sub-messages passed to the message constructor (or with `CopyFrom`) copies
+    the sub-messages, hence each level of a nested structure such as a phenopacket is copied again
+    by its parent. The writer fills the fields of the sub-messages in place instead.
+
+    The field names of each class, together with the kinds of the corresponding protobuf fields, are compiled
+    once per class. The classes with a custom :func:`Serializable.to_dict` (e.g. due to `oneof` fields) or whose
+    field names do not match the protobuf fields are written with their own :func:`ToProtobuf.to_message`.
+    """
+
+    def __init__(self):
+        self._plans = {}
+
+    def write(self, val: ToProtobuf) -> Message:
+        """
+        Write `val` into a new protobuf message.
+        """
+        msg = val.message_type()()
+        self.write_into(val, msg)
+        return msg
+
+    def write_into(
+            self,
+            val: ToProtobuf,
+            msg: Message,
+    ):
+        """
+        Write `val` into the `msg`.
+        """
+        key = type(val), msg.DESCRIPTOR
+        plan = self._plans.get(key, False)
+        if plan is False:
+            plan = self._compile_plan(*key)
+
+        if plan is None:
+            msg.CopyFrom(val.to_message())
+            return
+
+        for name, kind, enum_type in plan:
+            value = getattr(val, name)
+            if value is None:
+                continue
+            if kind == _SCALAR:
+                setattr(msg, name, value)
+            elif kind == _MESSAGE:
+                sub = getattr(msg, name)
+                sub.SetInParent()
+                self._write_message(value, sub)
+            elif kind == _ENUM:
+                setattr(msg, name, enum_type.values_by_name[value.name].number)
+            elif kind == _REPEATED_SCALAR:
+                getattr(msg, name).extend(value)
+            elif kind == _REPEATED_MESSAGE:
+                container = getattr(msg, name)
+                for item in value:
+                    self._write_message(item, container.add())
+            elif kind == _REPEATED_ENUM:
+                getattr(msg, name).extend(enum_type.values_by_name[item.name].number for item in value)
+            else:
+                getattr(msg, name).update(value)
+
+    def _write_message(
+            self,
+            val: ToProtobuf,
+            msg: Message,
+    ):
+        if isinstance(val, Serializable):
+            self.write_into(val, msg)
+        else:
+            # E.g. `Timestamp`.
+            msg.CopyFrom(val.to_message())
+
+    def _compile_plan(self, clz: typing.Type, descriptor):
+        plan = None
+        if issubclass(clz, Serializable) and clz.to_dict is Serializable.to_dict:
+            field_names = tuple(clz.field_names())
+            fields = descriptor.fields_by_name
+            if all(name in fields for name in field_names):
+                plan = tuple(
+                    (name, MessageWriter._field_kind(fields[name]), fields[name].enum_type)
+                    for name in field_names
+                )
+        self._plans[clz, descriptor] = plan
+        return plan
+
+    @staticmethod
+    def _field_kind(field: FieldDescriptor) -> int:
+        if field.message_type is not None and field.message_type.GetOptions().map_entry:
+            return _MAP
+        elif field.label == FieldDescriptor.LABEL_REPEATED:
+            if field.type == FieldDescriptor.TYPE_MESSAGE:
+                return _REPEATED_MESSAGE
+            elif field.type == FieldDescriptor.TYPE_ENUM:
+                return _REPEATED_ENUM
+            else:
+                return _REPEATED_SCALAR
+        else:
+            if field.type == FieldDescriptor.TYPE_MESSAGE:
+                return _MESSAGE
+            elif field.type == FieldDescriptor.TYPE_ENUM:
+                return _ENUM
+            else:
+                return _SCALAR
+
+
+MESSAGE_WRITER = MessageWriter()
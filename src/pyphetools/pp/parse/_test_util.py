@@ -60,6 +60,22 @@ class TestCaseConverter:
 
         assert actual == expected
 
+    def test_conversions_are_cached(
+            self,
+            converter: CaseConverter,
+    ):
+        CaseConverter.cache_clear()
+
+        for _ in range(3):
+            assert converter.camel_to_snake('individualToFileIdentifiers') == 'individual_to_file_identifiers'
+            assert converter.snake_to_camel('individual_to_file_identifiers') == 'individualToFileIdentifiers'
+
+        info = CaseConverter.cache_info()
+        assert info['camel_to_snake'].hits == 2
+        assert info['camel_to_snake'].misses == 1
+        assert info['snake_to_camel'].hits == 2
+        assert info['snake_to_camel'].misses == 1
+
 
 class TestHierarchicalKeyMapper:
 
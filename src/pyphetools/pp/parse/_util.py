@@ -1,26 +1,62 @@
+import functools
 import re
 import typing
 
+_CAMEL_TO_SNAKE = re.compile(r'(?<!^)(?=[A-Z])')
+
+# The key vocabulary of Phenopacket Schema is a few hundred names, the rest of the cache
+# is left for the keys of the maps (e.g. `file_attributes`).
+_CONVERSION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _camel_to_snake(payload: str) -> str:
+    return _CAMEL_TO_SNAKE.sub('_', payload).lower()
 
-class CaseConverter:
-    # Not part of the public API!
 
-    def __init__(self):
-        self._camel_to_snake = re.compile(r'(?<!^)(?=[A-Z])')
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _snake_to_camel(payload: str) -> str:
+    tokens = payload.split('_')
+    if len(tokens) == 0:
+        return ''
+    elif len(tokens) == 1:
+        return payload
+    else:
+        return tokens[0] + ''.join(map(lambda s: s.title(), tokens[1:]))
 
 
+class CaseConverter:
+    # Not part of the public API!
+    #
+    # The conversions are memoized in LRU caches shared by all instances, since the same field names
+    # are converted over and over when (de)serializing many phenopackets.
+
     def camel_to_snake(self, payload: str) -> str:
-        return self._camel_to_snake.sub('_', payload).lower()
+        return _camel_to_snake(payload)
 
     @staticmethod
     def snake_to_camel(payload: str) -> str:
-        tokens = payload.split('_')
-        if len(tokens) == 0:
-            return ''
-        elif len(tokens) == 1:
-            return payload
-        else:
-            return tokens[0] + ''.join(map(lambda s: s.title(), tokens[1:]))
+        return _snake_to_camel(payload)
+
+    @staticmethod
+    def cache_info() -> typing.Mapping[str, typing.Any]:
+        """
+        Get the hit/miss counters of the conversion caches.
+
+        :returns: a mapping with `functools` cache info of `camel_to_snake` and `snake_to_camel` conversions.
+        """
+        return {
+            'camel_to_snake': _camel_to_snake.cache_info(),
+            'snake_to_camel': _snake_to_camel.cache_info(),
+        }
+
+    @staticmethod
+    def cache_clear():
+        """
+        Clear the conversion caches and reset the counters.
+        """
+        _camel_to_snake.cache_clear()
+        _snake_to_camel.cache_clear()
 
 
 PS_v202_BLACKLIST = (
@@ -2,8 +2,8 @@ import io
 import json
 import typing
 
-from .._io import Serializer, Serializable, Deserializer, D
-from .._util import CaseConverter, HierarchicalKeyMapper
+from .._io import Serializer, Serializable, Deserializer, D, DictWriter
+from .._util import CaseConverter, HierarchicalKeyMapper, PS_v202_BLACKLIST
 
 _PRIMITIVES = {
     bool, int, float, str,
@@ -37,6 +37,58 @@ def map_dict_keys_case(
         raise ValueError('Bug')
 
 
+class _SnakeCaseDict(dict):
+    # A `dict` whose keys were converted to snake case. We keep the original pairs around
+    # to restore the keys of the maps, such as `fileAttributes`.
+    __slots__ = ('original_pairs',)
+
+
+class _SnakeCaseHook:
+    """
+    `object_pairs_hook` for :func:`json.load` that converts the keys of JSON objects into snake case
+    while the JSON is being decoded.
+
+    The snake case keys of the Phenopacket Schema fields are precomputed into a table,
+    other keys are converted with :class:`CaseConverter`. The keys of the objects under a blacklisted key
+    (e.g. `fileAttributes`) are kept as they are.
+    """
+
+    def __init__(self, blacklist: typing.Iterable[str]):
+        self._blist = set(blacklist)
+        self._case_converter = CaseConverter()
+        self._table = _SnakeCaseHook._build_key_table()
+
+    @staticmethod
+    def _build_key_table() -> typing.Dict[str, str]:
+        table = {}
+        pending = [Serializable]
+        while pending:
+            clz = pending.pop()
+            pending.extend(clz.__subclasses__())
+            try:
+                field_names = clz.field_names()
+            except NotImplementedError:
+                # The classes with `oneof` fields do not expose the field names.
+                continue
+            if field_names is None:
+                continue
+            for name in field_names:
+                table[CaseConverter.snake_to_camel(name)] = name
+                table[name] = name
+        return table
+
+    def __call__(self, pairs: typing.List[typing.Tuple[str, typing.Any]]) -> typing.Dict[str, typing.Any]:
+        table = self._table
+        out = _SnakeCaseDict()
+        for key, val in pairs:
+            if key in self._blist and type(val) is _SnakeCaseDict:
+                val = dict(val.original_pairs)
+            new_key = table.get(key)
+            out[self._case_converter.camel_to_snake(key) if new_key is None else new_key] = val
+        out.original_pairs = pairs
+        return out
+
+
 class JsonSerializer(Serializer):
     """
     A serializer to format :class:`Serializable` objects into JSON format.
@@ -46,21 +98,32 @@ class JsonSerializer(Serializer):
     For the purpose of working with Phenopacket Schema, the serializer will not convert the map keys,
     (e.g. keys of `file_attributes` map).
 
+    By default, the camel case keys are emitted directly while traversing the object (`single_pass=True`).
+    Use `single_pass=False` to first create the `dict` with :func:`Serializable.to_dict`
+    and to remap the keys afterwards.
+
     See :func:`json.dump` for the accepted keyword arguments.
+
+    :param single_pass: `True` if the keys should be converted in a single pass.
     """
 
     def __init__(
             self,
+            single_pass: bool = True,
             **kwargs
     ):
         self._kwargs = kwargs
         self._case_converter = CaseConverter()
         self._key_mapper = HierarchicalKeyMapper.ps_v202_mapper()
+        self._encoder = DictWriter(CaseConverter.snake_to_camel, PS_v202_BLACKLIST) if single_pass else None
 
     def serialize(self, val: Serializable, fp: typing.IO):
-        out = {}
-        val.to_dict(out)
-        mapped = self._key_mapper.remap_mapping(self._case_converter.snake_to_camel, out)
+        if self._encoder is not None:
+            mapped = self._encoder.write(val)
+        else:
+            out = {}
+            val.to_dict(out)
+            mapped = self._key_mapper.remap_mapping(self._case_converter.snake_to_camel, out)
         json.dump(mapped, fp, **self._kwargs)
 
 
@@ -70,28 +133,39 @@ class JsonDeserializer(Deserializer):
 
     The deserializer supports reading a JSON with keys
     in both *snake case* (e.g. `file_attributes`) and *camel case* (e.g. `fileAttributes`).
+
+    By default, the keys are converted while the JSON is being decoded (`single_pass=True`).
+    Use `single_pass=False` to decode the JSON first and to remap the keys afterwards.
+
+    :param single_pass: `True` if the keys should be converted in a single pass.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            single_pass: bool = True,
+    ):
         self._case_converter = CaseConverter()
         self._key_mapper = HierarchicalKeyMapper.ps_v202_mapper()
+        self._hook = _SnakeCaseHook(PS_v202_BLACKLIST) if single_pass else None
 
     def deserialize(
             self,
             fp: typing.Union[str, io.TextIOBase],
             clz: typing.Type[D]) -> D:
-        val = self._decode_json_content(fp)
-
-        mapped = self._key_mapper.remap_mapping(self._case_converter.camel_to_snake, val)
+        if self._hook is not None:
+            mapped = self._decode_json_content(fp, object_pairs_hook=self._hook)
+        else:
+            val = self._decode_json_content(fp)
+            mapped = self._key_mapper.remap_mapping(self._case_converter.camel_to_snake, val)
         return clz.from_dict(mapped)
 
     @staticmethod
-    def _decode_json_content(fp: typing.Union[str, io.TextIOBase]):
+    def _decode_json_content(fp: typing.Union[str, io.TextIOBase], **kwargs):
 
         if isinstance(fp, str):
-            val = json.loads(fp)
+            val = json.loads(fp, **kwargs)
         elif isinstance(fp, io.TextIOBase):
-            val = json.load(fp)
+            val = json.load(fp, **kwargs)
         else:
             raise ValueError(f'`fp` must be a `str` or `io.TextIOBase` but was {type(fp)}')
         return val
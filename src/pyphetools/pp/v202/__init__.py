@@ -17,7 +17,7 @@ from ._medical_action import TherapeuticRegimen, RadiationTherapy, DrugType, Dos
 from ._phenotypic_feature import PhenotypicFeature
 from ._disease import Disease
 from ._meta_data import MetaData, Resource, Update
-from ._phenopackets import Phenopacket
+from ._phenopackets import Phenopacket, LazyPhenopacket
 from ._vrs import Gene, Text, Number, IndefiniteRange, DefiniteRange, SimpleInterval, SequenceInterval
 from ._vrs import SequenceLocation, SequenceState, LiteralSequenceExpression, DerivedSequenceExpression
 from ._vrs import RepeatedSequenceExpression, CytobandInterval, ChromosomeLocation, Allele, Haplotype, CopyNumber
@@ -25,7 +25,7 @@ from ._vrs import VariationSet, Variation
 from ._vrsatile import Expression, Extension, VcfRecord, MoleculeContext, VariationDescriptor
 
 __all__ = [
-    'Phenopacket',
+    'Phenopacket', 'LazyPhenopacket',
     'Individual', 'VitalStatus', 'Sex', 'KaryotypicSex',
     'GeneDescriptor', 'AcmgPathogenicityClassification', 'TherapeuticActionability', 'VariantInterpretation',
     'GenomicInterpretation', 'Diagnosis', 'Interpretation',
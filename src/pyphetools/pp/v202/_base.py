@@ -1,3 +1,4 @@
+import collections
 import typing
 
 import phenopackets as pp202
@@ -151,10 +152,22 @@ class OntologyClass(MessageMixin):
     >>> oc.label
     'Seizure'
 
+    `OntologyClass` is immutable, hence the instances can be shared. Use :func:`intern` to get a shared instance
+    for an `(id, label)` pair. The instances created by :func:`from_dict` and :func:`from_message` are shared as well.
+
+    >>> OntologyClass.intern(id='HP:0001250', label='Seizure') is OntologyClass.intern(id='HP:0001250', label='Seizure')
+    True
+
     :param id: a `str` with a CURIE-style identifier (e.g. `HP:0001250`).
     :param label: a `str` with a human-readable class name (e.g. `Seizure`).
     """
 
+    __slots__ = ('_id', '_label')
+
+    # Process-wide table of the shared instances, with the least recently used instance evicted first.
+    _INTERNED = collections.OrderedDict()
+    INTERN_TABLE_SIZE = 65_536
+
     def __init__(
             self,
             id: str,
@@ -163,6 +176,39 @@ class OntologyClass(MessageMixin):
         self._id = id
         self._label = label
 
+    @staticmethod
+    def intern(
+            id: str,
+            label: str,
+    ) -> "OntologyClass":
+        """
+        Get a shared `OntologyClass` instance for the `id` and `label`.
+
+        At most :attr:`INTERN_TABLE_SIZE` instances are kept, the least recently used instance is evicted first.
+
+        :param id: a `str` with a CURIE-style identifier (e.g. `HP:0001250`).
+        :param label: a `str` with a human-readable class name (e.g. `Seizure`).
+        :returns: the shared instance.
+        """
+        key = (id, label)
+        interned = OntologyClass._INTERNED
+        try:
+            oc = interned[key]
+            interned.move_to_end(key)
+        except KeyError:
+            oc = OntologyClass(id=id, label=label)
+            interned[key] = oc
+            if len(interned) > OntologyClass.INTERN_TABLE_SIZE:
+                interned.popitem(last=False)
+        return oc
+
+    @staticmethod
+    def clear_interned():
+        """
+        Remove all shared instances from the intern table.
+        """
+        OntologyClass._INTERNED.clear()
+
     @property
     def id(self) -> str:
         """
@@ -188,7 +234,7 @@ class OntologyClass(MessageMixin):
     @classmethod
     def from_dict(cls, values: typing.Mapping[str, typing.Any]):
         if cls._all_required_fields_are_present(values):
-            return OntologyClass(
+            return OntologyClass.intern(
                 id=values['id'],
                 label=values['label'],
             )
@@ -208,7 +254,7 @@ class OntologyClass(MessageMixin):
     @classmethod
     def from_message(cls, msg: Message):
         if isinstance(msg, pp202.OntologyClass):
-            return OntologyClass(
+            return OntologyClass.intern(
                 id=msg.id,
                 label=msg.label,
             )
@@ -229,6 +275,8 @@ class OntologyClass(MessageMixin):
 
 class ExternalReference(MessageMixin):
 
+    __slots__ = ('_id', '_reference', '_description')
+
     def __init__(
             self,
             id: typing.Optional[str] = None,
@@ -324,6 +372,8 @@ class ExternalReference(MessageMixin):
 
 class Evidence(MessageMixin):
 
+    __slots__ = ('_evidence_code', '_reference')
+
     def __init__(
             self,
             evidence_code: OntologyClass,
@@ -401,6 +451,8 @@ class Evidence(MessageMixin):
 
 class GestationalAge(MessageMixin):
 
+    __slots__ = ('_weeks', '_days')
+
     def __init__(
             self,
             weeks: int,
@@ -484,6 +536,8 @@ class GestationalAge(MessageMixin):
 
 class Age(MessageMixin):
 
+    __slots__ = ('_iso8601duration',)
+
     def __init__(
             self,
             iso8601duration: str,
@@ -544,6 +598,8 @@ class Age(MessageMixin):
 
 class AgeRange(MessageMixin):
 
+    __slots__ = ('_start', '_end')
+
     def __init__(
             self,
             start: Age,
@@ -620,6 +676,8 @@ class AgeRange(MessageMixin):
 
 class TimeInterval(MessageMixin):
 
+    __slots__ = ('_start', '_end')
+
     def __init__(
             self,
             start: Timestamp,
@@ -698,6 +756,9 @@ class TimeElement(MessageMixin):
     """
     TODO: better description
     """
+
+    __slots__ = ('_element',)
+
     _ONEOF_ELEMENT = {
         'gestational_age': GestationalAge, 'age': Age, 'age_range': AgeRange,
         'ontology_class': OntologyClass, 'timestamp': Timestamp, 'interval': TimeInterval,
@@ -832,6 +893,8 @@ class TimeElement(MessageMixin):
 
 class Procedure(MessageMixin):
 
+    __slots__ = ('_code', '_body_site', '_performed')
+
     def __init__(
             self,
             code: OntologyClass,
@@ -933,6 +996,8 @@ class Procedure(MessageMixin):
 
 class File(MessageMixin):
 
+    __slots__ = ('_uri', '_individual_to_file_identifiers', '_file_attributes')
+
     def __init__(
             self,
             uri: str,
@@ -12,6 +12,13 @@ from ..parse import extract_message_scalar, extract_message_sequence, extract_pb
 
 class Biosample(MessageMixin):
 
+    __slots__ = (
+        '_id', '_individual_id', '_derived_from_id', '_description', '_sampled_tissue', '_sample_type',
+        '_phenotypic_features', '_measurements', '_taxonomy', '_time_of_collection', '_histological_diagnosis',
+        '_tumor_progression', '_tumor_grade', '_pathological_stage', '_pathological_tnm_finding', '_diagnostic_markers',
+        '_procedure', '_files', '_material_sample', '_sample_processing', '_sample_storage',
+    )
+
     def __init__(
             self,
             id: str,
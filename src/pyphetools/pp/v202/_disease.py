@@ -10,6 +10,11 @@ from ..parse import extract_message_scalar, extract_message_sequence, extract_pb
 
 class Disease(MessageMixin):
 
+    __slots__ = (
+        '_term', '_excluded', '_onset', '_resolution', '_disease_stage', '_clinical_tnm_finding', '_primary_site',
+        '_laterality',
+    )
+
     def __init__(
             self,
             term: OntologyClass,
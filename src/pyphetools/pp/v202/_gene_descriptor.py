@@ -8,6 +8,8 @@ from .._api import MessageMixin
 
 class GeneDescriptor(MessageMixin):
 
+    __slots__ = ('_value_id', '_symbol', '_description', '_alternate_ids', '_xrefs', '_alternate_symbols')
+
     def __init__(
             self,
             value_id: str,
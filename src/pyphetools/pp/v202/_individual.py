@@ -64,6 +64,8 @@ class VitalStatus(MessageMixin):
     TODO: add docs.
     """
 
+    __slots__ = ('_status', '_time_of_death', '_cause_of_death', '_survival_time_in_days')
+
     class Status(enum.Enum):
         """
         TODO: add docs.
@@ -203,6 +205,11 @@ class VitalStatus(MessageMixin):
 
 class Individual(MessageMixin):
 
+    __slots__ = (
+        '_id', '_alt_ids', '_date_of_birth', '_time_at_last_encounter', '_vital_status', '_sex', '_karyotypic_sex',
+        '_gender', '_taxonomy',
+    )
+
     def __init__(
             self,
             id: str,
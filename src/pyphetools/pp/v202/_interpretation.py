@@ -30,6 +30,8 @@ class TherapeuticActionability(enum.Enum):
 
 class VariantInterpretation(MessageMixin):
 
+    __slots__ = ('_acmg_pathogenicity_classification', '_therapeutic_actionability', '_variation_descriptor')
+
     def __init__(
             self,
             variation_descriptor: VariationDescriptor,
@@ -125,6 +127,8 @@ class VariantInterpretation(MessageMixin):
 
 
 class GenomicInterpretation(MessageMixin):
+    __slots__ = ('_subject_or_biosample_id', '_interpretation_status', '_call')
+
     _ONEOF_CALL = {
         'gene_descriptor': GeneDescriptor,
         'variant_interpretation': VariantInterpretation,
@@ -256,6 +260,8 @@ class GenomicInterpretation(MessageMixin):
 
 class Diagnosis(MessageMixin):
 
+    __slots__ = ('_disease', '_genomic_interpretations')
+
     def __init__(
             self,
             disease: OntologyClass,
@@ -328,6 +334,8 @@ class Diagnosis(MessageMixin):
 
 
 class Interpretation(MessageMixin):
+    __slots__ = ('_id', '_progress_status', '_diagnosis', '_summary')
+
     class ProgressStatus(enum.Enum):
         UNKNOWN_PROGRESS = 0
         IN_PROGRESS = 1
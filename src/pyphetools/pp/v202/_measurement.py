@@ -11,6 +11,8 @@ from ..parse import extract_pb_message_scalar, extract_pb_message_seq, extract_p
 
 class ReferenceRange(MessageMixin):
 
+    __slots__ = ('_unit', '_low', '_high')
+
     def __init__(
             self,
             unit: OntologyClass,
@@ -98,6 +100,8 @@ class ReferenceRange(MessageMixin):
 
 class Quantity(MessageMixin):
 
+    __slots__ = ('_unit', '_value', '_reference_range')
+
     def __init__(
             self,
             unit: OntologyClass,
@@ -190,6 +194,8 @@ class Quantity(MessageMixin):
 
 class TypedQuantity(MessageMixin):
 
+    __slots__ = ('_type', '_quantity')
+
     def __init__(
             self,
             type: OntologyClass,
@@ -263,6 +269,8 @@ class TypedQuantity(MessageMixin):
 
 class ComplexValue(MessageMixin):
 
+    __slots__ = ('_typed_quantities',)
+
     def __init__(
             self,
             typed_quantities: typing.Iterable[TypedQuantity],
@@ -319,6 +327,8 @@ class ComplexValue(MessageMixin):
 
 
 class Value(MessageMixin):
+    __slots__ = ('_value',)
+
     _ONEOF_VALUE = {'quantity': Quantity, 'ontology_class': OntologyClass}
 
     def __init__(
@@ -397,6 +407,8 @@ class Value(MessageMixin):
 
 
 class Measurement(MessageMixin):
+    __slots__ = ('_assay', '_measurement_value', '_description', '_time_observed', '_procedure')
+
     _ONEOF_MEASUREMENT_VALUE = {'value': Value, 'complex_value': ComplexValue}
 
     def __init__(
@@ -13,6 +13,8 @@ from ..parse import extract_pb_message_scalar, extract_pb_message_seq, extract_p
 
 
 class TherapeuticRegimen(MessageMixin):
+    __slots__ = ('_identifier', '_regimen_status', '_start_time', '_end_time')
+
     _ONEOF_IDENTIFIER = {'external_reference': ExternalReference, 'ontology_class': OntologyClass}
 
     class RegimenStatus(enum.Enum):
@@ -161,6 +163,8 @@ class TherapeuticRegimen(MessageMixin):
 
 class RadiationTherapy(MessageMixin):
 
+    __slots__ = ('_modality', '_body_site', '_dosage', '_fractions')
+
     def __init__(
             self,
             modality: OntologyClass,
@@ -272,6 +276,8 @@ class DrugType(enum.Enum):
 
 class DoseInterval(MessageMixin):
 
+    __slots__ = ('_quantity', '_schedule_frequency', '_interval')
+
     def __init__(
             self,
             quantity: Quantity,
@@ -361,6 +367,8 @@ class DoseInterval(MessageMixin):
 
 class Treatment(MessageMixin):
 
+    __slots__ = ('_agent', '_route_of_administration', '_dose_intervals', '_drug_type', '_cumulative_dose')
+
     def __init__(
             self,
             agent: OntologyClass,
@@ -496,6 +504,11 @@ class Treatment(MessageMixin):
 
 
 class MedicalAction(MessageMixin):
+    __slots__ = (
+        '_action', '_treatment_target', '_treatment_intent', '_response_to_treatment', '_adverse_events',
+        '_treatment_termination_reason',
+    )
+
     _CLS_ACTION = {
         'procedure': Procedure, 'treatment': Treatment,
         'radiation_therapy': RadiationTherapy,
@@ -11,6 +11,8 @@ from ..parse import extract_message_scalar, extract_message_sequence, extract_pb
 
 class Resource(MessageMixin):
 
+    __slots__ = ('_id', '_name', '_url', '_version', '_namespace_prefix', '_iri_prefix')
+
     def __init__(
             self,
             id: str,
@@ -241,6 +243,8 @@ class Resource(MessageMixin):
 
 class Update(MessageMixin):
 
+    __slots__ = ('_timestamp', '_updated_by', '_comment')
+
     def __init__(
             self,
             timestamp: Timestamp,
@@ -341,6 +345,11 @@ class Update(MessageMixin):
 class MetaData(MessageMixin):
     # TODO: this entire class must be implemented!
 
+    __slots__ = (
+        '_created', '_created_by', '_submitted_by', '_resources', '_updates', '_phenopacket_schema_version',
+        '_external_references',
+    )
+
     def __init__(
             self,
             created: Timestamp,
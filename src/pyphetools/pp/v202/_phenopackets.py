@@ -15,10 +15,16 @@ from ._disease import Disease
 from ._meta_data import MetaData
 from .._api import MessageMixin
 from ..parse import extract_message_scalar, extract_message_sequence, extract_pb_message_scalar, extract_pb_message_seq
+from ..parse._pb import MESSAGE_WRITER
 
 
 class Phenopacket(MessageMixin):
 
+    __slots__ = (
+        '_id', '_subject', '_phenotypic_features', '_measurements', '_biosamples', '_interpretations', '_diseases',
+        '_medical_actions', '_files', '_meta_data',
+    )
+
     def __init__(
             self,
             id: str,
@@ -129,18 +135,8 @@ class Phenopacket(MessageMixin):
             cls._complain_about_missing_field(values)
 
     def to_message(self) -> Message:
-        return pp202.Phenopacket(
-            id=self._id,
-            subject=self._subject.to_message(),
-            phenotypic_features=(pf.to_message() for pf in self._phenotypic_features),
-            measurements=(m.to_message() for m in self._measurements),
-            biosamples=(b.to_message() for b in self._biosamples),
-            interpretations=(i.to_message() for i in self._interpretations),
-            diseases=(d.to_message() for d in self._diseases),
-            medical_actions=(ma.to_message() for ma in self._medical_actions),
-            files=(f.to_message() for f in self._files),
-            meta_data=self._meta_data.to_message(),
-        )
+        # Phenopackets are large, so we fill the sub-messages in place rather than copying them level by level.
+        return MESSAGE_WRITER.write(self)
 
     @classmethod
     def message_type(cls) -> typing.Type[Message]:
@@ -189,3 +185,145 @@ class Phenopacket(MessageMixin):
                f'medical_actions={self._medical_actions}, ' \
                f'files={self._files}, ' \
                f'meta_data={self._meta_data})'
+
+
+class LazyPhenopacket:
+    """
+    A read-only view of a :class:`Phenopacket` that decodes a field the first time it is accessed.
+
+    The view keeps the source, either a protobuf message or a `dict` as created by :class:`JsonDeserializer`,
+    and decodes only the fields that are actually used. This is useful when, for instance, only the phenotypic
+    features and diseases of a cohort are needed and decoding the interpretations, measurements, or biosamples
+    would be wasted work.
+
+    >>> from pyphetools.pp.v202 import Phenopacket, LazyPhenopacket
+    >>> pp = LazyPhenopacket.from_dict({
+    ...     'id': 'example.id',
+    ...     'phenotypic_features': [{'type': {'id': 'HP:0000555', 'label': 'Leukocoria'}}],
+    ... })
+    >>> pp.id
+    'example.id'
+    >>> [pf.type.label for pf in pp.phenotypic_features]
+    ['Leukocoria']
+    >>> pp.interpretations
+    []
+
+    Use :func:`to_phenopacket` to decode all fields into a :class:`Phenopacket`.
+
+    :param source: a protobuf `Phenopacket` message or a `dict` with the phenopacket data (snake case keys).
+    """
+
+    __slots__ = ('_source', '_from_message', '_decoded')
+
+    # The field name, the element type, and `True` if the field is a sequence.
+    _FIELDS = {
+        'subject': (Individual, False),
+        'phenotypic_features': (PhenotypicFeature, True),
+        'measurements': (Measurement, True),
+        'biosamples': (Biosample, True),
+        'interpretations': (Interpretation, True),
+        'diseases': (Disease, True),
+        'medical_actions': (MedicalAction, True),
+        'files': (File, True),
+        'meta_data': (MetaData, False),
+    }
+
+    def __init__(
+            self,
+            source: typing.Union[Message, typing.Mapping[str, typing.Any]],
+    ):
+        if isinstance(source, pp202.Phenopacket):
+            self._from_message = True
+        elif isinstance(source, typing.Mapping):
+            self._from_message = False
+        else:
+            raise ValueError(f'Cannot create a lazy phenopacket from {type(source)}')
+        self._source = source
+        self._decoded = {}
+
+    @staticmethod
+    def from_message(msg: Message) -> "LazyPhenopacket":
+        return LazyPhenopacket(msg)
+
+    @staticmethod
+    def from_bytes(payload: bytes) -> "LazyPhenopacket":
+        return LazyPhenopacket(pp202.Phenopacket.FromString(payload))
+
+    @staticmethod
+    def from_dict(values: typing.Mapping[str, typing.Any]) -> "LazyPhenopacket":
+        return LazyPhenopacket(values)
+
+    def _get(self, name: str):
+        try:
+            return self._decoded[name]
+        except KeyError:
+            pass
+
+        clz, is_sequence = LazyPhenopacket._FIELDS[name]
+        if self._from_message:
+            if is_sequence:
+                val = list(extract_pb_message_seq(name, clz, self._source))
+            else:
+                val = extract_pb_message_scalar(name, clz, self._source)
+        else:
+            if is_sequence:
+                val = extract_message_sequence(name, clz, self._source)
+                if val is None:
+                    val = []
+            else:
+                val = extract_message_scalar(name, clz, self._source)
+
+        self._decoded[name] = val
+        return val
+
+    @property
+    def id(self) -> str:
+        return self._source.id if self._from_message else self._source['id']
+
+    @property
+    def subject(self) -> typing.Optional[Individual]:
+        return self._get('subject')
+
+    @property
+    def phenotypic_features(self) -> typing.Sequence[PhenotypicFeature]:
+        return self._get('phenotypic_features')
+
+    @property
+    def measurements(self) -> typing.Sequence[Measurement]:
+        return self._get('measurements')
+
+    @property
+    def biosamples(self) -> typing.Sequence[Biosample]:
+        return self._get('biosamples')
+
+    @property
+    def interpretations(self) -> typing.Sequence[Interpretation]:
+        return self._get('interpretations')
+
+    @property
+    def diseases(self) -> typing.Sequence[Disease]:
+        return self._get('diseases')
+
+    @property
+    def medical_actions(self) -> typing.Sequence[MedicalAction]:
+        return self._get('medical_actions')
+
+    @property
+    def files(self) -> typing.Sequence[File]:
+        return self._get('files')
+
+    @property
+    def meta_data(self) -> typing.Optional[MetaData]:
+        return self._get('meta_data')
+
+    def to_phenopacket(self) -> Phenopacket:
+        """
+        Decode all fields into a :class:`Phenopacket`.
+        """
+        return Phenopacket(
+            id=self.id,
+            **{name: self._get(name) for name in LazyPhenopacket._FIELDS},
+        )
+
+    def __repr__(self):
+        return f'LazyPhenopacket(id={self.id}, decoded={sorted(self._decoded)})'
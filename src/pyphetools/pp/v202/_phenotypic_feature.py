@@ -10,6 +10,8 @@ from ..parse import extract_message_scalar, extract_message_sequence, extract_pb
 
 class PhenotypicFeature(MessageMixin):
 
+    __slots__ = ('_type', '_excluded', '_description', '_severity', '_modifiers', '_onset', '_resolution', '_evidence')
+
     def __init__(
             self,
             type: OntologyClass,
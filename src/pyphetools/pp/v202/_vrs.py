@@ -10,6 +10,8 @@ from ..parse import extract_oneof_scalar, extract_pb_oneof_scalar
 
 class Gene(MessageMixin):
 
+    __slots__ = ('_gene_id',)
+
     def __init__(
             self,
             gene_id: str,
@@ -66,6 +68,8 @@ class Gene(MessageMixin):
 
 class Text(MessageMixin):
 
+    __slots__ = ('_definition',)
+
     def __init__(
             self,
             definition: str,
@@ -122,6 +126,8 @@ class Text(MessageMixin):
 
 class Number(MessageMixin):
 
+    __slots__ = ('_value',)
+
     def __init__(
             self,
             value: typing.Union[int, str],
@@ -181,6 +187,8 @@ class Number(MessageMixin):
 
 class IndefiniteRange(MessageMixin):
 
+    __slots__ = ('_value', '_comparator')
+
     def __init__(
             self,
             value: int,
@@ -254,6 +262,8 @@ class IndefiniteRange(MessageMixin):
 
 class DefiniteRange(MessageMixin):
 
+    __slots__ = ('_min', '_max')
+
     def __init__(
             self,
             min: int,
@@ -324,6 +334,8 @@ class DefiniteRange(MessageMixin):
 
 class SimpleInterval(MessageMixin):
 
+    __slots__ = ('_start', '_end')
+
     def __init__(
             self,
             start: int,
@@ -396,6 +408,9 @@ class SequenceInterval(MessageMixin):
     """
     `SequenceInterval` is a complicated case which is
     """
+
+    __slots__ = ('_start', '_end')
+
     _ONE_OF_START_FIELDS = ('start_number', 'start_indefinite_range', 'start_definite_range')
     _ONE_OF_END_FIELDS = ('end_number', 'end_indefinite_range', 'end_definite_range')
 
@@ -584,6 +599,8 @@ class SequenceInterval(MessageMixin):
 
 
 class SequenceLocation(MessageMixin):
+    __slots__ = ('_sequence_id', '_interval')
+
     _ONEOF_INTERVAL_VALUE = {'sequence_interval': SequenceInterval, 'simple_interval': SimpleInterval}
 
     def __init__(
@@ -671,6 +688,8 @@ class SequenceLocation(MessageMixin):
 
 class SequenceState(MessageMixin):
 
+    __slots__ = ('_sequence',)
+
     def __init__(
             self,
             sequence: str,
@@ -727,6 +746,8 @@ class SequenceState(MessageMixin):
 
 class LiteralSequenceExpression(MessageMixin):
 
+    __slots__ = ('_sequence',)
+
     def __init__(
             self,
             sequence: str,
@@ -783,6 +804,8 @@ class LiteralSequenceExpression(MessageMixin):
 
 class DerivedSequenceExpression(MessageMixin):
 
+    __slots__ = ('_location', '_reverse_complement')
+
     def __init__(
             self,
             location: SequenceLocation,
@@ -855,6 +878,8 @@ class DerivedSequenceExpression(MessageMixin):
 
 
 class RepeatedSequenceExpression(MessageMixin):
+    __slots__ = ('_seq_expr', '_count')
+
     _ONEOF_SEQ_EXPRESSION = {
         'literal_sequence_expression': LiteralSequenceExpression,
         'derived_sequence_expression': DerivedSequenceExpression,
@@ -993,6 +1018,8 @@ class RepeatedSequenceExpression(MessageMixin):
 
 class CytobandInterval(MessageMixin):
 
+    __slots__ = ('_start', '_end')
+
     def __init__(
             self,
             start: str,
@@ -1063,6 +1090,8 @@ class CytobandInterval(MessageMixin):
 
 class ChromosomeLocation(MessageMixin):
 
+    __slots__ = ('_species_id', '_chr', '_interval')
+
     def __init__(
             self,
             species_id: str,
@@ -1149,6 +1178,8 @@ class ChromosomeLocation(MessageMixin):
 
 
 class Allele(MessageMixin):
+    __slots__ = ('_location', '_state')
+
     _ONEOF_LOCATION = {
         'curie': str,
         'chromosome_location': ChromosomeLocation,
@@ -1318,8 +1349,12 @@ class Allele(MessageMixin):
 
 
 class Haplotype(MessageMixin):
+    __slots__ = ('_members',)
+
     class Member(MessageMixin):
 
+        __slots__ = ('_value',)
+
         def __init__(
                 self,
                 value: typing.Union[Allele, str],
@@ -1458,6 +1493,8 @@ class Haplotype(MessageMixin):
 
 
 class CopyNumber(MessageMixin):
+    __slots__ = ('_subject', '_copies')
+
     _ONEOF_SUBJECT = {
         'allele': Allele,
         'haplotype': Haplotype,
@@ -1673,7 +1710,11 @@ class CopyNumber(MessageMixin):
 
 
 class VariationSet(MessageMixin):
+    __slots__ = ('_members',)
+
     class Member(MessageMixin):
+        __slots__ = ('_value',)
+
         _ONEOF_VALUE = {
             # 'curie': str,
             'allele': Allele, 'haplotype': Haplotype,
@@ -1878,6 +1919,8 @@ class VariationSet(MessageMixin):
 
 
 class Variation(MessageMixin):
+    __slots__ = ('_variation',)
+
     _ONEOF_VARIATION = {
         'allele': Allele, 'haplotype': Haplotype, 'copy_number': CopyNumber,
         'text': Text, 'variation_set': VariationSet,
@@ -14,6 +14,8 @@ from ..parse import extract_message_scalar, extract_message_sequence, extract_pb
 
 class Expression(MessageMixin):
 
+    __slots__ = ('_syntax', '_value', '_version')
+
     def __init__(
             self,
             syntax: str,
@@ -109,6 +111,8 @@ class Expression(MessageMixin):
 
 class Extension(MessageMixin):
 
+    __slots__ = ('_name', '_value')
+
     def __init__(
             self,
             name: str,
@@ -174,6 +178,8 @@ class Extension(MessageMixin):
 
 class VcfRecord(MessageMixin):
 
+    __slots__ = ('_genome_assembly', '_chrom', '_pos', '_ref', '_alt', '_id', '_qual', '_filter', '_info')
+
     def __init__(
             self,
             genome_assembly: str,
@@ -386,6 +392,11 @@ class MoleculeContext(enum.Enum):
 
 class VariationDescriptor(MessageMixin):
 
+    __slots__ = (
+        '_id', '_molecule_context', '_label', '_description', '_gene_context', '_expressions', '_vcf_record', '_xrefs',
+        '_alternate_labels', '_extensions', '_structural_type', '_vrs_ref_allele_seq', '_allelic_state',
+    )
+
     def __init__(
             self,
             id: str,
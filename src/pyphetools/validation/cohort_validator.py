@@ -1,25 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 from ..creation.allelic_requirement import AllelicRequirement
 from ..creation.individual import Individual
 from .validated_individual import ValidatedIndividual
 import hpotk
 
+# State of the worker processes of a parallel CohortValidator. These are set once per worker by _init_worker
+# so that the ontology is transferred to each worker only once and not with every individual
+_WORKER_ONTOLOGY = None
+_WORKER_MIN_HPO = None
+_WORKER_ALLELIC_REQUIREMENT = None
+
+
+def _init_worker(ontology:hpotk.MinimalOntology, min_hpo:int, allelic_requirement:AllelicRequirement) -> None:
+    global _WORKER_ONTOLOGY, _WORKER_MIN_HPO, _WORKER_ALLELIC_REQUIREMENT
+    _WORKER_ONTOLOGY = ontology
+    _WORKER_MIN_HPO = min_hpo
+    _WORKER_ALLELIC_REQUIREMENT = allelic_requirement
+
+
+def _validate_in_worker(indi:Individual) -> ValidatedIndividual:
+    vindi = ValidatedIndividual(individual=indi)
+    vindi.validate(ontology=_WORKER_ONTOLOGY, min_hpo=_WORKER_MIN_HPO, allelic_requirement=_WORKER_ALLELIC_REQUIREMENT)
+    return vindi
+
+
 class CohortValidator:
+    """
+    Validate all individuals of a cohort.
+
+    Validation of each individual is independent of the other individuals. If `n_workers` is greater than one,
+    the individuals are validated in a pool of worker processes. The ontology is sent to each worker once, when the
+    worker is started, and the results are returned in the order of the cohort.
 
-    def __init__(self, cohort:List[Individual], ontology:hpotk.MinimalOntology, min_hpo:int,  allelic_requirement:AllelicRequirement=None) -> None:
+    :param cohort: list of individuals to validate
+    :type cohort: List[Individual]
+    :param ontology: HPO object
+    :type ontology: hpotk.MinimalOntology
+    :param min_hpo: minimum number of phenotypic features (HP terms) for a phenopacket to be considered valid
+    :type min_hpo: int
+    :param allelic_requirement: used to check number of alleles and variants
+    :type allelic_requirement: AllelicRequirement
+    :param n_workers: number of worker processes (default: 1, i.e., validate in the current process)
+    :type n_workers: int
+    """
+
+    def __init__(self, cohort:List[Individual], ontology:hpotk.MinimalOntology, min_hpo:int,  allelic_requirement:AllelicRequirement=None, n_workers:int=1) -> None:
+        if n_workers < 1:
+            raise ValueError(f"n_workers argument must be at least 1 but was {n_workers}")
         self._cohort = cohort
         self._ontology = ontology
-        self._validated_individual_list = []
-        for indi in cohort:
-            vindi = ValidatedIndividual(individual=indi)
-            vindi.validate(ontology=ontology, min_hpo=min_hpo, allelic_requirement=allelic_requirement)
-            self._validated_individual_list.append(vindi)
+        if n_workers == 1 or len(cohort) < 2:
+            self._validated_individual_list = []
+            for indi in cohort:
+                vindi = ValidatedIndividual(individual=indi)
+                vindi.validate(ontology=ontology, min_hpo=min_hpo, allelic_requirement=allelic_requirement)
+                self._validated_individual_list.append(vindi)
+        else:
+            self._validated_individual_list = CohortValidator._validate_in_parallel(cohort=cohort,
+                                                                                  ontology=ontology,
+                                                                                  min_hpo=min_hpo,
+                                                                                  allelic_requirement=allelic_requirement,
+                                                                                  n_workers=n_workers)
         if len(cohort) != len(self._validated_individual_list):
             # should never happen
             raise ValueError(f"Invalid validation: size of cohort ={len(cohort)} but size of validated individual = {len(self._validated_individual_list)}")
         self._error_free_individuals = [vi.get_individual_with_clean_terms() for vi in self._validated_individual_list if not vi.has_unfixed_error()]
         self._v_individuals_with_unfixable_errors = [vi for vi in self._validated_individual_list if vi.has_unfixed_error()]
 
+    @staticmethod
+    def _validate_in_parallel(cohort:List[Individual],
+                              ontology:hpotk.MinimalOntology,
+                              min_hpo:int,
+                              allelic_requirement:AllelicRequirement,
+                              n_workers:int) -> List[ValidatedIndividual]:
+        chunksize = max(1, len(cohort) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker,
+                                 initargs=(ontology, min_hpo, allelic_requirement)) as executor:
+            validated_individual_list = list(executor.map(_validate_in_worker, cohort, chunksize=chunksize))
+        # The workers validated copies of the individuals. As in the serial case, the validated individuals
+        # should refer to the original objects, and the original objects should get the clean terms
+        for indi, vindi in zip(cohort, validated_individual_list):
+            vindi.set_individual(indi)
+        return validated_individual_list
+
     def get_validated_individual_list(self):
         """
         :returns: list of all individuals with QC Validation results
@@ -1,10 +1,11 @@
 import hpotk
 from collections import Counter
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from ..creation.hp_term import HpTerm
 from .validation_result import ValidationResult, ValidationResultBuilder
 from collections import defaultdict
 from ..creation.individual import Individual
+from ..creation.ontology_index import OntologyIndex
 
 
 
@@ -15,6 +16,8 @@ class OntologyQC:
     2. observed superclass and observed subclass (this is a redundancy but arguably not an error)
     3. Same term is excluded and observed (this is an unfixable error in the original data)
 
+    The ancestor queries are answered by an :class:`OntologyIndex` that is shared by all OntologyQC objects
+    that use the same HPO release.
     """
 
     def __init__(self,
@@ -23,13 +26,27 @@ class OntologyQC:
                  fix_conflicts=True,
                  fix_redundancies=True):
         self._ontology = ontology
+        self._ontology_index = OntologyIndex.for_ontology(ontology)
         self._individual = individual
         self._phenopacket_id = individual.get_phenopacket_id()
         self._fix_conflict_flag = fix_conflicts
         self._fix_redundancy_flag = fix_redundancies
         self._errors = []
+        self._ancestor_id_d = {}
         self._clean_hpo_terms = self._clean_terms()
 
+    def _get_ancestor_ids(self, hpo_id: str) -> FrozenSet[str]:
+        """
+        :param hpo_id: an HPO identifier, e.g., HP:0001166
+        :returns: the identifiers of all ancestors of the term (excluding the term itself)
+        :raises ValueError: if the term is not in the ontology
+        """
+        ancestor_ids = self._ancestor_id_d.get(hpo_id)
+        if ancestor_ids is None:
+            ancestor_ids = frozenset(self._ontology_index.get_ancestors(hpo_id))
+            self._ancestor_id_d[hpo_id] = ancestor_ids
+        return ancestor_ids
+
 
     def _fix_conflicts(self,
                        observed_hpo_terms:List[HpTerm],
@@ -55,16 +72,22 @@ class OntologyQC:
             # i.e., there can be no conflict
             return excluded_hpo_terms
         all_excluded_term_ids = {term.id for term in excluded_hpo_terms}
+        # We report the errors in the iteration order of all_excluded_term_ids
+        excluded_id_order = {tid: i for i, tid in enumerate(all_excluded_term_ids)}
         conflicting_term_id_set = set()
         for term in observed_hpo_terms:
-            for tid in all_excluded_term_ids:
+            matching_term_ids = all_excluded_term_ids.intersection(self._get_ancestor_ids(term.id))
+            if term.id in all_excluded_term_ids:
+                matching_term_ids.add(term.id)
+            for tid in sorted(matching_term_ids, key=excluded_id_order.get):
                 if term.id == tid:
                     # same term observed and excluded
                     # we cannot automatically fix this error
                     # this will be reported and the user will need to check the input data
                     error = ValidationResultBuilder(phenopacket_id=self._phenopacket_id).observed_and_excluded_term(term=term).build()
                     self._errors.append(error)
-                elif self._ontology.graph.is_ancestor_of(tid, term.id):
+                else:
+                    # tid is an ancestor of the observed term
                     conflicting_term_id_set.add(tid)
                     conflicting_term = self._ontology.get_term(term_id=tid)
                     cterm = HpTerm.from_hpo_tk_term(conflicting_term)
@@ -98,13 +121,20 @@ class OntologyQC:
             # The following removes duplicates under the assumption that all components of the HpTerm are equal
             hpo_terms = set(hpo_terms)
         # The following code checks for other kinds of redundancies
+        # Rather than testing all pairs of terms, we intersect the ancestors of each term with the ids of the other
+        # terms. The matches are visited in the iteration order of all_terms to report the errors in a stable order
+        term_list = list(all_terms)
+        id_to_positions = defaultdict(list)
+        for i, term in enumerate(term_list):
+            id_to_positions[term.id].append(i)
+        all_term_ids = set(id_to_positions.keys())
         redundant_term_d = {}
-        for term in all_terms:
-            for term2 in all_terms:
-                # The ancestor, e.g. Seizure comes first, the other term, e.g. Clonic seizure, second
-                # in the following function call
-                if self._ontology.graph.is_ancestor_of(term2.id, term.id):
-                    redundant_term_d[term2] = term
+        for term in term_list:
+            ancestor_ids = all_term_ids & self._get_ancestor_ids(term.id)
+            positions = sorted(i for tid in ancestor_ids for i in id_to_positions[tid])
+            for i in positions:
+                # term_list[i] is an ancestor (e.g. Seizure) of term (e.g., Clonic seizure)
+                redundant_term_d[term_list[i]] = term
         # When we get here, we have scanned all terms for redundant ancestors
         non_redundant_terms = [ term for term in hpo_terms if term not in redundant_term_d]
         if len(redundant_term_d) > 0:
@@ -174,21 +204,34 @@ class OntologyQC:
         observed_terms_without_onset = self._fix_redundancies(observed_terms_without_onset)
         excluded_terms_without_onset = self._fix_redundancies(excluded_terms_without_onset)
         all_term_set = set(clean_terms)
+        # ids of the terms in all_term_set and the ids of the terms together with all of their ancestors.
+        # We use these to skip the comparison with all_term_set if a term is unrelated to all terms in the set
+        all_term_ids = set()
+        covered_term_ids = set()
+        for s in all_term_set:
+            all_term_ids.add(s.id)
+            covered_term_ids.add(s.id)
+            covered_term_ids.update(self._get_ancestor_ids(s.id))
         for t in observed_terms_without_onset:
             addT = True
-            for s in all_term_set:
+            if t.id not in covered_term_ids and all_term_ids.isdisjoint(self._get_ancestor_ids(t.id)):
+                # t is neither equal to, nor an ancestor, nor a descendant of any term in all_term_set
+                candidate_terms = []
+            else:
+                candidate_terms = all_term_set
+            for s in candidate_terms:
                 # keep the term with the age of onset regardless of whether it is more or less specific
                 if s.id == t.id:
                     error = ValidationResultBuilder(self._phenopacket_id).duplicate_term(s).build()
                     self._errors.append(error)
                     addT = False
                     break
-                if self._ontology.graph.is_ancestor_of(t.id, s.id):
+                if t.id in self._get_ancestor_ids(s.id):
                     error = ValidationResultBuilder(self._phenopacket_id).redundant_term(t, s).build()
                     self._errors.append(error)
                     addT = False
                     break
-                if self._ontology.graph.is_ancestor_of(s.id, t.id):
+                if s.id in self._get_ancestor_ids(t.id):
                     error = ValidationResultBuilder(self._phenopacket_id).redundant_term(s, t).build()
                     self._errors.append(error)
                     addT = False
@@ -196,16 +239,21 @@ class OntologyQC:
             if addT:
                 clean_terms.append(t)
                 all_term_set.add(t)
+                all_term_ids.add(t.id)
+                covered_term_ids.add(t.id)
+                covered_term_ids.update(self._get_ancestor_ids(t.id))
         # now check for problems with excluded terms
         for t in excluded_terms_without_onset:
             addT = True
-            for s in all_term_set:
+            # t can only be equal to or an ancestor of an observed term if it is covered
+            candidate_terms = all_term_set if t.id in covered_term_ids else []
+            for s in candidate_terms:
                 # if an excluded term is equal to or ancestor of an observed term this is an error
                 if s.id == t.id:
                     error = ValidationResultBuilder(self._phenopacket_id).observed_and_excluded_term(term=s).build()
                     self._errors.append(error)
                     addT = False
-                elif self._ontology.graph.is_ancestor_of(t.id, s.id):
+                elif t.id in self._get_ancestor_ids(s.id):
                     error = ValidationResultBuilder(self._phenopacket_id).conflict(term=s, conflicting_term=t).build()
                     self._errors.append(error)
                     addT = False
@@ -213,6 +261,9 @@ class OntologyQC:
             if addT:
                 clean_terms.append(t)
                 all_term_set.add(t)
+                all_term_ids.add(t.id)
+                covered_term_ids.add(t.id)
+                covered_term_ids.update(self._get_ancestor_ids(t.id))
 
         return clean_terms
 
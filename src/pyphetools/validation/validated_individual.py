@@ -50,6 +50,17 @@ class ValidatedIndividual:
         indi.set_hpo_terms(self._clean_terms)
         return indi
 
+    def set_individual(self, individual:Individual) -> None:
+        """
+        Replace the validated Individual by an equivalent object and set its clean terms. This is used if the
+        validation was performed on a copy of the Individual, e.g., in a worker process.
+
+        :param individual: the Individual that was validated (or an equivalent object)
+        :type individual: Individual
+        """
+        self._individual = individual
+        self._individual.set_hpo_terms(self._clean_terms)
+
     def get_validation_errors(self) -> List[ValidationResult]:
         return self._validation_errors
 
@@ -12,5 +12,7 @@ from .simple_age import SimpleAge
 from .simple_patient import SimplePatient
 from .simple_variant import SimpleVariant
 from .hpo_category import HpoCategorySet
+from .cohort_matrix import CohortMatrix
+from .cohort_term_counter import PropagatedTermCounter
 
 
@@ -0,0 +1,249 @@
+import math
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .simple_patient import SimplePatient
+from ..pp.v202 import time_element_to_days
+
+
+class CohortMatrix:
+    """
+    Columnar representation of a cohort of phenopackets.
+
+    The phenopackets are flattened once into arrays so that counts and frequencies can be computed with
+    vectorized NumPy/pandas operations rather than by looping over the patients.
+
+    The HPO annotations are stored as a sparse individual x HPO term matrix in compressed sparse row (CSR) form:
+    the annotations of the individual with index `i` are at positions `indptr[i]:indptr[i+1]` of the `indices`
+    (the column, i.e. the term index) and `data` (:attr:`OBSERVED` or :attr:`EXCLUDED`) arrays.
+    As in :class:`SimplePatient`, a term that is both observed and excluded in an individual is counted as observed.
+
+    The variants are stored in the same way, the variants of the individual with index `i` are at positions
+    `variant_indptr[i]:variant_indptr[i+1]` of the `variant_indices` array, which point into :attr:`variant_labels`.
+
+    :param patient_list: the individuals of the cohort
+    :type patient_list: typing.List[SimplePatient]
+    """
+    OBSERVED = 1
+    EXCLUDED = -1
+
+    def __init__(self, patient_list: typing.List[SimplePatient]) -> None:
+        term_to_idx = {}
+        term_labels = []
+        variant_to_idx = {}
+        indptr = [0]
+        indices = []
+        data = []
+        variant_indptr = [0]
+        variant_indices = []
+        patient_ids = []
+        sex = []
+        age_in_days = []
+        disease = []
+        pmid = []
+        for pat in patient_list:
+            patient_ids.append(pat.get_phenopacket_id())
+            sex.append(pat.get_sex())
+            age_in_days.append(CohortMatrix._age_in_days(pat))
+            disease.append(pat.get_disease())
+            pmid.append(pat.get_pmid())
+            for status, term_d in ((CohortMatrix.OBSERVED, pat.get_observed_hpo_d()),
+                                   (CohortMatrix.EXCLUDED, pat.get_excluded_hpo_d())):
+                for hpo_id, hp_term in term_d.items():
+                    idx = term_to_idx.get(hpo_id)
+                    if idx is None:
+                        idx = len(term_labels)
+                        term_to_idx[hpo_id] = idx
+                        term_labels.append(hp_term.label)
+                    indices.append(idx)
+                    data.append(status)
+            indptr.append(len(indices))
+            for var in pat.get_variant_list():
+                var_label = var.get_display()
+                idx = variant_to_idx.get(var_label)
+                if idx is None:
+                    idx = len(variant_to_idx)
+                    variant_to_idx[var_label] = idx
+                variant_indices.append(idx)
+            variant_indptr.append(len(variant_indices))
+
+        self._term_ids = np.array(list(term_to_idx.keys()), dtype=object)
+        self._term_labels = np.array(term_labels, dtype=object)
+        self._term_to_idx = term_to_idx
+        self._indptr = np.array(indptr, dtype=np.int64)
+        self._indices = np.array(indices, dtype=np.int32)
+        self._data = np.array(data, dtype=np.int8)
+        self._variant_labels = np.array(list(variant_to_idx.keys()), dtype=object)
+        self._variant_indptr = np.array(variant_indptr, dtype=np.int64)
+        self._variant_indices = np.array(variant_indices, dtype=np.int32)
+        self._patient_ids = np.array(patient_ids, dtype=object)
+        self._sex = np.array(sex, dtype=object)
+        self._age_in_days = np.array(age_in_days, dtype=np.float64)
+        self._disease = np.array(disease, dtype=object)
+        self._pmid = np.array(pmid, dtype=object)
+
+    @staticmethod
+    def from_phenopackets(ppkt_list: typing.Iterable) -> "CohortMatrix":
+        """
+        :param ppkt_list: GA4GH phenopackets
+        :type ppkt_list: typing.Iterable[PPKt.Phenopacket]
+        :returns: the matrix for the cohort of phenopackets
+        :rtype: CohortMatrix
+        """
+        return CohortMatrix([SimplePatient(ga4gh_phenopacket=ppkt) for ppkt in ppkt_list])
+
+    @staticmethod
+    def _age_in_days(pat: SimplePatient) -> float:
+        age = pat.get_age()
+        if age is None:
+            return math.nan
+        try:
+            return float(time_element_to_days(age))
+        except ValueError:
+            # e.g. an onset class we cannot convert to days
+            return math.nan
+
+    @property
+    def n_patients(self) -> int:
+        return len(self._patient_ids)
+
+    @property
+    def n_terms(self) -> int:
+        return len(self._term_ids)
+
+    @property
+    def patient_ids(self) -> np.ndarray:
+        return self._patient_ids
+
+    @property
+    def term_ids(self) -> np.ndarray:
+        """
+        :returns: the HPO ids of the matrix columns
+        """
+        return self._term_ids
+
+    @property
+    def term_labels(self) -> np.ndarray:
+        """
+        :returns: the HPO labels of the matrix columns
+        """
+        return self._term_labels
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    @property
+    def sex(self) -> np.ndarray:
+        """
+        :returns: the sex of the individuals (MALE, FEMALE, OTHER, or UNKNOWN)
+        """
+        return self._sex
+
+    @property
+    def age_in_days(self) -> np.ndarray:
+        """
+        :returns: the age at last encounter in days, `nan` if not available
+        """
+        return self._age_in_days
+
+    @property
+    def disease(self) -> np.ndarray:
+        return self._disease
+
+    @property
+    def pmid(self) -> np.ndarray:
+        """
+        :returns: the PMIDs of the individuals, `None` if not available
+        """
+        return self._pmid
+
+    @property
+    def variant_labels(self) -> np.ndarray:
+        return self._variant_labels
+
+    @property
+    def variant_indptr(self) -> np.ndarray:
+        return self._variant_indptr
+
+    @property
+    def variant_indices(self) -> np.ndarray:
+        return self._variant_indices
+
+    def get_term_idx(self, hpo_id: str) -> typing.Optional[int]:
+        """
+        :returns: the column index of the HPO term or None if the term is not annotated in the cohort
+        """
+        return self._term_to_idx.get(hpo_id)
+
+    def get_row_idx(self) -> np.ndarray:
+        """
+        :returns: the row (individual) index of each annotation in `indices` and `data`
+        """
+        return np.repeat(np.arange(self.n_patients), np.diff(self._indptr))
+
+    def to_dense(self) -> np.ndarray:
+        """
+        :returns: a dense individual x HPO term matrix with :attr:`OBSERVED`, :attr:`EXCLUDED`, or `0` (not annotated)
+        """
+        dense = np.zeros((self.n_patients, self.n_terms), dtype=np.int8)
+        dense[self.get_row_idx(), self._indices] = self._data
+        return dense
+
+    def _count(self, status: int, mask: typing.Optional[np.ndarray]) -> np.ndarray:
+        selected = self._data == status
+        if mask is not None:
+            selected &= np.asarray(mask, dtype=bool)[self.get_row_idx()]
+        return np.bincount(self._indices[selected], minlength=self.n_terms)
+
+    def observed_counts(self, mask: typing.Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        :param mask: optional boolean array to only count a subset of the individuals
+        :returns: the number of individuals in whom each term was observed
+        """
+        return self._count(CohortMatrix.OBSERVED, mask)
+
+    def excluded_counts(self, mask: typing.Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        :param mask: optional boolean array to only count a subset of the individuals
+        :returns: the number of individuals in whom each term was excluded
+        """
+        return self._count(CohortMatrix.EXCLUDED, mask)
+
+    def terms_per_patient(self) -> np.ndarray:
+        """
+        :returns: the number of HPO terms (observed and excluded) of each individual
+        """
+        return np.diff(self._indptr)
+
+    def term_count_table(self) -> pd.DataFrame:
+        """
+        :returns: a table with the number of individuals in whom each term was observed or excluded
+        """
+        observed = self.observed_counts()
+        excluded = self.excluded_counts()
+        df = pd.DataFrame({
+            "HPO": self._term_ids,
+            "label": self._term_labels,
+            "observed": observed,
+            "excluded": excluded,
+            "frequency": observed / (observed + excluded),
+        })
+        return df.sort_values(by=["observed", "HPO"], ascending=[False, True]).reset_index(drop=True)
+
+    def variant_counts(self) -> pd.Series:
+        """
+        :returns: the number of times each variant was reported in the cohort
+        """
+        counts = np.bincount(self._variant_indices, minlength=len(self._variant_labels))
+        return pd.Series(counts, index=self._variant_labels, dtype=np.int64)
@@ -0,0 +1,129 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .cohort_matrix import CohortMatrix
+from ..creation.ontology_index import OntologyIndex
+
+ALL_ROOT = "HP:0000001"
+PHENOTYPIC_ABNORMALITY_ROOT = "HP:0000118"
+
+
+class PropagatedTermCounter:
+    """
+    Count the observed HPO terms of a cohort, with and without propagation of the annotations to the ancestor terms.
+
+    The counts are computed in one vectorized step from the sparse individual x term matrix of :class:`CohortMatrix`
+    and the precomputed ancestor closure of :class:`OntologyIndex`: each (individual, term) annotation is expanded into
+    the (individual, ancestor) pairs, the duplicate pairs (ancestors shared by several terms of an individual) are
+    removed, and the pairs are counted per term. An individual is therefore counted at most once per term.
+
+    As in the summary tables, the propagated counts do not include the root terms `All` (HP:0000001) and
+    `Phenotypic abnormality` (HP:0000118).
+
+    :param matrix: the cohort
+    :type matrix: CohortMatrix
+    :param ontology_index: the index of the HPO release used to annotate the cohort
+    :type ontology_index: OntologyIndex
+    :param root_id: if given, only count the terms that are descendants of this term (e.g., HP:0000118)
+    :type root_id: typing.Optional[str]
+    :raises ValueError: if an observed term is not in the ontology
+    """
+
+    def __init__(self,
+                 matrix: CohortMatrix,
+                 ontology_index: OntologyIndex,
+                 root_id: typing.Optional[str] = None) -> None:
+        self._matrix = matrix
+        self._ontology_index = ontology_index
+        observed = matrix.data == CohortMatrix.OBSERVED
+        columns = matrix.indices[observed]
+        # map the columns of the matrix to the term indices of the ontology
+        col_to_term = np.empty(matrix.n_terms, dtype=np.int64)
+        keep_col = np.ones(matrix.n_terms, dtype=bool)
+        for col, hpo_id in enumerate(matrix.term_ids):
+            idx = ontology_index.get_idx(hpo_id)
+            if idx is None:
+                col_to_term[col] = -1
+            else:
+                col_to_term[col] = idx
+                if root_id is not None:
+                    keep_col[col] = ontology_index.is_descendant_of(hpo_id, root_id)
+        unknown = col_to_term[columns] < 0
+        if np.any(unknown):
+            raise ValueError(f"No graph node found for {matrix.term_ids[columns[unknown][0]]}")
+        keep = keep_col[columns]
+        self._rows = matrix.get_row_idx()[observed][keep]
+        self._columns = columns[keep]
+        self._terms = col_to_term[self._columns]
+
+    def _propagate(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        :returns: the individual (row) and term index of the annotations, propagated to the ancestors and deduplicated
+        """
+        anc_indptr, anc_indices = self._ontology_index.get_ancestor_csr()
+        starts = anc_indptr[self._terms]
+        lengths = anc_indptr[self._terms + 1] - starts
+        # positions of the ancestors of all annotations in `anc_indices`, without a Python loop
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        ancestors = anc_indices[np.repeat(starts, lengths) + offsets]
+        rows = np.concatenate((np.repeat(self._rows, lengths), self._rows))
+        terms = np.concatenate((ancestors, self._terms))
+        n_terms = len(self._ontology_index)
+        pairs = np.sort(rows * n_terms + terms)
+        if len(pairs) > 0:
+            pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        return pairs // n_terms, pairs % n_terms
+
+    @staticmethod
+    def _split(rows: np.ndarray,
+               terms: np.ndarray,
+               focus_mask: np.ndarray,
+               n_terms: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+        in_focus = focus_mask[rows]
+        focus = np.bincount(terms[in_focus], minlength=n_terms)
+        other = np.bincount(terms[~in_focus], minlength=n_terms)
+        return focus, other
+
+    def count(self, focus_mask: typing.Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Count the observed terms in the focus individuals, the other individuals, and in total.
+
+        The table has one row for each term with a direct or a propagated count and the columns `focus`, `other`, `total`
+        (direct annotations) and `focus_propagated`, `other_propagated`, `total_propagated`.
+
+        :param focus_mask: optional boolean array with `True` for the individuals of the focus group
+        :type focus_mask: typing.Optional[np.ndarray]
+        :returns: the counts indexed by the HPO id
+        :rtype: pd.DataFrame
+        """
+        n_patients = self._matrix.n_patients
+        if focus_mask is None:
+            focus_mask = np.zeros(n_patients, dtype=bool)
+        else:
+            focus_mask = np.asarray(focus_mask, dtype=bool)
+            if focus_mask.shape != (n_patients,):
+                raise ValueError(f"focus_mask must have one entry for each of the {n_patients} individuals "
+                                 f"but had shape {focus_mask.shape}")
+        n_terms = len(self._ontology_index)
+        focus, other = PropagatedTermCounter._split(self._rows, self._terms, focus_mask, n_terms)
+        prop_rows, prop_terms = self._propagate()
+        focus_prop, other_prop = PropagatedTermCounter._split(prop_rows, prop_terms, focus_mask, n_terms)
+        for root_id in (ALL_ROOT, PHENOTYPIC_ABNORMALITY_ROOT):
+            root_idx = self._ontology_index.get_idx(root_id)
+            if root_idx is not None:
+                focus_prop[root_idx] = 0
+                other_prop[root_idx] = 0
+        total = focus + other
+        total_prop = focus_prop + other_prop
+        selected = np.flatnonzero((total > 0) | (total_prop > 0))
+        df = pd.DataFrame({
+            "focus": focus[selected],
+            "other": other[selected],
+            "total": total[selected],
+            "focus_propagated": focus_prop[selected],
+            "other_propagated": other_prop[selected],
+            "total_propagated": total_prop[selected],
+        }, index=pd.Index([self._ontology_index.get_term_id(i) for i in selected], name="HPO"))
+        return df
@@ -1,17 +1,20 @@
 from .simple_patient import SimplePatient
 from ..creation.hpo_parser import HpoParser
+import numpy as np
 import pandas as pd
 import phenopackets as PPKt
 import typing
+from .cohort_matrix import CohortMatrix
+from .cohort_term_counter import PropagatedTermCounter
 from .hpo_category import HpoCategorySet
-from hpotk.model import TermId
+from ..creation.ontology_index import OntologyIndex
 from collections import defaultdict
 import hpotk
 from enum import Enum
 
 
-ALL_ROOT = TermId.from_curie("HP:0000001")
-PHENOTYPIC_ABNORMALITY_ROOT = TermId.from_curie("HP:0000118")
+ALL_ROOT = "HP:0000001"
+PHENOTYPIC_ABNORMALITY_ROOT = "HP:0000118"
 
 class HpoStatus(Enum):
     OBSERVED = 1, "observed"
@@ -71,33 +74,14 @@ class DetailedSupplTable:
             else:
                 raise ValueError(f"patient_d values must be GA4GH Phenopackets but was {type(v)}")
         self._hp_ontology = hp_ontology
-        self._total_counts = defaultdict(int)
-        self._total_counts_propagated = defaultdict(int)
-        sex_d = defaultdict(int)
-        var_d = defaultdict(int)
-        for pat in self._simple_patient_list:
-            sex_d[pat.get_sex()] += 1
-            hpo_terms = pat.get_observed_hpo_d()
-            anc_set = set() # graph with ancestors induced by all terms of the patient
-            for hp_id in hpo_terms.keys():
-                # key is a string such as HP:0001234, value is an HpTerm object
-                # we need to convert it to an object from hpo-toolkit because get_ancestors returns HpTerm objects
-                hp_termid = TermId.from_curie(hp_id)
-                if not self._hp_ontology.graph.is_descendant_of(hp_termid, PHENOTYPIC_ABNORMALITY_ROOT):
-                    continue # do not count terms that are not phenotypes
-                ancs = self._hp_ontology.graph.get_ancestors(hp_termid)
-                anc_set.add(hp_termid)
-                anc_set.update(ancs)
-                self._total_counts[hp_id] += 1
-            for hp_id in anc_set:
-                if hp_id == ALL_ROOT or hp_id == PHENOTYPIC_ABNORMALITY_ROOT:
-                    continue
-                else:
-                    self._total_counts_propagated[hp_id.value] += 1
-            variants = pat.get_variant_list()
-            for var in variants:
-                var_d[var] += 1
-        self._hpo_category_set = HpoCategorySet(ontology=hp_ontology)
+        self._ontology_index = OntologyIndex.for_ontology(hp_ontology)
+        self._matrix = CohortMatrix(self._simple_patient_list)
+        # do not count terms that are not phenotypes
+        counter = PropagatedTermCounter(self._matrix, self._ontology_index, root_id=PHENOTYPIC_ABNORMALITY_ROOT)
+        counts = counter.count()
+        self._total_counts = counts.loc[counts["total"] > 0, "total"].to_dict()
+        self._total_counts_propagated = counts.loc[counts["total_propagated"] > 0, "total_propagated"].to_dict()
+        self._hpo_category_set = HpoCategorySet.for_ontology(hp_ontology)
 
     def _calculate_table(self, patient_list: typing.List[PPKt.Phenopacket], ) -> typing.List[typing.List[str]]:
         for pat in self._simple_patient_list:
@@ -189,15 +173,22 @@ class DetailedSupplTable:
         middle_txt = "".join(middle)
         header = f"<tr><th>HPO term</th>{middle_txt}</tr>"
         table_items.append(header)
+        # observed counts of all terms for each PMID, computed once rather than for each cell
+        pmid_counts_d = {}
+        for pmid in sorted_pmids:
+            if pmid == "n/a":
+                mask = np.array([p is None for p in self._matrix.pmid], dtype=bool)
+            else:
+                mask = self._matrix.pmid == pmid
+            pmid_counts_d[pmid] = self._matrix.observed_counts(mask=mask)
         for hpo_term_id in sorted_hpos:
             hpo_term = hpo_id_to_display_d.get(hpo_term_id)
+            term_idx = self._matrix.get_term_idx(hpo_term_id)
             line_items = []
             line_items.append(f"<tr><td>{hpo_term}</td>")
             for pmid in sorted_pmids:
-                simple_pat_list = by_pmid_d.get(pmid)
-                counts_d = DetailedSupplTable._get_counts_dict(simple_pat_list)
-                M = len(simple_pat_list)
-                N = counts_d.get(hpo_term_id, 0)
+                M = len(by_pmid_d.get(pmid))
+                N = int(pmid_counts_d[pmid][term_idx])
                 cell_contents = f"{N}/{M} ({100*N/M:.1f}%)"
                 line_items.append(f"<td>{cell_contents}</td>")
             line_items.append("</tr>\n")
@@ -4,7 +4,8 @@ import pandas as pd
 import hpotk
 import phenopackets as PPKt
 from ..creation.hpo_parser import HpoParser
-from ..pp.v202 import Phenopacket as Phenopacket202
+from ..creation.ontology_index import OntologyIndex
+from ..pp.v202 import LazyPhenopacket
 from ..pp.v202 import OntologyClass as OntologyClass202
 
 TARGET_DISEASE_ID = "MONDO:0000001"
@@ -118,12 +119,14 @@ class DiseaseSpecificHpoCounter:
         :param hpo: Reference to HPO ontology object (if nulll, will be created in constructor)
         :type hpo: hpotk.MinimalOntology
         """
-        v202_ppkt = [Phenopacket202.from_message(ppkt) for ppkt in ppkt_list]
+        # We only need the diseases and phenotypic features, the other fields are not decoded.
+        v202_ppkt = [LazyPhenopacket.from_message(ppkt) for ppkt in ppkt_list]
         if hpo is None:
             parser = HpoParser()
             self._hpo = parser.get_ontology()
         else:
             self._hpo = hpo
+        ontology_index = OntologyIndex.for_ontology(self._hpo)
         disease_dict = defaultdict(list)
         for ppkt in v202_ppkt:
             if len(ppkt.diseases) != 1:
@@ -155,24 +158,24 @@ class DiseaseSpecificHpoCounter:
                             print("############# WARNING #############")
                             print(f"Use of outdated id {oclzz.id} ({oclzz.label}). Replacing with {hpo_term.identifier.value}.")
                             print("###################################") 
-                        oclzz = OntologyClass202(id=hpo_term.identifier.value, label=hpo_term.name)
+                        oclzz = OntologyClass202.intern(id=hpo_term.identifier.value, label=hpo_term.name)
                     hpo_id = oclzz.id
                     self._hpo_term_ids_for_display.add(hpo_id)
                     if pf.excluded:
-                        desc_set = self._hpo.graph.get_descendants(hpo_id, include_source=True)
+                        desc_set = ontology_index.get_descendants(hpo_id, include_source=True)
                         excluded_with_descendants.update(desc_set)
                     else:
-                        ancs_set = self._hpo.graph.get_ancestors(hpo_id, include_source=True)
+                        ancs_set = ontology_index.get_ancestors(hpo_id, include_source=True)
                         observed_with_ancestors.update(ancs_set)
                 for hpo_id in observed_with_ancestors:
                     hpo_label = self._hpo.get_term_name(hpo_id)
-                    oclzz = OntologyClass202(id=hpo_id, label=hpo_label)
+                    oclzz = OntologyClass202.intern(id=hpo_id, label=hpo_label)
                     if oclzz not in hpo_to_counter:
                         hpo_to_counter[oclzz] = HpoCohortCount(hpo=oclzz)
                     hpo_to_counter.get(oclzz).increment_observed(disease_term)
                 for hpo_id in excluded_with_descendants:
                     hpo_label = self._hpo.get_term_name(hpo_id)
-                    oclzz = OntologyClass202(id=hpo_id, label=hpo_label)
+                    oclzz = OntologyClass202.intern(id=hpo_id, label=hpo_label)
                     if oclzz not in hpo_to_counter:
                         hpo_to_counter[oclzz] = HpoCohortCount(hpo=oclzz)
                     hpo_to_counter.get(oclzz).increment_excluded(disease_term)
@@ -189,7 +192,7 @@ class DiseaseSpecificHpoCounter:
         items = list()
         for hpo2c in self._hpo_to_counter_list:
             hpo_term = hpo2c.hpo
-            if hpo_term.id.value not in self._hpo_term_ids_for_display:
+            if hpo_term.id not in self._hpo_term_ids_for_display:
                 continue ## these will be the inferrence ancestors classes that are not used for explicitly for annotation, we want to skip them
             d = dict()
             d["HPO"] = hpo2c.hpo_display
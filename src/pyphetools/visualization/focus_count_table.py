@@ -1,12 +1,12 @@
-from collections import defaultdict
-
+import numpy as np
 import pandas as pd
-from hpotk.model import TermId
-
+from .cohort_matrix import CohortMatrix
+from .cohort_term_counter import PropagatedTermCounter
 from .hpo_category import HpoCategorySet
+from ..creation.ontology_index import OntologyIndex
 
-ALL_ROOT = TermId.from_curie("HP:0000001")
-PHENOTYPIC_ABNORMALITY_ROOT = TermId.from_curie("HP:0000118")
+ALL_ROOT = "HP:0000001"
+PHENOTYPIC_ABNORMALITY_ROOT = "HP:0000118"
 
 
 class FocusCountTable:
@@ -24,47 +24,21 @@ class FocusCountTable:
         if len(self._focus_id_list) < 1:
             raise ValueError("Must provide at least one focus ID for FocusCountTable")
         self._ontology = ontology
-        self._total_counts = defaultdict(int)
-        self._focus_counts = defaultdict(int)
-        self._non_focus_counts = defaultdict(int)
-        self._total_counts_propagated = defaultdict(int)
-        self._focus_counts_propagated = defaultdict(int)
-        self._non_focus_counts_propagated = defaultdict(int)
+        self._ontology_index = OntologyIndex.for_ontology(ontology)
         self._n_patients = len(patient_d)
-
-        sex_d = defaultdict(int)
-        var_d = defaultdict(int)
-
-        for pat_id, pat in self._patient_d.items():
-            sex_d[pat.get_sex()] += 1
-            hpo_terms = pat.get_observed_hpo_d()
-            anc_set = set()  # graph with ancestors induced by all terms of the patient
-            for hp_id in hpo_terms.keys():
-                # key is a string such as HP:0001234, value is an HpTerm object
-                # we need to convert it to an object from hpo-toolkit because get_ancestors returns HpTerm objects
-                hp_termid = TermId.from_curie(hp_id)
-                ancs = self._ontology.graph.get_ancestors(hp_termid)
-                anc_set.add(hp_termid)
-                anc_set.update(ancs)
-                if pat_id in focus_id:
-                    self._focus_counts[hp_id] += 1
-                else:
-                    self._non_focus_counts[hp_id] += 1
-                self._total_counts[hp_id] += 1
-            for hp_id in anc_set:
-                if hp_id == ALL_ROOT or hp_id == PHENOTYPIC_ABNORMALITY_ROOT:
-                    continue
-                if pat_id in focus_id:
-                    self._focus_counts_propagated[hp_id.value] += 1
-                else:
-                    self._non_focus_counts_propagated[hp_id.value] += 1
-                self._total_counts_propagated[hp_id.value] += 1
-            variant_d = pat.get_variant_list()
-            for var in variant_d:
-                var_d[var] += 1
-
-            # TODO figure out what to do with biallelic
-        self._hpo_category_set = HpoCategorySet(ontology=ontology)
+        matrix = CohortMatrix(list(self._patient_d.values()))
+        focus_ids = set(self._focus_id_list)
+        focus_mask = np.array([pat_id in focus_ids for pat_id in self._patient_d], dtype=bool)
+        counts = PropagatedTermCounter(matrix, self._ontology_index).count(focus_mask=focus_mask)
+        direct = counts[counts["total"] > 0]
+        self._total_counts = direct["total"].to_dict()
+        self._focus_counts = direct["focus"].to_dict()
+        self._non_focus_counts = direct["other"].to_dict()
+        propagated = counts[counts["total_propagated"] > 0]
+        self._total_counts_propagated = propagated["total_propagated"].to_dict()
+        self._focus_counts_propagated = propagated["focus_propagated"].to_dict()
+        self._non_focus_counts_propagated = propagated["other_propagated"].to_dict()
+        self._hpo_category_set = HpoCategorySet.for_ontology(ontology)
 
     def get_category(self, termid):
         # TODO figure out what to do with biallelic
@@ -79,11 +53,11 @@ class FocusCountTable:
         """
         rows = []
         N = self._n_patients
-        for hpid, total_count in self._total_counts.items():
+        categories = self._hpo_category_set.get_categories(self._total_counts.keys())
+        for (hpid, total_count), cat in zip(self._total_counts.items(), categories):
             total_per = 100 * total_count / N
             total_s = f"{total_count}/{N} ({total_per:.1f}%)"
             hpterm = self._ontology.get_term(hpid)
-            cat = self.get_category(termid=hpid)
             focus_count = self._focus_counts.get(hpid, 0)
             other_count = self._non_focus_counts.get(hpid, 0)
             d = {'category': cat, 'term': hpterm.name, 'HP:id': hpid, 'focus': focus_count, 'other': other_count,
@@ -103,13 +77,13 @@ class FocusCountTable:
         print(f"Output terms with at least {min_count} counts")
         N = self._n_patients
         rows = []
-        for hpid, total_count in self._total_counts_propagated.items():
-            if total_count < min_count:
-                continue
+        counts = [(hpid, total_count) for hpid, total_count in self._total_counts_propagated.items()
+                  if total_count >= min_count]
+        categories = self._hpo_category_set.get_categories(hpid for hpid, _ in counts)
+        for (hpid, total_count), cat in zip(counts, categories):
             total_per = 100 * total_count / N
             total_s = f"{total_count}/{N} ({total_per:.1f}%)"
             hpterm = self._ontology.get_term(hpid)
-            cat = self.get_category(termid=hpid)
             focus_count = self._focus_counts_propagated.get(hpid, 0)
             other_count = self._non_focus_counts_propagated.get(hpid, 0)
             d = {'category': cat, 'term': hpterm.name, 'HP:id': hpid, 'focus': focus_count, 'other': other_count,
@@ -1,25 +1,114 @@
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from hpotk.constants.hpo.organ_system import *
 from hpotk.model import TermId
 from hpotk.ontology import Ontology
-from hpotk.algorithm import exists_path
+import typing
 from typing import Dict
 
+import numpy as np
+
+from ..creation.ontology_index import OntologyIndex
+
+NOT_FOUND = "not_found"
 
 
 class HpoCategorySet:
+    """
+    Assign HPO terms to organ system categories (e.g., `eye`, `nervous_system`).
+
+    A term belongs to a category if the term is the category term or one of its descendants. The category
+    of each term of the ontology is precomputed once per ontology release and set of categories, and the tables are
+    shared by all instances. Use :meth:`for_ontology` to also share the instance, e.g., between table generators.
+
+    If a term belongs to several categories, :meth:`get_category` returns the first one, in the order of the
+    categories dictionary.
+
+    :param ontology: reference to the HPO
+    :type ontology: hpotk.Ontology
+    :param organ_d: optional dictionary with category names and the corresponding HPO terms
+    :type organ_d: typing.Optional[typing.Dict[str, TermId]]
+    """
+    # maximum number of shared category sets and tables (ontology releases x categories) that are kept
+    MAX_SHARED = 8
+    _shared = OrderedDict()
+    _tables = OrderedDict()
 
     def __init__(self, ontology, organ_d = None) -> None:
         if not isinstance(ontology, Ontology):
             raise ValueError(f"ontology argument must be an hpo-toolkit Ontology object but was {type(ontology)}")
-        self._ontology = ontology
+        # Do not keep a reference to the ontology, shared instances would otherwise keep entire ontologies alive
+        self._ontology_index = OntologyIndex.for_ontology(ontology)
         if organ_d is None:
             self._organ_d = self.get_default_organ_categories()
         else:
             self._organ_d = organ_d
-        self._id_to_cat_d = defaultdict()
-        
+        self._categories = list(self._organ_d.keys())
+        self._membership, self._first_category = HpoCategorySet._get_tables(self._ontology_index, self._organ_d)
+
+    @staticmethod
+    def for_ontology(ontology, organ_d = None) -> "HpoCategorySet":
+        """
+        Get the category set for the ontology. The set is created the first time it is requested for a given ontology
+        release and categories, and shared afterwards.
+
+        :param ontology: reference to the HPO
+        :type ontology: hpotk.Ontology
+        :param organ_d: optional dictionary with category names and the corresponding HPO terms
+        :returns: the shared category set
+        :rtype: HpoCategorySet
+        """
+        index = OntologyIndex.for_ontology(ontology)
+        key = (id(index), HpoCategorySet._categories_key(organ_d))
+        category_set = HpoCategorySet._get_shared(HpoCategorySet._shared, key, index)
+        if category_set is None:
+            category_set = HpoCategorySet(ontology=ontology, organ_d=organ_d)
+            HpoCategorySet._put_shared(HpoCategorySet._shared, key, index, category_set)
+        return category_set
+
+    @staticmethod
+    def _get_shared(cache: OrderedDict, key, ontology_index: OntologyIndex):
+        # The entries keep a reference to the index, so that its id cannot be reused by another index
+        entry = cache.get(key)
+        if entry is None or entry[0] is not ontology_index:
+            return None
+        cache.move_to_end(key)
+        return entry[1]
 
+    @staticmethod
+    def _put_shared(cache: OrderedDict, key, ontology_index: OntologyIndex, value) -> None:
+        cache[key] = (ontology_index, value)
+        cache.move_to_end(key)
+        if len(cache) > HpoCategorySet.MAX_SHARED:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _categories_key(organ_d) -> typing.Optional[typing.Tuple]:
+        if organ_d is None:
+            return None
+        return tuple((cat, OntologyIndex._to_curie(cat_hp_id)) for cat, cat_hp_id in organ_d.items())
+
+    @staticmethod
+    def _get_tables(ontology_index: OntologyIndex, organ_d) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        :returns: a boolean (term x category) membership matrix and the index of the first category of each term
+          (-1 if the term is in no category)
+        """
+        # the index is shared per ontology release, so its identity identifies the release
+        key = (id(ontology_index), HpoCategorySet._categories_key(organ_d))
+        tables = HpoCategorySet._get_shared(HpoCategorySet._tables, key, ontology_index)
+        if tables is None:
+            desc_indptr, desc_indices = ontology_index.get_descendant_csr()
+            membership = np.zeros((len(ontology_index), len(organ_d)), dtype=bool)
+            for col, cat_hp_id in enumerate(organ_d.values()):
+                cat_idx = ontology_index.get_idx(cat_hp_id)
+                if cat_idx is None:
+                    continue
+                membership[desc_indices[desc_indptr[cat_idx]:desc_indptr[cat_idx + 1]], col] = True
+                membership[cat_idx, col] = True
+            first_category = np.where(membership.any(axis=1), membership.argmax(axis=1), -1)
+            tables = membership, first_category
+            HpoCategorySet._put_shared(HpoCategorySet._tables, key, ontology_index, tables)
+        return tables
 
     def get_default_organ_categories(self) -> Dict:
         organ_d = defaultdict(TermId)
@@ -48,18 +137,46 @@ class HpoCategorySet:
         organ_d['neoplasm'] = NEOPLASM
         return organ_d
 
+    def _get_idx_array(self, termids: typing.Iterable) -> np.ndarray:
+        idx_list = []
+        for termid in termids:
+            if not isinstance(termid, (str, TermId)):
+                raise ValueError(f"termid argument must be string (CURIE) or TermId object but was {type(termid)}")
+            idx = self._ontology_index.get_idx(termid)
+            idx_list.append(-1 if idx is None else idx)
+        return np.array(idx_list, dtype=np.int64)
+
     def get_category(self, termid):
-        if isinstance(termid, str):
-            hpo_term_id = TermId.from_curie(termid)
-        elif isinstance(termid, TermId):
-            hpo_term_id = termid.value
-        else:
-            raise ValueError(f"termid argument must be string (CURIE) or TermId object but was {type(termid)}")
-        if hpo_term_id in self._id_to_cat_d:
-            return self._id_to_cat_d.get(hpo_term_id)
-        for cat, cat_hp_id in self._organ_d.items():
-            if exists_path(self._ontology, hpo_term_id, cat_hp_id) or hpo_term_id == cat_hp_id:
-                self._id_to_cat_d[hpo_term_id] = cat
-                return cat
-        print(f"Could not find category for {hpo_term_id}")
-        return "not_found"
\ No newline at end of file
+        """
+        :param termid: a CURIE such as HP:0001251 or a TermId
+        :returns: the name of the (first) category of the term or `not_found`
+        """
+        return self.get_categories([termid])[0]
+
+    def get_categories(self, termids: typing.Iterable, all_categories: bool = False) -> typing.List:
+        """
+        Get the categories of several terms at once.
+
+        :param termids: CURIEs such as HP:0001251 or TermIds
+        :param all_categories: if True, return the list of all categories of each term rather than the first one
+        :type all_categories: bool
+        :returns: the category name (or the list of category names) of each term, `not_found` (or an empty list)
+          for the terms that are not in the ontology or not in any category
+        """
+        termids = list(termids)
+        idx_array = self._get_idx_array(termids)
+        found = idx_array >= 0
+        if all_categories:
+            membership = np.zeros((len(idx_array), len(self._categories)), dtype=bool)
+            membership[found] = self._membership[idx_array[found]]
+            return [[self._categories[c] for c in np.flatnonzero(row)] for row in membership]
+        first_category = np.full(len(idx_array), -1, dtype=np.int64)
+        first_category[found] = self._first_category[idx_array[found]]
+        categories = []
+        for termid, cat in zip(termids, first_category):
+            if cat < 0:
+                print(f"Could not find category for {termid}")
+                categories.append(NOT_FOUND)
+            else:
+                categories.append(self._categories[cat])
+        return categories
@@ -1,11 +1,9 @@
 import os
-import json
 import typing
 from typing import List, Dict
 from datetime import datetime
 
 
-from google.protobuf.json_format import Parse
 
 from ..creation.disease import Disease
 from ..creation.hp_term import HpTerm
@@ -14,6 +12,7 @@ from ..creation.metadata import MetaData
 from ..creation.mode_of_inheritance import Moi
 from .counted_hpo_term import CountedHpoTerm, CohortTermCounter
 from .onset_calculator import OnsetCalculator
+from .phenopacket_ingestor import PhenopacketIngestor
 
 EMPTY_CELL = ""
 
@@ -305,20 +304,16 @@ class HpoaTableBuilder:
             phenopacket_list=None,
             created_by: typing.Optional[str] = None,
             target: typing.Optional[str] = None,
+            n_workers: int = 1,
     ) -> None:
         if indir is not None:
             if not os.path.isdir(indir):
                 raise ValueError(f"indir argument {indir} must be directory!")
             self._indir = indir
-            self._phenopackets = []
-            for file in os.listdir(indir):
-                fname = os.path.join(indir, file)
-                if fname.endswith(".json") and os.path.isfile(fname):
-                    with open(fname) as f:
-                        data = f.read()
-                        jsondata = json.loads(data)
-                        ppack = Parse(json.dumps(jsondata), PPKt.Phenopacket())
-                        self._phenopackets.append(ppack)
+            if n_workers > 1:
+                self._phenopackets = PhenopacketIngestor.load_parallel(indir=indir, n_workers=n_workers)
+            else:
+                self._phenopackets = list(PhenopacketIngestor.iter_phenopackets(indir=indir))
         elif phenopacket_list is not None:
             if target is None:
                 self._phenopackets = phenopacket_list
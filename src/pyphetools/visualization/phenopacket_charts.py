@@ -1,4 +1,4 @@
-from collections import defaultdict
+from .cohort_matrix import CohortMatrix
 from .phenopacket_ingestor import PhenopacketIngestor
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -13,19 +13,12 @@ class PhenopacketCharts:
 
     def __init__(self, indir) -> None:
         ingestor = PhenopacketIngestor(indir=indir)
-        simple_patient_list = list(ingestor.get_simple_patient_list())
-        self._disease_d = defaultdict(int)
-        self._pmid_d = defaultdict(int)
-        self._hpo_count_d = defaultdict(int) # total count
-        self._term_count_d = defaultdict(int)
-
-        for sp in simple_patient_list:
-            self._disease_d[sp.get_disease()] += 1
-            if sp.has_pmid():
-                self._pmid_d[sp.get_pmid()] += 1
-            self._hpo_count_d[sp.get_total_hpo_count()] += 1
-            for hp in sp.get_observed_hpo_d().values():
-                self._term_count_d[hp.label] += 1
+        matrix = CohortMatrix(list(ingestor.get_simple_patient_list()))
+        self._disease_d = pd.Series(matrix.disease).value_counts(sort=False).to_dict()
+        self._pmid_d = pd.Series(matrix.pmid).dropna().value_counts(sort=False).to_dict()
+        self._hpo_count_d = pd.Series(matrix.terms_per_patient()).value_counts(sort=False).to_dict() # total count
+        observed = pd.Series(matrix.observed_counts(), index=matrix.term_labels)
+        self._term_count_d = observed[observed > 0].groupby(level=0, sort=False).sum().to_dict()
 
     def disease_barchart(self):
         disease = []
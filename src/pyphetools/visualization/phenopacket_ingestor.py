@@ -1,41 +1,166 @@
 import os
+import time
 from collections import defaultdict
-import json
+from concurrent.futures import ProcessPoolExecutor
 from google.protobuf.json_format import Parse
 from .simple_patient import SimplePatient
+from ..pp.v202 import Phenopacket as Phenopacket202
 import typing
 import phenopackets as PPKt
 
+
+def _parse_file_to_bytes(fname:str, disease_id:typing.Optional[str]) -> typing.Optional[bytes]:
+    """
+    Parse a phenopacket JSON file in a worker process.
+
+    The phenopacket is returned as serialized protobuf bytes, which are much cheaper to transfer to the parent process
+    (and to parse there) than a pickled message or the JSON text.
+
+    :returns: the serialized phenopacket or None if the phenopacket does not have the disease
+    """
+    with open(fname) as f:
+        data = f.read()
+    if disease_id is not None and disease_id not in data:
+        return None
+    ppack = Parse(data, PPKt.Phenopacket())
+    if disease_id is not None and not PhenopacketIngestor.has_disease_id(ppkt=ppack, disease_id=disease_id):
+        return None
+    return ppack.SerializeToString()
+
+
 class PhenopacketIngestor:
     """
     Ingest a collection of GA4GH Phenopacket objects from a directory
 
+    The constructor reads all phenopackets into memory. Use :meth:`iter_phenopackets` to process large collections
+    one phenopacket at a time.
+
     :param indir: input directory
     :type indir: str
     :param recursive: Iff True, search subdirectorys for phenopackets
     :type recursive: bool, default False
     :param disease_id: If provided, limit ingest to phenopackets with this disease ID
     :type disease_id: str
+    :param n_workers: number of worker processes used to parse the files (see :meth:`load_parallel`)
+    :type n_workers: int, default 1
     """
 
-    def __init__(self, indir="phenopackets", recursive:bool=False, disease_id:str=None) -> None:
+    def __init__(self, indir="phenopackets", recursive:bool=False, disease_id:str=None, n_workers:int=1) -> None:
         if not os.path.isdir(indir):
             raise ValueError(f"indir argument {indir} must be directory!")
         self._indir = indir
-        self._phenopackets = []
-        for file in os.listdir(indir):
-            fname = os.path.join(indir, file)
-            if fname.endswith(".json") and os.path.isfile(fname):
-                with open(fname) as f:
-                    data = f.read()
-                    jsondata = json.loads(data)
-                    ppack = Parse(json.dumps(jsondata), PPKt.Phenopacket())
-                    if disease_id is not None:
-                        if not PhenopacketIngestor.has_disease_id(ppkt=ppack, disease_id=disease_id):
-                            continue
-                    self._phenopackets.append(ppack)
+        if n_workers > 1:
+            self._phenopackets = PhenopacketIngestor.load_parallel(indir=indir,
+                                                                   recursive=recursive,
+                                                                   disease_id=disease_id,
+                                                                   n_workers=n_workers)
+        else:
+            self._phenopackets = list(PhenopacketIngestor.iter_phenopackets(indir=indir,
+                                                                            recursive=recursive,
+                                                                            disease_id=disease_id))
         print(f"[pyphetools] Ingested {len(self._phenopackets)} GA4GH phenopackets.")
 
+    @staticmethod
+    def list_json_files(indir:str, recursive:bool=False) -> typing.List[str]:
+        """
+        :param indir: input directory
+        :type indir: str
+        :param recursive: Iff True, search subdirectories for phenopackets
+        :type recursive: bool, default False
+        :returns: sorted list of paths to the JSON files in the directory
+        :rtype: List[str]
+        """
+        if not os.path.isdir(indir):
+            raise FileNotFoundError(f"argument indir={indir} is not a directory")
+        json_files = []
+        if recursive:
+            for dirpath, _, filenames in os.walk(indir):
+                for file in filenames:
+                    if file.endswith(".json"):
+                        json_files.append(os.path.join(dirpath, file))
+        else:
+            for file in os.listdir(indir):
+                fname = os.path.join(indir, file)
+                if fname.endswith(".json") and os.path.isfile(fname):
+                    json_files.append(fname)
+        return sorted(json_files)
+
+    @staticmethod
+    def iter_phenopackets(indir:str, recursive:bool=False, disease_id:str=None) -> typing.Iterator[PPKt.Phenopacket]:
+        """
+        Lazily parse the phenopackets in a directory, so that only one phenopacket is held in memory at a time.
+
+        If `disease_id` is provided, files whose text does not contain the disease ID are skipped without being parsed.
+
+        :param indir: input directory
+        :type indir: str
+        :param recursive: Iff True, search subdirectories for phenopackets
+        :type recursive: bool, default False
+        :param disease_id: If provided, only yield phenopackets with this disease ID
+        :type disease_id: str
+        :returns: an iterator over the phenopackets
+        :rtype: Iterator[PPKt.Phenopacket]
+        """
+        for fname in PhenopacketIngestor.list_json_files(indir=indir, recursive=recursive):
+            with open(fname) as f:
+                data = f.read()
+            if disease_id is not None and disease_id not in data:
+                # The phenopacket cannot have the disease, so we do not need to parse it
+                continue
+            ppack = Parse(data, PPKt.Phenopacket())
+            if disease_id is not None:
+                if not PhenopacketIngestor.has_disease_id(ppkt=ppack, disease_id=disease_id):
+                    continue
+            yield ppack
+
+    @staticmethod
+    def load_parallel(indir:str,
+                      recursive:bool=False,
+                      disease_id:str=None,
+                      n_workers:int=None,
+                      as_v202:bool=False,
+                      chunksize:int=16) -> typing.List:
+        """
+        Parse the phenopackets in a directory using a pool of worker processes.
+
+        The JSON parsing is done by the workers, which send the phenopackets back as serialized protobuf bytes.
+        The throughput (files per second) is printed when all files have been processed.
+
+        :param indir: input directory
+        :type indir: str
+        :param recursive: Iff True, search subdirectories for phenopackets
+        :type recursive: bool, default False
+        :param disease_id: If provided, only return phenopackets with this disease ID
+        :type disease_id: str
+        :param n_workers: number of worker processes (default: number of CPUs)
+        :type n_workers: int
+        :param as_v202: if True, return `pyphetools.pp.v202.Phenopacket` objects instead of protobuf messages
+        :type as_v202: bool, default False
+        :param chunksize: number of files sent to a worker at a time
+        :type chunksize: int, default 16
+        :returns: list of phenopackets in the order of the (sorted) file paths
+        :rtype: List[Union[PPKt.Phenopacket, Phenopacket202]]
+        """
+        json_files = PhenopacketIngestor.list_json_files(indir=indir, recursive=recursive)
+        start = time.perf_counter()
+        phenopackets = []
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for serialized in executor.map(_parse_file_to_bytes,
+                                           json_files,
+                                           [disease_id] * len(json_files),
+                                           chunksize=chunksize):
+                if serialized is None:
+                    continue
+                if as_v202:
+                    ppack = Phenopacket202.from_bytes(serialized)
+                else:
+                    ppack = PPKt.Phenopacket.FromString(serialized)
+                phenopackets.append(ppack)
+        elapsed = time.perf_counter() - start
+        files_per_second = len(json_files) / elapsed if elapsed > 0 else float("inf")
+        print(f"[pyphetools] Parsed {len(json_files)} files in {elapsed:.2f} s ({files_per_second:.1f} files/s).")
+        return phenopackets
+
     @staticmethod
     def has_disease_id(ppkt:PPKt.Phenopacket, disease_id:str) -> bool:
         if len(ppkt.diseases) == 0:
@@ -71,17 +196,9 @@ class PhenopacketIngestor:
     
 
     def _ingest(self, indir="phenopackets", recursive:bool=False, disease_id:str=None):
-        for file in os.listdir(indir):
-            fname = os.path.join(indir, file)
-            if fname.endswith(".json") and os.path.isfile(fname):
-                with open(fname) as f:
-                    data = f.read()
-                    jsondata = json.loads(data)
-                    ppack = Parse(json.dumps(jsondata), PPKt.Phenopacket())
-                    if disease_id is not None:
-                        if not PhenopacketIngestor.has_disease_id(ppkt=ppack, disease_id=disease_id):
-                            continue
-                    self._phenopackets.append(ppack)
+        self._phenopackets.extend(PhenopacketIngestor.iter_phenopackets(indir=indir,
+                                                                        recursive=recursive,
+                                                                        disease_id=disease_id))
 
 
     def ingest_from_directory(self, indir:str):
@@ -90,16 +207,15 @@ class PhenopacketIngestor:
     def ingest_from_file(self, json_file:str) -> PPKt.Phenopacket:
          with open(json_file) as f:
             data = f.read()
-            jsondata = json.loads(data)
-            ppack = Parse(json.dumps(jsondata), PPKt.Phenopacket())
+            ppack = Parse(data, PPKt.Phenopacket())
             return ppack
          
 
     @staticmethod 
-    def from_directory(indir: str, disease_id:str=None) -> typing.List[PPKt.Phenopacket]:
+    def from_directory(indir: str, disease_id:str=None, recursive:bool=False) -> typing.List[PPKt.Phenopacket]:
         if not os.path.isdir(indir):
             raise FileNotFoundError(f"argument indir={indir} is not a directory")
-        ingestor = PhenopacketIngestor(indir=indir, disease_id=disease_id)
+        ingestor = PhenopacketIngestor(indir=indir, disease_id=disease_id, recursive=recursive)
         return ingestor.get_phenopacket_list()
     
     @staticmethod
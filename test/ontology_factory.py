@@ -0,0 +1,48 @@
+"""
+Helpers for creating small ontologies for the tests that do not need the full HPO.
+"""
+import json
+import typing
+
+
+def write_ontology(fpath, version: typing.Optional[str] = None,
+                   extra_terms: typing.Union[typing.Iterable[str], typing.Mapping[str, str]] = ()) -> str:
+    """
+    Write an ontology with the terms HP:0000001, HP:0000118 and HP:0001250 (Seizure).
+
+    The label of each term is `Term <id>`, e.g. `Term 0001250`.
+
+    :param fpath: path of the obographs JSON file to write
+    :param version: HPO release (e.g. `2024-03-06`) or None for an ontology without a version
+    :param extra_terms: ids (without prefix, e.g. `0001166`) of further terms that are children of HP:0000118, or a
+      mapping from the ids of further terms to the ids of their parents
+    :returns: the path as a string
+    """
+    purl = "http://purl.obolibrary.org/obo/HP_%s"
+    parents = {"0000001": None, "0000118": "0000001", "0001250": "0000118"}
+    if isinstance(extra_terms, typing.Mapping):
+        parents.update(extra_terms)
+    else:
+        parents.update({t: "0000118" for t in extra_terms})
+    meta = {"basicPropertyValues": []}
+    if version is not None:
+        meta["version"] = f"http://purl.obolibrary.org/obo/hp/releases/{version}/hp.json"
+    graph = {
+        "id": "http://purl.obolibrary.org/obo/hp.json",
+        "meta": meta,
+        "nodes": [{"id": purl % t, "lbl": f"Term {t}", "type": "CLASS"} for t in parents],
+        "edges": [{"sub": purl % t, "pred": "is_a", "obj": purl % p} for t, p in parents.items() if p is not None],
+    }
+    with open(fpath, "w") as fh:
+        json.dump({"graphs": [graph]}, fh)
+    return str(fpath)
+
+
+def write_unversioned_ontology(fpath) -> str:
+    """
+    Write an ontology with the terms HP:0000001, HP:0000118 and HP:0001250 (Seizure) and without a version.
+
+    :param fpath: path of the obographs JSON file to write
+    :returns: the path as a string
+    """
+    return write_ontology(fpath)
@@ -0,0 +1,33 @@
+"""
+Helpers for creating small GA4GH phenopackets for the tests of the cohort visualizations.
+"""
+import typing
+
+import phenopackets as PPKt
+
+ARACHNODACTYLY = ("HP:0001166", "Arachnodactyly")
+SLENDER_FINGER = ("HP:0001238", "Slender finger")
+SEIZURE = ("HP:0001250", "Seizure")
+HIP_DISLOCATION = ("HP:0002827", "Hip dislocation")
+MYOPIA = ("HP:0000545", "Myopia")
+
+
+def make_phenopacket(ppkt_id: str,
+                     observed: typing.Iterable[typing.Tuple[str, str]],
+                     excluded: typing.Iterable[typing.Tuple[str, str]] = (),
+                     sex=PPKt.UNKNOWN_SEX) -> PPKt.Phenopacket:
+    """
+    :param ppkt_id: identifier of the phenopacket and of its subject
+    :param observed: (HPO id, label) tuples of the observed features
+    :param excluded: (HPO id, label) tuples of the excluded features
+    :param sex: sex of the subject
+    """
+    ppkt = PPKt.Phenopacket(id=ppkt_id)
+    ppkt.subject.id = ppkt_id
+    ppkt.subject.sex = sex
+    for hpo_id, label in observed:
+        ppkt.phenotypic_features.append(PPKt.PhenotypicFeature(type=PPKt.OntologyClass(id=hpo_id, label=label)))
+    for hpo_id, label in excluded:
+        ppkt.phenotypic_features.append(
+            PPKt.PhenotypicFeature(type=PPKt.OntologyClass(id=hpo_id, label=label), excluded=True))
+    return ppkt
@@ -0,0 +1,117 @@
+import struct
+import typing
+from unittest import mock
+
+import phenopackets as pp202
+import pytest
+
+from pyphetools.pp.parse import PhenopacketArchiveWriter, PhenopacketArchiveReader
+from pyphetools.pp.v202 import *
+
+
+class TestPhenopacketArchive:
+
+    @pytest.fixture
+    def phenopackets(self, retinoblastoma: Phenopacket) -> typing.List[Phenopacket]:
+        ppkts = []
+        for i in range(5):
+            msg = retinoblastoma.to_message()
+            msg.id = f'retinoblastoma.{i}'
+            ppkts.append(Phenopacket.from_message(msg))
+        return ppkts
+
+    @pytest.mark.parametrize('compress', [True, False])
+    def test_round_trip(self, tmp_path, phenopackets: typing.List[Phenopacket], compress: bool):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with PhenopacketArchiveWriter(fpath, compress=compress) as writer:
+            for pp in phenopackets:
+                writer.write(pp)
+
+        with PhenopacketArchiveReader(fpath, clz=Phenopacket) as reader:
+            assert len(reader) == 5
+            assert reader.ids() == [pp.id for pp in phenopackets]
+            assert list(reader) == phenopackets
+
+    def test_random_access(self, tmp_path, phenopackets: typing.List[Phenopacket]):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with PhenopacketArchiveWriter(fpath, compress=True) as writer:
+            for pp in phenopackets:
+                writer.write(pp.to_message())
+
+        with PhenopacketArchiveReader(fpath) as reader:
+            assert 'retinoblastoma.3' in reader
+            actual = reader.get('retinoblastoma.3')
+            assert isinstance(actual, pp202.Phenopacket)
+            assert actual == phenopackets[3].to_message()
+            with pytest.raises(KeyError):
+                reader.get('unknown')
+
+    def test_duplicate_id(self, tmp_path, retinoblastoma: Phenopacket):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with PhenopacketArchiveWriter(fpath) as writer:
+            writer.write(retinoblastoma)
+            with pytest.raises(ValueError):
+                writer.write(retinoblastoma)
+
+    def test_not_an_archive(self, tmp_path):
+        fpath = tmp_path / 'other.bin'
+        fpath.write_bytes(b'something else entirely')
+        with pytest.raises(ValueError):
+            PhenopacketArchiveReader(str(fpath))
+
+    def test_archive_is_not_finished_after_exception(self, tmp_path, phenopackets: typing.List[Phenopacket]):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with pytest.raises(ValueError):
+            with PhenopacketArchiveWriter(fpath) as writer:
+                for pp in phenopackets:
+                    writer.write(pp)
+                writer.write(phenopackets[0])
+
+        with pytest.raises(ValueError, match='truncated'):
+            PhenopacketArchiveReader(fpath)
+
+    def test_file_shorter_than_trailer(self, tmp_path):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with PhenopacketArchiveWriter(fpath):
+            pass
+        with open(fpath, 'rb') as fh:
+            header = fh.read(9)
+        with open(fpath, 'wb') as fh:
+            fh.write(header)
+
+        with pytest.raises(ValueError, match='truncated'):
+            PhenopacketArchiveReader(fpath)
+
+    @pytest.mark.parametrize('corruption', ['n_records', 'id_bytes', 'index_offset'])
+    def test_corrupt_index(self, tmp_path, phenopackets: typing.List[Phenopacket], corruption: str):
+        fpath = str(tmp_path / 'cohort.ppkts')
+        with PhenopacketArchiveWriter(fpath) as writer:
+            for pp in phenopackets:
+                writer.write(pp)
+        trailer = struct.Struct('<QQ8s')
+        with open(fpath, 'r+b') as fh:
+            fh.seek(-trailer.size, 2)
+            index_offset, n_records, magic = trailer.unpack(fh.read(trailer.size))
+            if corruption == 'n_records':
+                fh.seek(-trailer.size, 2)
+                fh.write(trailer.pack(index_offset, n_records + 1, magic))
+            elif corruption == 'id_bytes':
+                # the first byte of the index is the length of the first ID, the ID follows
+                fh.seek(index_offset + 1)
+                fh.write(b'\xff')
+            else:
+                fh.seek(-trailer.size, 2)
+                fh.write(trailer.pack(index_offset + 10_000, n_records, magic))
+
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            fh = open(*args, **kwargs)
+            opened.append(fh)
+            return fh
+
+        with mock.patch('pyphetools.pp.parse._archive.open', tracking_open, create=True):
+            with pytest.raises(ValueError, match='corrupt index'):
+                PhenopacketArchiveReader(fpath)
+        assert len(opened) == 1
+        assert opened[0].closed
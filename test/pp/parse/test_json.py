@@ -43,3 +43,37 @@ class TestJsonSerializers:
 
         # Compare
         assert out == retinoblastoma
+
+    def test_single_pass_matches_key_remapping(
+            self,
+            retinoblastoma: Phenopacket,
+    ):
+        single = io.StringIO()
+        JsonSerializer(single_pass=True, indent=2).serialize(retinoblastoma, single)
+        remapped = io.StringIO()
+        JsonSerializer(single_pass=False, indent=2).serialize(retinoblastoma, remapped)
+
+        assert single.getvalue() == remapped.getvalue()
+
+        for single_pass in (True, False):
+            deserializer = JsonDeserializer(single_pass=single_pass)
+            assert deserializer.deserialize(single.getvalue(), Phenopacket) == retinoblastoma
+
+    @pytest.mark.parametrize('single_pass', [True, False])
+    def test_map_keys_are_not_converted(
+            self,
+            single_pass: bool,
+    ):
+        file = File(
+            uri='file://data/genomes/P000001C',
+            individual_to_file_identifiers={'patient_1': 'NA12878'},
+            file_attributes={'genomeAssembly': 'GRCh38', 'file_format': 'vcf'},
+        )
+
+        buf = io.StringIO()
+        JsonSerializer(single_pass=single_pass).serialize(file, buf)
+        assert '"individualToFileIdentifiers": {"patient_1": "NA12878"}' in buf.getvalue()
+        assert '"fileAttributes": {"genomeAssembly": "GRCh38", "file_format": "vcf"}' in buf.getvalue()
+
+        out = JsonDeserializer(single_pass=single_pass).deserialize(buf.getvalue(), File)
+        assert out == file
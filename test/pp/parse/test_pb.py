@@ -1,8 +1,11 @@
 import os
+import typing
 
 import pytest
 
 from pyphetools.pp.v202 import *
+from pyphetools.pp._api import MessageMixin
+from pyphetools.pp.parse._pb import MessageWriter
 
 import io
 
@@ -46,3 +49,32 @@ class TestProtobuf:
             actual = Phenopacket.from_pb(fh)
 
         assert actual == retinoblastoma
+
+    def test_from_bytes_and_from_messages(
+            self,
+            retinoblastoma: Phenopacket,
+    ):
+        msg = retinoblastoma.to_message()
+        payload = msg.SerializeToString()
+
+        assert Phenopacket.from_bytes(payload) == retinoblastoma
+        assert Phenopacket.from_messages([msg, payload]) == [retinoblastoma, retinoblastoma]
+
+
+class TestMessageWriter:
+
+    def test_writes_the_same_messages_as_to_message(
+            self,
+            retinoblastoma: Phenopacket,
+    ):
+        writer = MessageWriter()
+
+        # Compare the output for all elements of the phenopacket, not only for the top-level element.
+        pending = [retinoblastoma]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, MessageMixin):
+                assert writer.write(item) == item.to_message(), f'Mismatch in {type(item).__name__}'
+                pending.extend(getattr(item, name) for name in type(item).__slots__)
+            elif isinstance(item, typing.Sequence) and not isinstance(item, str):
+                pending.extend(item)
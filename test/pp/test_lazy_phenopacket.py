@@ -0,0 +1,36 @@
+import pytest
+
+from pyphetools.pp.parse.json import JsonDeserializer
+from pyphetools.pp.v202 import Phenopacket, LazyPhenopacket
+
+
+class TestLazyPhenopacket:
+
+    def test_from_message(self, retinoblastoma: Phenopacket):
+        lazy = LazyPhenopacket.from_message(retinoblastoma.to_message())
+
+        assert lazy.id == retinoblastoma.id
+        assert lazy.phenotypic_features == retinoblastoma.phenotypic_features
+        assert lazy.diseases == retinoblastoma.diseases
+
+        # Only the accessed fields were decoded.
+        assert repr(lazy) == f"LazyPhenopacket(id={retinoblastoma.id}, decoded=['diseases', 'phenotypic_features'])"
+
+        assert lazy.to_phenopacket() == retinoblastoma
+
+    def test_decoded_fields_are_cached(self, retinoblastoma: Phenopacket):
+        lazy = LazyPhenopacket.from_bytes(retinoblastoma.to_message().SerializeToString())
+
+        assert lazy.interpretations is lazy.interpretations
+
+    def test_from_json(self, fpath_retinoblastoma_json: str, retinoblastoma: Phenopacket):
+        with open(fpath_retinoblastoma_json) as fh:
+            lazy = JsonDeserializer().deserialize(fh, LazyPhenopacket)
+
+        assert lazy.subject == retinoblastoma.subject
+        assert lazy.measurements == retinoblastoma.measurements
+        assert lazy.to_phenopacket() == retinoblastoma
+
+    def test_invalid_source(self):
+        with pytest.raises(ValueError):
+            LazyPhenopacket('example')
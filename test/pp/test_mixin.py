@@ -1,4 +1,9 @@
-from pyphetools.pp.v202 import Individual, Phenopacket
+import typing
+
+from pyphetools.pp.v202 import Individual, Phenopacket, PhenotypicFeature, OntologyClass, TimeElement, Age, Sex, File
+from pyphetools.pp.v202 import SequenceInterval, Number, IndefiniteRange
+from pyphetools.pp import Timestamp
+from pyphetools.pp.parse import Serializable
 
 
 class TestMessageMixin:
@@ -25,3 +30,50 @@ class TestMessageMixin:
         other = Phenopacket.from_dict(out)
 
         assert other == retinoblastoma
+
+    def test_to_dict(self):
+        individual = Individual(
+            id='example', alternate_ids=['other'], sex=Sex.FEMALE,
+            date_of_birth=Timestamp.from_str('2018-03-29T00:00:00Z'),
+        )
+        feature = PhenotypicFeature(
+            type=OntologyClass(id='HP:0000555', label='Leukocoria'),
+            onset=TimeElement(element=Age(iso8601duration='P4M')),
+        )
+        file = File(uri='file://data/x.vcf', file_attributes={'genomeAssembly': 'GRCh38'})
+        interval = SequenceInterval(start=Number(value=5), end=IndefiniteRange(value=10, comparator='GE'))
+
+        for item, expected in (
+            (individual, {
+                'id': 'example', 'alternate_ids': ['other'], 'date_of_birth': '2018-03-29T00:00:00Z', 'sex': 'FEMALE',
+            }),
+            (feature, {
+                'type': {'id': 'HP:0000555', 'label': 'Leukocoria'}, 'excluded': False, 'modifiers': [],
+                'onset': {'age': {'iso8601duration': 'P4M'}}, 'evidence': [],
+            }),
+            (file, {
+                'uri': 'file://data/x.vcf', 'individual_to_file_identifiers': {},
+                'file_attributes': {'genomeAssembly': 'GRCh38'},
+            }),
+            (interval, {
+                'start_number': {'value': 5}, 'end_indefinite_range': {'value': 10, 'comparator': 'GE'},
+            }),
+        ):
+            out = {}
+            item.to_dict(out)
+            assert out == expected
+
+    def test_instances_have_no_dict(self, retinoblastoma: Phenopacket):
+        # The data classes use `__slots__` to keep the memory footprint small.
+        pending = [retinoblastoma]
+        n_visited = 0
+        while pending:
+            item = pending.pop()
+            if isinstance(item, (Serializable, Timestamp)):
+                assert not hasattr(item, '__dict__'), f'{type(item).__name__} instance has `__dict__`'
+                n_visited += 1
+                pending.extend(getattr(item, name) for name in type(item).__slots__)
+            elif isinstance(item, typing.Sequence) and not isinstance(item, str):
+                pending.extend(item)
+
+        assert n_visited > 100
@@ -0,0 +1,33 @@
+from pyphetools.pp.v202 import OntologyClass
+import phenopackets as pp202
+
+
+class TestOntologyClassInterning:
+
+    def test_intern_returns_shared_instance(self):
+        a = OntologyClass.intern(id='HP:0001250', label='Seizure')
+        b = OntologyClass.intern(id='HP:0001250', label='Seizure')
+        c = OntologyClass.intern(id='HP:0001250', label='Seizures')
+
+        assert a is b
+        assert a is not c
+        assert a == OntologyClass(id='HP:0001250', label='Seizure')
+
+    def test_decoded_instances_are_shared(self):
+        a = OntologyClass.from_dict({'id': 'HP:0000555', 'label': 'Leukocoria'})
+        b = OntologyClass.from_message(pp202.OntologyClass(id='HP:0000555', label='Leukocoria'))
+
+        assert a is b
+
+    def test_least_recently_used_instance_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(OntologyClass, 'INTERN_TABLE_SIZE', 2)
+        OntologyClass.clear_interned()
+
+        first = OntologyClass.intern(id='HP:0000001', label='All')
+        second = OntologyClass.intern(id='HP:0000118', label='Phenotypic abnormality')
+        assert OntologyClass.intern(id='HP:0000001', label='All') is first  # `second` is now the least recently used
+
+        OntologyClass.intern(id='HP:0000707', label='Abnormality of the nervous system')
+
+        assert OntologyClass.intern(id='HP:0000001', label='All') is first
+        assert OntologyClass.intern(id='HP:0000118', label='Phenotypic abnormality') is not second
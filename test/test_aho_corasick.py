@@ -0,0 +1,78 @@
+import re
+import unittest
+
+from pyphetools.creation.aho_corasick import AhoCorasickAutomaton
+from pyphetools.creation import HpoAhoCorasickConceptRecognizer, HpoExactConceptRecognizer
+
+
+class TestAhoCorasickAutomaton(unittest.TestCase):
+
+    def test_overlapping_keywords(self):
+        automaton = AhoCorasickAutomaton({"he": 1, "she": 2, "his": 3, "hers": 4})
+        matches = sorted(automaton.find_all("ushers"))
+        self.assertEqual([(1, 3, 2), (2, 3, 1), (2, 5, 4)], matches)
+
+    def test_word_boundary(self):
+        automaton = AhoCorasickAutomaton({"pica": "HP:0011856"})
+        self.assertEqual(0, len(list(automaton.find_word_matches("typical presentation"))))
+        self.assertEqual([(4, 7, "HP:0011856")], list(automaton.find_word_matches("has pica")))
+
+    def test_agrees_with_regex(self):
+        keywords = ["ataxia", "cerebellar ataxia", "seizure", "seizures", "ptosis", "asd"]
+        automaton = AhoCorasickAutomaton({k: k for k in keywords})
+        text = "cerebellar ataxia, seizures (focal seizure) and ptosis; no asd-like features, ataxias"
+        expected = set()
+        for k in keywords:
+            for m in re.finditer(r'\b%s\b' % re.escape(k), text):
+                expected.add((m.start(), m.end() - 1, k))
+        self.assertEqual(expected, set(automaton.find_word_matches(text)))
+
+
+class TestHpoAhoCorasickConceptRecognizer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        label_to_id = {
+            "pica": "HP:0011856",
+            "ataxia": "HP:0001251",
+            "cerebellar ataxia": "HP:0001251",
+            "short philtrum": "HP:0000322",
+        }
+        id_to_primary_label = {
+            "HP:0011856": "Pica",
+            "HP:0001251": "Ataxia",
+            "HP:0000322": "Short philtrum",
+        }
+        cls.hpo_cr = HpoAhoCorasickConceptRecognizer(label_to_id=label_to_id, id_to_primary_label=id_to_primary_label)
+        cls.exact_cr = HpoExactConceptRecognizer(label_to_id=label_to_id, id_to_primary_label=id_to_primary_label)
+
+    def test_pica_not_at_boundary(self):
+        results = self.hpo_cr.parse_cell(cell_contents="Typical presentation")
+        self.assertEqual(0, len(results))
+
+    def test_longest_match_is_chosen(self):
+        results = self.hpo_cr.parse_cell(cell_contents="Cerebellar ataxia, short philtrum")
+        results = sorted(results, key=lambda x: x.id)
+        self.assertEqual(2, len(results))
+        self.assertEqual("HP:0000322", results[0].id)
+        self.assertEqual("Short philtrum", results[0].label)
+        self.assertEqual("HP:0001251", results[1].id)
+        self.assertEqual("Ataxia", results[1].label)
+
+    def test_repeated_labels_agree_with_exact_recognizer(self):
+        for cell_contents in ["seizure then pica then pica again", "pica, pica; ataxia and ataxia",
+                              "cerebellar ataxia with cerebellar ataxia", "short philtrum short philtrum"]:
+            expected = self.exact_cr.parse_cell(cell_contents=cell_contents)
+            results = self.hpo_cr.parse_cell(cell_contents=cell_contents)
+            self.assertEqual(sorted(t.id for t in expected), sorted(t.id for t in results), cell_contents)
+        results = self.hpo_cr.parse_cell(cell_contents="pica then pica again")
+        self.assertEqual(["HP:0011856"], [t.id for t in results])
+
+    def test_custom_d(self):
+        custom_d = {"eats dirt": "Pica"}
+        results = self.hpo_cr.parse_cell(cell_contents="eats dirt; ataxia", custom_d=custom_d)
+        self.assertEqual({"HP:0011856", "HP:0001251"}, {r.id for r in results})
+
+    def test_matches_are_in_text_order(self):
+        results = self.hpo_cr.parse_cell(cell_contents="short philtrum and cerebellar ataxia and pica")
+        self.assertEqual(["HP:0000322", "HP:0001251", "HP:0011856"], [r.id for r in results])
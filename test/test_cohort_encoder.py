@@ -0,0 +1,116 @@
+import math
+import unittest
+
+import pandas as pd
+
+from pyphetools.creation import AgeColumnMapper, Citation, CohortEncoder, ConstantColumnMapper, Disease, \
+    HpoExactConceptRecognizer, MetaData, OptionColumnMapper, SexColumnMapper, SimpleColumnMapper, \
+    StructuralVariant, VariantColumnMapper
+
+
+class TestCohortEncoder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        label_to_id = {
+            "pica": "HP:0011856",
+            "ataxia": "HP:0001251",
+            "seizure": "HP:0001250",
+            "short philtrum": "HP:0000322",
+        }
+        id_to_primary_label = {
+            "HP:0011856": "Pica",
+            "HP:0001251": "Ataxia",
+            "HP:0001250": "Seizure",
+            "HP:0000322": "Short philtrum",
+        }
+        cls.hpo_cr = HpoExactConceptRecognizer(label_to_id=label_to_id, id_to_primary_label=id_to_primary_label)
+        cls.df = pd.DataFrame({
+            "patient": ["P1", "P2", "P3", "P4"],
+            "sex": ["M", "F", math.nan, "F"],
+            "age": ["3", math.nan, "12", "3"],
+            "findings": ["eats dirt, ataxia", math.nan, "short philtrum", "eats dirt, ataxia"],
+            "seizures": ["+", "-", math.nan, "+"],
+            "constant": ["x", math.nan, "x", "x"],
+            "variant": ["del1", "del2", "del1", "del2"],
+        })
+        # the variants get random identifiers, so all encoders share them
+        cls.variant_d = {cell: StructuralVariant.chromosomal_deletion(cell_contents=cell, gene_symbol="GLI3",
+                                                                      gene_id="HGNC:4319")
+                         for cell in ("del1", "del2")}
+
+    def get_encoder(self) -> CohortEncoder:
+        column_mappers = [
+            OptionColumnMapper(column_name="findings", concept_recognizer=self.hpo_cr,
+                               option_d={"eats dirt": "Pica"}),
+            SimpleColumnMapper(column_name="seizures", hpo_id="HP:0001250", hpo_label="Seizure",
+                               observed={"+"}, excluded={"-"}),
+            ConstantColumnMapper(column_name="constant", hpo_id="HP:0000322", hpo_label="Short philtrum",
+                                 excluded=True),
+        ]
+        metadata = MetaData(created_by="ORCID:0000-0002-0736-9199",
+                            citation=Citation(pmid="PMID:123", title="A cohort"))
+        encoder = CohortEncoder(df=self.df,
+                                hpo_cr=self.hpo_cr,
+                                column_mapper_list=column_mappers,
+                                individual_column_name="patient",
+                                metadata=metadata,
+                                age_of_onset_mapper=AgeColumnMapper.by_year("age"),
+                                sexmapper=SexColumnMapper(male_symbol="M", female_symbol="F", column_name="sex"),
+                                variant_mapper=VariantColumnMapper(variant_d=self.variant_d, variant_column_name="variant",
+                                                                   default_genotype="heterozygous"))
+        encoder.set_disease(Disease(disease_id="OMIM:175700", disease_label="Greig cephalopolysyndactyly syndrome"))
+        return encoder
+
+    @staticmethod
+    def map_age(mapper: AgeColumnMapper, cell_contents):
+        # ages that cannot be parsed are set to "not provided"
+        try:
+            return mapper.map_cell(cell_contents)
+        except Exception:
+            return None
+
+    def get_row_by_row(self, encoder: CohortEncoder):
+        """
+        The individual data of the cohort, computed cell by cell as the encoder did before it encoded the table
+        column by column
+        """
+        rows = []
+        for _, row in encoder._df.iterrows():
+            hpo_terms = []
+            for mapper in encoder._column_mapper_list:
+                cell_contents = row[mapper.get_column_name()]
+                if isinstance(cell_contents, float) and math.isnan(cell_contents):
+                    continue
+                hpo_terms.extend(mapper.map_cell(cell_contents))
+            rows.append({
+                "id": row["patient"],
+                "sex": encoder._sex_mapper.map_cell(row["sex"]),
+                "age_of_onset": TestCohortEncoder.map_age(encoder._age_of_onset_mapper, row["age"]),
+                "hpo_terms": [(t.id, t.observed, t.measured) for t in hpo_terms],
+                "variants": encoder._variant_mapper.map_cell(row["variant"], None),
+            })
+        return rows
+
+    def test_get_individuals_agrees_with_row_by_row_encoding(self):
+        encoder = self.get_encoder()
+        expected = self.get_row_by_row(self.get_encoder())
+        individuals = encoder.get_individuals()
+        self.assertEqual(len(expected), len(individuals))
+        for indi, exp in zip(individuals, expected):
+            self.assertEqual(exp["id"], indi.id)
+            self.assertEqual(exp["sex"], indi.sex)
+            self.assertEqual(str(exp["age_of_onset"]), str(indi.age_of_onset))
+            self.assertEqual(exp["hpo_terms"], [(t.id, t.observed, t.measured) for t in indi.hpo_terms])
+            self.assertEqual(exp["variants"], indi.interpretation_list)
+        self.assertEqual([("HP:0011856", True, True), ("HP:0001251", True, True), ("HP:0001250", True, True),
+                          ("HP:0000322", False, True)], expected[0]["hpo_terms"])
+
+    def test_individuals_do_not_share_terms(self):
+        individuals = self.get_encoder().get_individuals()
+        # P1 and P4 have the same findings
+        self.assertEqual([t.id for t in individuals[0].hpo_terms], [t.id for t in individuals[3].hpo_terms])
+        for t1, t4 in zip(individuals[0].hpo_terms, individuals[3].hpo_terms):
+            if t1.id != "HP:0000322":
+                # the terms of the constant mapper are the same objects for all rows, as before
+                self.assertIsNot(t1, t4)
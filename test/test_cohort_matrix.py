@@ -0,0 +1,51 @@
+import numpy as np
+import phenopackets as PPKt
+import pytest
+
+from pyphetools.visualization import CohortMatrix
+
+from phenopacket_factory import make_phenopacket, ARACHNODACTYLY, SEIZURE, MYOPIA
+
+
+class TestCohortMatrix:
+
+    @pytest.fixture
+    def matrix(self) -> CohortMatrix:
+        return CohortMatrix.from_phenopackets([
+            make_phenopacket("A", observed=[ARACHNODACTYLY, SEIZURE], excluded=[MYOPIA], sex=PPKt.MALE),
+            make_phenopacket("B", observed=[ARACHNODACTYLY], excluded=[SEIZURE], sex=PPKt.FEMALE),
+            make_phenopacket("C", observed=[], excluded=[], sex=PPKt.FEMALE),
+        ])
+
+    def test_shape(self, matrix: CohortMatrix):
+        assert matrix.n_patients == 3
+        assert matrix.n_terms == 3
+        assert list(matrix.patient_ids) == ["A", "B", "C"]
+        assert list(matrix.sex) == ["MALE", "FEMALE", "FEMALE"]
+        assert list(matrix.terms_per_patient()) == [3, 2, 0]
+
+    def test_to_dense(self, matrix: CohortMatrix):
+        dense = matrix.to_dense()
+        arachnodactyly = matrix.get_term_idx("HP:0001166")
+        seizure = matrix.get_term_idx("HP:0001250")
+        myopia = matrix.get_term_idx("HP:0000545")
+        assert list(dense[:, arachnodactyly]) == [CohortMatrix.OBSERVED, CohortMatrix.OBSERVED, 0]
+        assert list(dense[:, seizure]) == [CohortMatrix.OBSERVED, CohortMatrix.EXCLUDED, 0]
+        assert list(dense[:, myopia]) == [CohortMatrix.EXCLUDED, 0, 0]
+        assert matrix.get_term_idx("HP:0000001") is None
+
+    def test_counts(self, matrix: CohortMatrix):
+        seizure = matrix.get_term_idx("HP:0001250")
+        assert matrix.observed_counts()[seizure] == 1
+        assert matrix.excluded_counts()[seizure] == 1
+
+        females = matrix.sex == "FEMALE"
+        assert matrix.observed_counts(mask=females)[seizure] == 0
+        assert matrix.excluded_counts(mask=females)[seizure] == 1
+
+    def test_term_count_table(self, matrix: CohortMatrix):
+        df = matrix.term_count_table()
+        assert list(df["HPO"]) == ["HP:0001166", "HP:0001250", "HP:0000545"]
+        assert list(df["observed"]) == [2, 1, 0]
+        assert list(df["excluded"]) == [0, 1, 1]
+        assert np.allclose(df["frequency"], [1., .5, 0.])
@@ -0,0 +1,57 @@
+import hpotk
+import numpy as np
+import pytest
+
+from pyphetools.creation import OntologyIndex
+from pyphetools.visualization import CohortMatrix, PropagatedTermCounter
+
+from phenopacket_factory import make_phenopacket, ARACHNODACTYLY, SLENDER_FINGER, SEIZURE, HIP_DISLOCATION
+
+
+class TestCohortTermCounter:
+
+    @pytest.fixture
+    def ontology_index(self, hpo: hpotk.Ontology) -> OntologyIndex:
+        return OntologyIndex.for_ontology(hpo)
+
+    @pytest.fixture
+    def matrix(self) -> CohortMatrix:
+        return CohortMatrix.from_phenopackets([
+            # Arachnodactyly and Slender finger share most of the ancestors
+            make_phenopacket("A", observed=[ARACHNODACTYLY, SLENDER_FINGER]),
+            make_phenopacket("B", observed=[ARACHNODACTYLY, SEIZURE], excluded=[HIP_DISLOCATION]),
+            make_phenopacket("C", observed=[HIP_DISLOCATION]),
+        ])
+
+    def test_counts_agree_with_ancestor_sets(self, matrix: CohortMatrix, ontology_index: OntologyIndex):
+        focus_mask = np.array([True, False, False])
+        counts = PropagatedTermCounter(matrix, ontology_index).count(focus_mask=focus_mask)
+
+        assert counts.loc["HP:0001166", "focus"] == 1
+        assert counts.loc["HP:0001166", "other"] == 1
+        assert counts.loc["HP:0001166", "total"] == 2
+
+        # Slender finger is annotated once but is an ancestor of Arachnodactyly in A and B
+        assert counts.loc["HP:0001238", "total"] == 1
+        assert counts.loc["HP:0001238", "total_propagated"] == 2
+        assert counts.loc["HP:0001238", "focus_propagated"] == 1
+
+        expected = {}
+        for observed in (["HP:0001166", "HP:0001238"], ["HP:0001166", "HP:0001250"], ["HP:0002827"]):
+            ancestors = set()
+            for hpo_id in observed:
+                ancestors.update(ontology_index.get_ancestors(hpo_id, include_source=True))
+            for hpo_id in ancestors - {"HP:0000001", "HP:0000118"}:
+                expected[hpo_id] = expected.get(hpo_id, 0) + 1
+        propagated = counts["total_propagated"]
+        assert propagated[propagated > 0].to_dict() == expected
+
+    def test_root_id(self, matrix: CohortMatrix, ontology_index: OntologyIndex):
+        # Only count terms below Abnormality of the nervous system
+        counts = PropagatedTermCounter(matrix, ontology_index, root_id="HP:0000707").count()
+        assert counts["total"].sum() == 1
+        assert counts.loc["HP:0001250", "total"] == 1
+
+    def test_wrong_focus_mask_raises(self, matrix: CohortMatrix, ontology_index: OntologyIndex):
+        with pytest.raises(ValueError):
+            PropagatedTermCounter(matrix, ontology_index).count(focus_mask=np.array([True]))
@@ -103,3 +103,17 @@ class TestCohortValidator:
         assert len(errors) == 1
         error = errors[0]
         assert error.message == "Individual had 0 disease annotation(s) but the mininum required count is 1"
+
+    def test_parallel_validation(self, hpo: hpotk.Ontology, ind_a: Individual, ind_b: Individual):
+        cohort = [ind_a, ind_b]
+        cvalidator = CohortValidator(cohort=cohort, ontology=hpo, min_hpo=1, n_workers=2)
+        validated_individuals = cvalidator.get_validated_individual_list()
+        assert len(validated_individuals) == 2
+
+        vindividualA, vindividualB = validated_individuals
+        assert vindividualA.get_individual_with_clean_terms() is ind_a
+        assert vindividualB.get_individual_with_clean_terms() is ind_b
+        assert vindividualA.has_error()
+        assert not vindividualB.has_error()
+        # the duplicate term was removed from the original Individual object
+        assert len(ind_a.hpo_terms) == 2
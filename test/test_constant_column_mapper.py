@@ -1,4 +1,8 @@
+import math
 import unittest
+
+import pandas as pd
+
 from pyphetools.creation import ConstantColumnMapper
 
 
@@ -27,3 +31,10 @@ class TestConstantMapper(unittest.TestCase):
         self.assertEqual(hp_label, result.label)
         self.assertFalse(result.observed)
         self.assertTrue(result.excluded)
+
+    def test_map_column_skips_empty_cells(self):
+        mapper = ConstantColumnMapper(column_name="placeholder", hpo_id="HP:0031956",
+                                      hpo_label="Elevated circulating aspartate aminotransferase concentration")
+        terms = mapper.map_column(pd.Series([math.nan, "x"]))
+        self.assertEqual([], terms[0])
+        self.assertEqual(["HP:0031956"], [t.id for t in terms[1]])
@@ -0,0 +1,131 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from pyphetools.creation import Discombobulator, HpoExactConceptRecognizer
+from pyphetools.creation.hpo_base_cr import ConceptMatch
+from pyphetools.creation.simple_column_mapper import get_separate_hpos_from_df
+
+
+class TestHpoBaseConceptRecognizer(unittest.TestCase):
+    """
+    Tests of the code that HpoBaseConceptRecognizer shares with all concept recognizers, using the exact recognizer
+    with a handful of labels, so that the tests do not need the HPO.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        label_to_id = {
+            "pica": "HP:0011856",
+            "ataxia": "HP:0001251",
+            "cerebellar ataxia": "HP:0001251",
+            "short philtrum": "HP:0000322",
+            "seizure": "HP:0001250",
+        }
+        id_to_primary_label = {
+            "HP:0011856": "Pica",
+            "HP:0001251": "Ataxia",
+            "HP:0000322": "Short philtrum",
+            "HP:0001250": "Seizure",
+        }
+        cls.hpo_cr = HpoExactConceptRecognizer(label_to_id=label_to_id, id_to_primary_label=id_to_primary_label)
+
+    def test_parse_cells_agrees_with_parse_cell(self):
+        custom_d = {"eats dirt": "Pica"}
+        cells = ["eats dirt; ataxia", "Cerebellar ataxia, short philtrum", "Typical presentation",
+                 "short philtrum; ataxia", "eats dirt; ataxia"]
+        expected = [self.hpo_cr.parse_cell(cell_contents=cell, custom_d=custom_d) for cell in cells]
+        for max_workers in (None, 4):
+            results = self.hpo_cr.parse_cells(cells, custom_d=custom_d, max_workers=max_workers)
+            self.assertEqual([set(r) for r in expected], [set(r) for r in results])
+
+    def test_parse_cells_does_not_share_terms(self):
+        results = self.hpo_cr.parse_cells(["ataxia", "ataxia"])
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0][0], results[1][0])
+
+    def test_parse_cells_matches_each_chunk_once(self):
+        cells = ["ataxia, pica", "pica; ataxia", "ataxia / seizure", "pica"]
+        with mock.patch.object(self.hpo_cr, "_find_hpo_term_in_lc_chunk",
+                               wraps=self.hpo_cr._find_hpo_term_in_lc_chunk) as find_terms:
+            results = self.hpo_cr.parse_cells(cells)
+        # the distinct chunks are "ataxia", "pica" and "seizure"
+        self.assertEqual(3, find_terms.call_count)
+        self.assertEqual([{"HP:0001251", "HP:0011856"}, {"HP:0001251", "HP:0011856"}, {"HP:0001251", "HP:0001250"},
+                          {"HP:0011856"}], [{t.id for t in r} for r in results])
+
+    def test_get_separate_hpos_from_df(self):
+        df = pd.DataFrame({"a": ["ataxia", "pica", "nothing"], "b": ["pica", "pica", "short philtrum"]})
+        results = get_separate_hpos_from_df(df, self.hpo_cr)
+        self.assertEqual([{"HP:0001251", "HP:0011856"}, {"HP:0011856"}, {"HP:0000322"}],
+                         [{t.id for t in r} for r in results])
+
+    def test_discombobulator_decode(self):
+        df = pd.DataFrame({"id": ["P1", "P2", "P3"], "findings": ["ataxia, pica", "short philtrum", "na"]})
+        dc = Discombobulator(df=df, individual_id="id", hpo_cr=self.hpo_cr)
+        df_out = dc.decode(column="findings", assumeExcluded=True)
+        # the first row has the HPO ids of the columns
+        self.assertEqual(["HP:0001251", "observed", "excluded", "na"], list(df_out["Ataxia"]))
+        self.assertEqual(["HP:0011856", "observed", "excluded", "na"], list(df_out["Pica"]))
+        self.assertEqual(["HP:0000322", "excluded", "observed", "na"], list(df_out["Short philtrum"]))
+        self.assertEqual(["Individual", "P1", "P2", "P3"], list(df_out["original individual id"]))
+
+    def test_custom_d_within_words(self):
+        # as with str.find, keys of the custom dictionary also match within words
+        results = self.hpo_cr.parse_cell(cell_contents="noataxia", custom_d={"ATAXIA": "Ataxia"})
+        self.assertEqual(["HP:0001251"], [r.id for r in results])
+
+    def test_custom_matcher_is_reused_until_custom_d_changes(self):
+        custom_d = {"eats dirt": "Pica"}
+        matcher = self.hpo_cr._get_custom_matcher(custom_d)
+        self.assertIs(matcher, self.hpo_cr._get_custom_matcher(custom_d))
+        custom_d["unsteady"] = "Ataxia"
+        self.assertIsNot(matcher, self.hpo_cr._get_custom_matcher(custom_d))
+        results = self.hpo_cr.parse_cell(cell_contents="unsteady", custom_d=custom_d)
+        self.assertEqual(["HP:0001251"], [r.id for r in results])
+
+    def test_custom_matcher_keys_that_differ_in_case(self):
+        # both keys match, in the order of the dictionary
+        matcher = self.hpo_cr._get_custom_matcher({"Eats dirt": "Pica", "eats DIRT": "Ataxia"})
+        hits = matcher.find_matches("he eats dirt")
+        self.assertEqual([(3, 11, "HP:0011856"), (3, 11, "HP:0001251")], [(h.start, h.end, h.tid) for h in hits])
+
+    def test_custom_matcher_list_valued_entry(self):
+        matcher = self.hpo_cr._get_custom_matcher({"fits": "Seizure", "cerebellar signs": ["Ataxia", "Pica"]})
+        hits = matcher.find_matches("fits and cerebellar signs")
+        self.assertEqual([(0, 3, "HP:0001250"), (9, 24, "HP:0001251"), (9, 24, "HP:0011856")],
+                         [(h.start, h.end, h.tid) for h in hits])
+        # each match gets its own HpTerm
+        self.assertIsNot(hits[1].term, matcher.find_matches("cerebellar signs")[0].term)
+
+    def select(self, spans):
+        """
+        :param spans: (start, end, name) tuples; the names stand in for the HpTerm objects
+        :returns: the names of the selected matches
+        """
+        hits = [ConceptMatch(term=name, start=start, end=end) for start, end, name in spans]
+        return self.hpo_cr._get_non_overlapping_matches(hits=hits)
+
+    def test_non_overlapping_matches_longest_first_in_text_order(self):
+        spans = [(20, 25, "late"), (0, 16, "cerebellar ataxia"), (11, 16, "ataxia"), (12, 14, "tax")]
+        self.assertEqual(["cerebellar ataxia", "late"], self.select(spans))
+
+    def test_non_overlapping_matches_equal_length_ties(self):
+        # hits of the same length are considered in the order of the input
+        self.assertEqual(["first"], self.select([(0, 3, "first"), (2, 5, "second")]))
+        self.assertEqual(["second"], self.select([(2, 5, "second"), (0, 3, "first")]))
+
+    def test_non_overlapping_matches_touching_hits(self):
+        # the intervals are closed: a hit that starts at the end, or ends at the start, of a chosen hit overlaps it
+        spans = [(5, 10, "chosen"), (10, 12, "starts at end"), (2, 5, "ends at start"),
+                 (11, 13, "after"), (1, 4, "before")]
+        self.assertEqual(["before", "chosen", "after"], self.select(spans))
+
+    def test_non_overlapping_matches_zero_length_hit(self):
+        # an empty custom_d key matches at (0, -1), which overlaps a chosen hit that covers position 0
+        self.assertEqual(["empty", "word"], self.select([(0, -1, "empty"), (3, 6, "word")]))
+        self.assertEqual(["word"], self.select([(0, -1, "empty"), (0, 6, "word")]))
+
+    def test_non_overlapping_matches_no_hits(self):
+        self.assertEqual([], self.select([]))
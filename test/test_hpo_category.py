@@ -1,9 +1,14 @@
+import gc
 import unittest
 import os
+import tempfile
+import weakref
 from pyphetools.visualization import HpoCategorySet
 
 from hpotk.ontology.load.obographs import load_ontology
 
+from ontology_factory import write_ontology, write_unversioned_ontology
+
 HP_JSON_FILENAME = os.path.join(os.path.dirname(__file__), 'data', 'hp.json')
 
 
@@ -30,3 +35,49 @@ class TestHpoCategorySet(unittest.TestCase):
         expected = "nervous_system"
         self.assertEqual(expected, cat)
 
+
+    def test_get_categories(self):
+        # Ataxia, Abnormality of the nervous system, and an id that is not in the ontology
+        cats = self._category_set.get_categories(["HP:0001251", "HP:0000707", "HP:9999999"])
+        self.assertEqual(["nervous_system", "nervous_system", "not_found"], cats)
+
+    def test_get_all_categories(self):
+        cats = self._category_set.get_categories(["HP:0001251", "HP:9999999"], all_categories=True)
+        self.assertIn("nervous_system", cats[0])
+        self.assertEqual([], cats[1])
+
+    def test_category_set_is_shared(self):
+        category_set = HpoCategorySet.for_ontology(self._hpo_ontology)
+        self.assertIs(category_set, HpoCategorySet.for_ontology(self._hpo_ontology))
+
+
+class TestSharedHpoCategorySet(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._fpath = write_unversioned_ontology(os.path.join(self._tmp_dir.name, 'hp.json'))
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def test_unversioned_ontologies_get_their_own_category_set(self):
+        ontology = load_ontology(self._fpath)
+        category_set = HpoCategorySet.for_ontology(ontology)
+        self.assertIs(category_set, HpoCategorySet.for_ontology(ontology))
+        self.assertIsNot(category_set, HpoCategorySet.for_ontology(load_ontology(self._fpath)))
+
+    def test_shared_category_sets_are_bounded(self):
+        for _ in range(HpoCategorySet.MAX_SHARED + 2):
+            HpoCategorySet.for_ontology(load_ontology(self._fpath))
+        self.assertEqual(HpoCategorySet.MAX_SHARED, len(HpoCategorySet._shared))
+        self.assertEqual(HpoCategorySet.MAX_SHARED, len(HpoCategorySet._tables))
+
+    def test_shared_category_sets_do_not_keep_the_ontology_alive(self):
+        fpath = write_ontology(os.path.join(self._tmp_dir.name, 'versioned.json'), version='2024-03-06')
+        ontology = load_ontology(fpath)
+        category_set = HpoCategorySet.for_ontology(ontology)
+        ontology_ref = weakref.ref(ontology)
+        del ontology
+        gc.collect()
+        self.assertIsNone(ontology_ref())
+        self.assertIs(category_set, HpoCategorySet.for_ontology(load_ontology(fpath)))
@@ -0,0 +1,62 @@
+import os
+
+import hpotk
+
+from pyphetools.creation import HpoLabelMapCache
+from pyphetools.creation.hpo_label_cache import get_ontology_fingerprint
+
+FINGERPRINT = bytes(range(20))
+
+
+class TestHpoLabelMapCache:
+
+    def test_round_trip(self, tmp_path):
+        cache = HpoLabelMapCache(cache_dir=str(tmp_path))
+        label_to_id = {"arachnodactyly": "HP:0001166", "spider fingers": "HP:0001166"}
+        id_to_label = {"HP:0001166": "Arachnodactyly"}
+        cache_path = cache.get_cache_path("2024-03-06")
+        cache._write(cache_path=cache_path, version="2024-03-06", fingerprint=FINGERPRINT, label_to_id=label_to_id, id_to_label=id_to_label)
+
+        maps = cache._read(cache_path=cache_path, version="2024-03-06", fingerprint=FINGERPRINT)
+
+        assert maps == (label_to_id, id_to_label)
+
+    def test_stale_version_is_not_read(self, tmp_path):
+        cache = HpoLabelMapCache(cache_dir=str(tmp_path))
+        cache_path = cache.get_cache_path("2024-03-06")
+        cache._write(cache_path=cache_path, version="2024-03-06", fingerprint=FINGERPRINT, label_to_id={}, id_to_label={})
+
+        assert cache._read(cache_path=cache_path, version="2024-03-06", fingerprint=FINGERPRINT) == ({}, {})
+        assert cache._read(cache_path=cache_path, version="2024-04-26", fingerprint=FINGERPRINT) is None
+
+    def test_stale_fingerprint_is_not_read(self, tmp_path):
+        # e.g., an edited hp.json file that still has the version of the release it was derived from
+        cache = HpoLabelMapCache(cache_dir=str(tmp_path))
+        cache_path = cache.get_cache_path("2024-03-06")
+        cache._write(cache_path=cache_path, version="2024-03-06", fingerprint=FINGERPRINT, label_to_id={},
+                     id_to_label={})
+
+        assert cache._read(cache_path=cache_path, version="2024-03-06", fingerprint=bytes(20)) is None
+
+    def test_get_maps(self, tmp_path, hpo: hpotk.Ontology):
+        cache = HpoLabelMapCache(cache_dir=str(tmp_path))
+        label_to_id, id_to_label = cache.get_maps(hpo)
+        assert os.path.isfile(cache.get_cache_path(hpo.version))
+
+        cached_label_to_id, cached_id_to_label = cache.get_maps(hpo)
+
+        assert cached_label_to_id == label_to_id
+        assert cached_id_to_label == id_to_label
+        assert label_to_id["arachnodactyly"] == "HP:0001166"
+
+    def test_get_maps_rebuilds_stale_cache(self, tmp_path, hpo: hpotk.Ontology):
+        cache = HpoLabelMapCache(cache_dir=str(tmp_path))
+        cache_path = cache.get_cache_path(hpo.version)
+        cache._write(cache_path=cache_path, version=hpo.version, fingerprint=bytes(20),
+                     label_to_id={"stale": "HP:0000001"}, id_to_label={"HP:0000001": "stale"})
+
+        label_to_id, _ = cache.get_maps(hpo)
+
+        assert "stale" not in label_to_id
+        assert cache._read(cache_path=cache_path, version=hpo.version,
+                           fingerprint=get_ontology_fingerprint(hpo)) is not None
@@ -1,7 +1,8 @@
 import hpotk
 import pytest
 
-from pyphetools.creation import Citation, Disease,Individual, HpTerm
+from pyphetools.creation import Citation, Disease,Individual, HpTerm, MetaData
+from pyphetools.pp.parse import PhenopacketArchiveReader
 from pyphetools.pp.v202 import VitalStatus, TimeElement, Age, OntologyClass
 
 
@@ -93,3 +94,20 @@ class TestIndividual:
         assert last_encounter.age_range is None 
         age = last_encounter.age
         assert age.iso8601duration == "P6M"
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_output_individuals_as_phenopacket_archive(self, tmp_path, ind_a: Individual, ind_b: Individual,
+                                                      compress: bool):
+        metadata = MetaData(created_by="ORCID:0000-0002-0736-9199", citation=Citation(pmid="PMID:1234", title="some title"))
+        fpath = str(tmp_path / "cohort.ppa")
+        Individual.output_individuals_as_phenopacket_archive([ind_a, ind_b], metadata=metadata, fpath=fpath,
+                                                             compress=compress)
+
+        expected = [ind.to_ga4gh_phenopacket(metadata=metadata) for ind in (ind_a, ind_b)]
+        with PhenopacketArchiveReader(fpath) as reader:
+            assert reader.ids() == [pp.id for pp in expected]
+            actual = [reader.get(pp.id) for pp in expected]
+        # the creation time stamp is set when the phenopacket is created
+        for pp in expected + actual:
+            pp.meta_data.ClearField("created")
+        assert actual == expected
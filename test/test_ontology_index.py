@@ -0,0 +1,78 @@
+import hpotk
+import pytest
+
+from pyphetools.creation import OntologyIndex
+
+from ontology_factory import write_ontology, write_unversioned_ontology
+
+
+class TestOntologyIndex:
+
+    @pytest.fixture
+    def ontology_index(self, hpo: hpotk.Ontology) -> OntologyIndex:
+        return OntologyIndex.for_ontology(hpo)
+
+    def test_index_is_shared(self, hpo: hpotk.Ontology, ontology_index: OntologyIndex):
+        assert OntologyIndex.for_ontology(hpo) is ontology_index
+
+    def test_is_ancestor_of(self, ontology_index: OntologyIndex):
+        # Slender finger is a parent of Arachnodactyly
+        assert ontology_index.is_ancestor_of("HP:0001238", "HP:0001166")
+        assert not ontology_index.is_ancestor_of("HP:0001166", "HP:0001238")
+        # a term is not its own ancestor
+        assert not ontology_index.is_ancestor_of("HP:0001166", "HP:0001166")
+        # Hip dislocation is unrelated to Arachnodactyly
+        assert not ontology_index.is_ancestor_of("HP:0002827", "HP:0001166")
+
+    def test_unknown_object_raises(self, ontology_index: OntologyIndex):
+        with pytest.raises(ValueError):
+            ontology_index.is_ancestor_of("HP:0001238", "HP:9999999")
+
+    @pytest.mark.parametrize("curie", ["HP:0001166", "HP:0001250", "HP:0000118"])
+    def test_agrees_with_hpotk(self, hpo: hpotk.Ontology, ontology_index: OntologyIndex, curie: str):
+        expected_ancestors = {t.value for t in hpo.graph.get_ancestors(curie, include_source=True)}
+        assert ontology_index.get_ancestors(curie, include_source=True) == expected_ancestors
+        expected_descendants = {t.value for t in hpo.graph.get_descendants(curie)}
+        assert ontology_index.get_descendants(curie) == expected_descendants
+
+    def test_ancestor_union(self, ontology_index: OntologyIndex):
+        idx_list = [ontology_index.get_idx("HP:0001166"), ontology_index.get_idx("HP:0002827")]
+        union = {ontology_index.get_term_id(i) for i in ontology_index.get_ancestor_union_idx(idx_list)}
+        assert union == ontology_index.get_ancestors("HP:0001166") | ontology_index.get_ancestors("HP:0002827")
+
+
+class TestSharedOntologyIndex:
+
+    @pytest.fixture
+    def fpath_ontology(self, tmp_path) -> str:
+        return write_unversioned_ontology(tmp_path / "hp.json")
+
+    def test_unversioned_ontologies_get_their_own_index(self, fpath_ontology: str):
+        ontology = hpotk.load_minimal_ontology(fpath_ontology)
+        assert ontology.version is None
+        index = OntologyIndex.for_ontology(ontology)
+        assert OntologyIndex.for_ontology(ontology) is index
+        other = hpotk.load_minimal_ontology(fpath_ontology)
+        assert OntologyIndex.for_ontology(other) is not index
+
+    def test_shared_indices_are_bounded(self, fpath_ontology: str):
+        ontologies = [hpotk.load_minimal_ontology(fpath_ontology) for _ in range(OntologyIndex.MAX_SHARED + 2)]
+        for ontology in ontologies:
+            OntologyIndex.for_ontology(ontology)
+        assert len(OntologyIndex._shared) == OntologyIndex.MAX_SHARED
+        # the cache keeps the ontologies alive, so the ids in the cache belong to the cached ontologies
+        for key, (owner, _) in OntologyIndex._shared.items():
+            assert owner is None or id(owner) == key[1]
+
+    def test_same_version_with_other_terms_gets_its_own_index(self, tmp_path):
+        # e.g., an hp.json file that was edited but kept the version of the release it was derived from
+        release = hpotk.load_minimal_ontology(write_ontology(tmp_path / "release.json", version="2024-03-06"))
+        edited = hpotk.load_minimal_ontology(write_ontology(tmp_path / "edited.json", version="2024-03-06",
+                                                            extra_terms=["0001166"]))
+        assert release.version == edited.version
+        index = OntologyIndex.for_ontology(release)
+        edited_index = OntologyIndex.for_ontology(edited)
+        assert edited_index is not index
+        assert "HP:0001166" in edited_index.get_ancestors("HP:0001166", include_source=True)
+        same_release = hpotk.load_minimal_ontology(write_ontology(tmp_path / "copy.json", version="2024-03-06"))
+        assert OntologyIndex.for_ontology(same_release) is index
@@ -1,8 +1,59 @@
+from collections import Counter
+from typing import List
+
 import hpotk
 import pytest
 
 from pyphetools.creation import HpTerm, Individual, PyPheToolsAge
 from pyphetools.validation import OntologyQC
+from pyphetools.validation.validation_result import ValidationResultBuilder
+
+from ontology_factory import write_ontology
+
+
+class AllPairsOntologyQC(OntologyQC):
+    """
+    Reference implementation with the all-pairs comparisons that OntologyQC used before the ancestor queries
+    were answered by an OntologyIndex.
+    """
+
+    def _fix_conflicts(self, observed_hpo_terms: List[HpTerm], excluded_hpo_terms) -> List[HpTerm]:
+        if len(excluded_hpo_terms) == 0:
+            return excluded_hpo_terms
+        all_excluded_term_ids = {term.id for term in excluded_hpo_terms}
+        conflicting_term_id_set = set()
+        for term in observed_hpo_terms:
+            for tid in all_excluded_term_ids:
+                if term.id == tid:
+                    error = ValidationResultBuilder(phenopacket_id=self._phenopacket_id).observed_and_excluded_term(term=term).build()
+                    self._errors.append(error)
+                elif self._ontology.graph.is_ancestor_of(tid, term.id):
+                    conflicting_term_id_set.add(tid)
+                    cterm = HpTerm.from_hpo_tk_term(self._ontology.get_term(term_id=tid))
+                    error = ValidationResultBuilder(phenopacket_id=self._phenopacket_id).conflict(term=term, conflicting_term=cterm).build()
+                    self._errors.append(error)
+        if len(conflicting_term_id_set) > 0:
+            excluded_hpo_terms = [term for term in excluded_hpo_terms if term.id not in conflicting_term_id_set]
+        return excluded_hpo_terms
+
+    def _fix_redundancies(self, hpo_terms: List[HpTerm]) -> List[HpTerm]:
+        all_terms = set(hpo_terms)
+        if len(all_terms) != len(hpo_terms):
+            duplicates = [item for item, count in Counter(hpo_terms).items() if count > 1]
+            for dup in duplicates:
+                error = ValidationResultBuilder(self._phenopacket_id).duplicate_term(redundant_term=dup).build()
+                self._errors.append(error)
+            hpo_terms = set(hpo_terms)
+        redundant_term_d = {}
+        for term in all_terms:
+            for term2 in all_terms:
+                if self._ontology.graph.is_ancestor_of(term2.id, term.id):
+                    redundant_term_d[term2] = term
+        non_redundant_terms = [term for term in hpo_terms if term not in redundant_term_d]
+        for term, descendant in redundant_term_d.items():
+            error = ValidationResultBuilder(self._phenopacket_id).redundant_term(ancestor_term=term, descendent_term=descendant).build()
+            self._errors.append(error)
+        return non_redundant_terms
 
 
 
@@ -133,3 +184,55 @@ class TestOntologyQC:
         qc_hpo_terms = qc.get_clean_terms()
 
         assert len(qc_hpo_terms) == 1
+
+
+class TestOntologyQCAgainstAllPairs:
+    """
+    The errors are reported in the iteration order of sets of HpTerm objects, which depends on the hash seed, so we
+    compare with the reference implementation run in the same process.
+    """
+
+    @pytest.fixture
+    def ontology(self, tmp_path) -> hpotk.Ontology:
+        # 0000118 > 0001250 > 0007359 > 0011153 > 0011157, 0001250 > 0020221, 0000118 > 0001238 > 0001166
+        extra_terms = {
+            "0007359": "0001250",
+            "0011153": "0007359",
+            "0011157": "0011153",
+            "0020221": "0001250",
+            "0001238": "0000118",
+            "0001166": "0001238",
+            "0002827": "0000118",
+        }
+        return hpotk.load_ontology(write_ontology(tmp_path / "hp.json", version="2024-03-06", extra_terms=extra_terms))
+
+    @staticmethod
+    def term(hpo_id: str, observed: bool = True, onset=None) -> HpTerm:
+        return HpTerm(hpo_id=f"HP:{hpo_id}", label=f"Term {hpo_id}", observed=observed, onset=onset)
+
+    def test_errors_agree_with_all_pairs(self, ontology: hpotk.Ontology):
+        onset = PyPheToolsAge.get_age_pp201("P1Y")
+        hpo_terms = [
+            # several redundant ancestors of the same term
+            self.term("0001250"), self.term("0007359"), self.term("0011153"), self.term("0011157"),
+            self.term("0020221"), self.term("0001238"), self.term("0001166"), self.term("0001166"),
+            self.term("0002827"),
+            # observed and excluded, excluded ancestors of observed terms
+            self.term("0002827", observed=False), self.term("0001238", observed=False),
+            self.term("0011153", observed=False), self.term("0000118", observed=False),
+            # terms with an onset, with redundancies and conflicts among them and with the terms without onset
+            self.term("0011157", onset=onset), self.term("0007359", onset=onset), self.term("0020221", onset=onset),
+            self.term("0001250", observed=False, onset=onset), self.term("0011153", observed=False, onset=onset),
+            self.term("0001166", observed=False, onset=onset), self.term("0020221", observed=False, onset=onset),
+        ]
+        individual = Individual(individual_id="id", hpo_terms=hpo_terms)
+
+        qc = OntologyQC(ontology=ontology, individual=individual)
+        expected = AllPairsOntologyQC(ontology=ontology, individual=individual)
+
+        actual_errors = [e.get_items_as_array() for e in qc.get_error_list()]
+        expected_errors = [e.get_items_as_array() for e in expected.get_error_list()]
+        assert len(actual_errors) > 5
+        assert {e.category for e in qc.get_error_list()} >= {"REDUNDANT", "CONFLICT", "OBSERVED_AND_EXCLUDED"}
+        assert actual_errors == expected_errors
+        assert qc.get_clean_terms() == expected.get_clean_terms()
@@ -0,0 +1,55 @@
+import os
+import shutil
+
+import pytest
+
+from pyphetools.visualization import PhenopacketIngestor
+
+
+class TestPhenopacketIngestor:
+
+    @pytest.fixture
+    def ppkt_dir(self, tmp_path, fpath_retinoblastoma_json: str) -> str:
+        """
+        Directory with one phenopacket at the top level and one phenopacket in a subdirectory
+        """
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        shutil.copy(fpath_retinoblastoma_json, tmp_path / "a.json")
+        shutil.copy(fpath_retinoblastoma_json, subdir / "b.json")
+        (tmp_path / "notes.txt").write_text("not a phenopacket")
+        return str(tmp_path)
+
+    def test_list_json_files(self, ppkt_dir: str):
+        assert PhenopacketIngestor.list_json_files(ppkt_dir) == [os.path.join(ppkt_dir, "a.json")]
+        assert PhenopacketIngestor.list_json_files(ppkt_dir, recursive=True) == [
+            os.path.join(ppkt_dir, "a.json"),
+            os.path.join(ppkt_dir, "subdir", "b.json"),
+        ]
+
+    def test_iter_phenopackets(self, ppkt_dir: str):
+        ppkts = list(PhenopacketIngestor.iter_phenopackets(indir=ppkt_dir, recursive=True))
+        assert len(ppkts) == 2
+        assert ppkts[0].id == "example.retinoblastoma.phenopacket.id"
+        assert ppkts[0].diseases[0].term.id == "NCIT:C7541"
+
+    def test_iter_phenopackets_with_disease_id(self, ppkt_dir: str):
+        assert len(list(PhenopacketIngestor.iter_phenopackets(indir=ppkt_dir, disease_id="NCIT:C7541"))) == 1
+        assert len(list(PhenopacketIngestor.iter_phenopackets(indir=ppkt_dir, disease_id="OMIM:123456"))) == 0
+
+    def test_recursive_constructor(self, ppkt_dir: str):
+        assert len(PhenopacketIngestor(indir=ppkt_dir).get_phenopacket_list()) == 1
+        # both files have the same phenopacket id, and the phenopacket dictionary is keyed by id
+        assert len(PhenopacketIngestor(indir=ppkt_dir, recursive=True)._phenopackets) == 2
+
+    def test_load_parallel(self, ppkt_dir: str):
+        ppkts = PhenopacketIngestor.load_parallel(indir=ppkt_dir, recursive=True, n_workers=2)
+        expected = list(PhenopacketIngestor.iter_phenopackets(indir=ppkt_dir, recursive=True))
+        assert ppkts == expected
+
+    def test_load_parallel_as_v202(self, ppkt_dir: str):
+        ppkts = PhenopacketIngestor.load_parallel(indir=ppkt_dir, n_workers=2, as_v202=True,
+                                                  disease_id="NCIT:C7541")
+        assert len(ppkts) == 1
+        assert ppkts[0].id == "example.retinoblastoma.phenopacket.id"
+        assert ppkts[0].diseases[0].term.id == "NCIT:C7541"
@@ -0,0 +1,20 @@
+import unittest
+
+import pandas as pd
+
+from pyphetools.creation import SexColumnMapper
+
+
+class TestSexColumnMapper(unittest.TestCase):
+
+    def test_map_column(self):
+        mapper = SexColumnMapper(male_symbol="M", female_symbol="F", column_name="sex")
+        column = pd.Series(["M", "F", " M", "?", "?"])
+        self.assertEqual(["MALE", "FEMALE", "MALE", "UNKNOWN", "UNKNOWN"], mapper.map_column(column))
+        self.assertEqual([mapper.map_cell(cell) for cell in ["M", "F", " M"]], mapper.map_column(column)[:3])
+
+    def test_map_column_counts_errors_per_cell(self):
+        mapper = SexColumnMapper(male_symbol="M", female_symbol="F", column_name="sex")
+        mapper.map_column(pd.Series(["M", "?", "?"]))
+        self.assertTrue(mapper.has_error())
+        self.assertEqual("Could not parse the following as sex descriptors: ? (n=2)", mapper.error_summary())
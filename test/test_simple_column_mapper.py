@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from pyphetools.creation import SimpleColumnMapper
+
+
+class TestSimpleColumnMapper(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._mapper = SimpleColumnMapper(column_name="seizure", hpo_id="HP:0001250", hpo_label="Seizure",
+                                          observed={"+"}, excluded={"-"})
+
+    def test_map_column_agrees_with_map_cell(self):
+        cells = ["+", "-", "+", "?"]
+        expected = [self._mapper.map_cell(cell) for cell in cells]
+        self.assertEqual(expected, self._mapper.map_column(pd.Series(cells)))
+
+    def test_map_column_does_not_share_terms(self):
+        # HpTerm objects are mutable, so two individuals must not get the same instance
+        terms = self._mapper.map_column(pd.Series(["+", "+"]))
+        self.assertEqual(terms[0], terms[1])
+        self.assertIsNot(terms[0][0], terms[1][0])
+
+    def test_map_column_maps_each_distinct_value_once(self):
+        cells = pd.Series([str(i % 20) for i in range(10_000)])
+        with mock.patch.object(self._mapper, "map_cell", wraps=self._mapper.map_cell) as map_cell:
+            self._mapper.map_column(cells)
+            self._mapper.map_column(cells)
+        self.assertEqual(20, map_cell.call_count)
+        info = self._mapper.cache_info()
+        self.assertEqual(20, info.misses)
+        self.assertEqual(20, info.hits)
+        self.assertEqual(20, info.currsize)
+
+    def test_map_cell_cached_returns_copies(self):
+        first = self._mapper.map_cell_cached("+")
+        first[0].excluded()
+        second = self._mapper.map_cell_cached("+")
+        self.assertTrue(second[0].observed)
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(1, self._mapper.cache_info().hits)
+
+    def test_cache_is_bounded(self):
+        mapper = SimpleColumnMapper(column_name="seizure", hpo_id="HP:0001250", hpo_label="Seizure",
+                                    observed={"+"}, excluded={"-"}, cache_size=2)
+        for cell in ["+", "-", "?", "+"]:
+            mapper.map_cell_cached(cell)
+        info = mapper.cache_info()
+        self.assertEqual(2, info.currsize)
+        self.assertEqual(4, info.misses)
+        mapper.cache_clear()
+        self.assertEqual((0, 0, 2, 0), tuple(mapper.cache_info()))
+
+    def test_map_column_distinguishes_equal_values_of_different_types(self):
+        # 1, True and 1.0 compare equal, and None is not an empty cell, so each must be passed on to map_cell
+        cells = pd.Series([1, True, 1.0, None, 1, float("nan")], dtype=object)
+        with mock.patch.object(self._mapper, "map_cell", side_effect=lambda cell: [repr(cell)]) as map_cell:
+            mapped = self._mapper.map_column(cells)
+            self.assertEqual([mock.call(1), mock.call(True), mock.call(1.0), mock.call(None)], map_cell.call_args_list)
+            self.assertEqual(["True"], self._mapper.map_cell_cached(True))
+        self.assertEqual([["1"], ["True"], ["1.0"], ["None"], ["1"], []], mapped)
@@ -0,0 +1,77 @@
+import pickle
+import threading
+
+import pandas as pd
+
+from pyphetools.creation import HgvsVariant, VariantCache, VariantManager
+
+TRANSCRIPT = "NM_015133.4"
+
+
+def make_variant(pos: int) -> HgvsVariant:
+    return HgvsVariant(assembly="hg38", vcf_d={"chr": "chr16", "pos": str(pos), "ref": "C", "alt": "G"},
+                       symbol="MAPK8IP3", hgnc="HGNC:6884", transcript=TRANSCRIPT)
+
+
+class TestVariantCache:
+
+    def test_round_trip(self, tmp_path):
+        cache = VariantCache(path=str(tmp_path / "cache.sqlite"))
+        cache.put_many(assembly="hg38", transcript=TRANSCRIPT, variant_d={"c.111C>G": make_variant(1706450)})
+
+        assert cache.get(assembly="hg38", transcript=TRANSCRIPT, hgvs="c.111C>G").position == 1706450
+        # the assembly and the transcript are part of the key
+        assert cache.get(assembly="hg19", transcript=TRANSCRIPT, hgvs="c.111C>G") is None
+        assert cache.get(assembly="hg38", transcript="NM_000342.3", hgvs="c.111C>G") is None
+
+        variant_d = cache.get_many(assembly="hg38", transcript=TRANSCRIPT, hgvs_list=["c.111C>G", "c.222del"])
+        assert list(variant_d) == ["c.111C>G"]
+
+    def test_cache_is_shared_by_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        VariantCache(path=path).put_many(assembly="hg38", transcript=TRANSCRIPT,
+                                         variant_d={"c.111C>G": make_variant(1706450)})
+
+        assert len(VariantCache(path=path)) == 1
+
+    def test_concurrent_writers(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+
+        def write(start: int):
+            cache = VariantCache(path=path)
+            for pos in range(start, start + 20):
+                cache.put_many(assembly="hg38", transcript=TRANSCRIPT, variant_d={f"c.{pos}C>G": make_variant(pos)})
+
+        threads = [threading.Thread(target=write, args=(start,)) for start in range(0, 100, 20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(VariantCache(path=path)) == 100
+
+    def test_import_pickle(self, tmp_path):
+        pickle_path = tmp_path / "variant_validator_cache_MAPK8IP3.pickle"
+        with open(pickle_path, "wb") as f:
+            pickle.dump({"c.111C>G": make_variant(1706450), "c.222del": make_variant(1706561)}, f)
+        cache = VariantCache(path=str(tmp_path / "cache.sqlite"))
+
+        assert cache.import_pickle(pickle_path=str(pickle_path), assembly="hg38", transcript=TRANSCRIPT) == 2
+        # an unchanged file is not imported again
+        assert cache.import_pickle(pickle_path=str(pickle_path), assembly="hg38", transcript=TRANSCRIPT) == 0
+        assert cache.get(assembly="hg38", transcript=TRANSCRIPT, hgvs="c.222del").position == 1706561
+
+    def test_variant_manager_uses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cache_path = str(tmp_path / "cache.sqlite")
+        VariantCache(path=cache_path).put_many(assembly="hg38", transcript=TRANSCRIPT,
+                                               variant_d={"c.111C>G": make_variant(1706450)})
+        df = pd.DataFrame({"individual": ["A", "B"], "allele_1": ["c.111C>G", "c.111C>G"]})
+
+        # All variants are cached, so Variant Validator (here, an unreachable URL) is not queried
+        vmanager = VariantManager(df=df, individual_column_name="individual", transcript=TRANSCRIPT,
+                                  gene_symbol="MAPK8IP3", allele_1_column_name="allele_1",
+                                  variant_validator_url="http://127.0.0.1:9", cache_path=cache_path)
+
+        assert not vmanager.has_unmapped_alleles()
+        assert vmanager.get_mapped_allele_count() == 1
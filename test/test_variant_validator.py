@@ -0,0 +1,91 @@
+import http.server
+import json
+import threading
+import urllib.parse
+
+import pytest
+
+from pyphetools.creation import VariantValidator
+
+TRANSCRIPT = "NM_015133.4"
+
+# A recorded Variant Validator response, shortened to the elements we use
+RESPONSES = {
+    "c.111C>G": {
+        "flag": "gene_variant",
+        "NM_015133.4:c.111C>G": {
+            "gene_ids": {"hgnc_id": "HGNC:6884"},
+            "gene_symbol": "MAPK8IP3",
+            "hgvs_transcript_variant": "NM_015133.4:c.111C>G",
+            "primary_assembly_loci": {
+                "hg38": {
+                    "hgvs_genomic_description": "NC_000016.10:g.1706450C>G",
+                    "vcf": {"alt": "G", "chr": "chr16", "pos": "1706450", "ref": "C"},
+                },
+            },
+            "reference_sequence_records": {"transcript": "https://www.ncbi.nlm.nih.gov/nuccore/NM_015133.4"},
+        },
+        "metadata": {},
+    },
+    "c.222del": {
+        "flag": "warning",
+        "metadata": {},
+    },
+}
+
+
+class RecordedVariantValidatorHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serve the recorded responses. The first request for each variant fails with 503 to exercise the retries.
+    """
+    seen = set()
+
+    def do_GET(self):
+        # the path ends with /hg38/NM_015133.4%3Ac.111C%3EG/NM_015133.4
+        hgvs = urllib.parse.unquote(self.path.split("?")[0].split("/")[-2]).split(":")[1]
+        if hgvs not in RecordedVariantValidatorHandler.seen:
+            RecordedVariantValidatorHandler.seen.add(hgvs)
+            self.send_response(503)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(RESPONSES[hgvs]).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestVariantValidator:
+
+    @pytest.fixture
+    def base_url(self) -> str:
+        RecordedVariantValidatorHandler.seen.clear()
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RecordedVariantValidatorHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def validator(self, base_url: str) -> VariantValidator:
+        return VariantValidator(genome_build="hg38", transcript=TRANSCRIPT, base_url=base_url, backoff_factor=0)
+
+    def test_encode_hgvs(self, validator: VariantValidator):
+        var = validator.encode_hgvs("c.111C>G")
+        assert var.chr == "chr16"
+        assert var.position == 1706450
+        assert var.ref == "C"
+        assert var.alt == "G"
+
+    def test_encode_hgvs_batch(self, validator: VariantValidator):
+        variants, errors = validator.encode_hgvs_batch(["c.111C>G", "c.222del", "c.111C>G"])
+        assert list(variants) == ["c.111C>G"]
+        assert variants["c.111C>G"].position == 1706450
+        assert list(errors) == ["c.222del"]
+        assert isinstance(errors["c.222del"], ValueError)
+
+    def test_encode_hgvs_batch_without_variants(self, validator: VariantValidator):
+        assert validator.encode_hgvs_batch([]) == ({}, {})